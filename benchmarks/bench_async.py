@@ -0,0 +1,44 @@
+# benchmarks/bench_async.py
+# Wall-clock time for many MAGIC_WORKSHOP calls that each wait on simulated
+# I/O, run one after another by execute() and concurrently by execute_async().
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_runtime import SantaRuntime  # noqa: E402
+
+
+def magic_program(count, wait):
+    program = [('magic_workshop', 'fetch', [('MERRY', 'id')], [
+        ('await', ('function_call', 'SNOOZE', [wait])),
+        ('deliver', ('value', 'id')),
+    ])]
+    for i in range(count):
+        program.append(('declare', f'gift{i}', 'SNOWFLAKE'))
+        program.append(('assign', f'gift{i}', ('function_call', 'fetch', [i])))
+    program.append(('deliver', ('value', f'gift{count - 1}')))
+    return program
+
+
+def main(count=500, wait=0.01):
+    program = magic_program(count, wait)
+
+    runtime = SantaRuntime()
+    start = time.perf_counter()
+    runtime.execute(program)
+    elapsed = time.perf_counter() - start
+    runtime.cleanup()
+    print(f"execute:       {count} workshops waiting {wait}s each in {elapsed:.2f} s")
+
+    runtime = SantaRuntime()
+    start = time.perf_counter()
+    asyncio.run(runtime.execute_async(program))
+    elapsed = time.perf_counter() - start
+    print(f"execute_async: {count} workshops waiting {wait}s each in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_budget.py
+# A tight loop with and without an execution budget on both backends, and
+# how long a runaway loop keeps going past a 0.2 s timeout.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_budget import Budget, BudgetExceeded  # noqa: E402
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+from santa_vm import SantaVM  # noqa: E402
+
+LOOP = '''
+WRAP total AS MERRY
+total AS 0
+AROUND_THE_CHRISTMAS_TREE {count} DO
+    total AS total GIVE 3
+UNTIL_CHRISTMAS
+DELIVER total
+'''
+
+RUNAWAY = '''
+WRAP total AS MERRY
+total AS 0
+WHILE_CHRISTMAS_SPIRIT HO DO
+    total AS total GIVE 1
+STILL_BELIEVING
+'''
+
+BACKENDS = {'runtime': SantaRuntime, 'vm': SantaVM}
+
+
+def timed(runtime, ast):
+    start = time.perf_counter()
+    try:
+        runtime.execute(ast)
+    except BudgetExceeded:
+        pass
+    return time.perf_counter() - start
+
+
+def main(count=500_000, timeout=0.2):
+    loop = parse(LOOP.format(count=count))
+    for name, runtime_class in BACKENDS.items():
+        plain = timed(runtime_class(), loop)
+        budgeted = timed(runtime_class(budget=Budget(max_steps=count * 10, timeout=60.0)), loop)
+        print(f"{name + ', no budget':<24} {plain * 1000:8.1f} ms")
+        print(f"{name + ', budget':<24} {budgeted * 1000:8.1f} ms  ({budgeted / plain:.2f}x)")
+
+    runaway = parse(RUNAWAY)
+    for name, runtime_class in BACKENDS.items():
+        elapsed = timed(runtime_class(budget=Budget(timeout=timeout)), runaway)
+        print(f"{name + ', runaway stopped':<24} {elapsed * 1000:8.1f} ms  (timeout {timeout * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
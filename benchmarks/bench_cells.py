@@ -0,0 +1,57 @@
+# benchmarks/bench_cells.py
+# Memory per declared variable and time per FOR_EACH_CHILD binding, comparing
+# the legacy per-variable dicts with santa_cells.Cell.
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_cells import Cell  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+
+
+def bytes_per_item(make, count):
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    items = [make(i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del items
+    # Subtract the list holding the items and the int payloads
+    return used / count - 8 - 28
+
+
+def declared_program(count):
+    program = []
+    for i in range(count):
+        program.append(('declare_typed_array', f'gift{i}', 'MERRY'))
+        program.append(('assign', f'gift{i}', ('array', [('value', i)])))
+    return program
+
+
+def main(count=100_000):
+    legacy = bytes_per_item(lambda i: {'type': 'GIFT<MERRY>', 'value': i, 'element_type': 'MERRY'}, count)
+    cell = bytes_per_item(lambda i: Cell('GIFT<MERRY>', i), count)
+    print(f"Per variable: legacy dict {legacy:6.0f} B, Cell {cell:6.0f} B")
+
+    runtime = SantaRuntime()
+    program = declared_program(count)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    runtime.execute(program)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    print(f"{count} declared GIFT<MERRY> variables: {used / 1e6:.1f} MB ({used / count:.0f} B each, incl. values)")
+
+    loop = [('foreach', 'IN', ('value', 'children'), [])]
+    runtime.variables['children'] = Cell('GIFT', list(range(count * 10)))
+    start = time.perf_counter()
+    runtime.execute(loop)
+    elapsed = time.perf_counter() - start
+    print(f"FOR_EACH_CHILD over {count * 10} children: {elapsed / (count * 10) * 1e9:.0f} ns per iteration")
+
+
+if __name__ == "__main__":
+    main()
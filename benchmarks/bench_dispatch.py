@@ -0,0 +1,132 @@
+# benchmarks/bench_dispatch.py
+# Per-operation cost of the operator, method-handler and type-check tables.
+# The legacy_* functions rebuild their tables on every call, the way the
+# runtime used to; the current_* ones use the hoisted registries.
+import os
+import sys
+import timeit
+import tracemalloc
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_runtime import SantaRuntime  # noqa: E402
+
+DELIVER_AST = [('deliver', ('arithmetic', 'MULTIPLY_JOY', ('value', 5), ('value', 10)))]
+
+
+def legacy_arithmetic(op, left, right):
+    operators = {
+        'GIVE': lambda x, y: x + y,
+        'TAKE': lambda x, y: x - y,
+        'MULTIPLY_JOY': lambda x, y: x * y,
+        'SHARE': lambda x, y: x / y if y != 0 else float('inf'),
+        'LEFTOVER_MAGIC': lambda x, y: x % y if y != 0 else float('inf'),
+        'POWER_OF_BELIEF': lambda x, y: x ** y,
+        'FLOOR_CHIMNEY': lambda x, y: x // y if y != 0 else float('inf'),
+        'ROUND_PRESENTS': lambda x, y: round(x, int(y)),
+        'MIN_GIFT': lambda x, y: min(x, y),
+        'MAX_GIFT': lambda x, y: max(x, y)
+    }
+    return operators[op](left, right)
+
+
+def legacy_type_check(value, expected_type):
+    type_checks = {
+        'MERRY': lambda x: isinstance(x, (int, float)),
+        'JINGLE': lambda x: isinstance(x, bool),
+        'SPARKLE': lambda x: isinstance(x, float),
+        'TINSEL': lambda x: isinstance(x, str),
+        'GIFT': lambda x: isinstance(x, (list, str, dict)),
+        'SLEIGH': lambda x: isinstance(x, dict),
+        'STOCKING': lambda x: isinstance(x, (list, deque)),
+        'SPIRIT': lambda x: isinstance(x, (int, float)) and 0 <= x <= 100,
+        'SNOWFLAKE': lambda x: True
+    }
+    checker = type_checks.get(expected_type)
+    return checker(value) if checker else True
+
+
+def legacy_method_call(obj, method_name):
+    method_handlers = {
+        'TINSEL': {
+            'SPARKLE': lambda s, *_: {'type': 'TINSEL', 'value': f'✨{s}✨'},
+            'WRAP_TEXT': lambda s, *_: {'type': 'TINSEL', 'value': s.title()},
+            'UNTANGLE': lambda s, *_: {'type': 'TINSEL', 'value': s.strip()},
+            'COUNT_JOYS': lambda s, *_: len(s),
+            'TRIM_TREE': lambda s, *_: {'type': 'TINSEL', 'value': s.strip()},
+            'JINGLE_CASE': lambda s, *_: {'type': 'TINSEL', 'value': s.upper()},
+            'SILENT_NIGHT': lambda s, *_: {'type': 'TINSEL', 'value': s.lower()},
+            'GIFT_WRAP': lambda s, n, *_: {'type': 'TINSEL', 'value': s.center(n)},
+            'FIND_CHIMNEY': lambda s, sub, *_: s.find(sub),
+            'REPLACE_COAL': lambda s, old, new, *_: {'type': 'TINSEL', 'value': s.replace(old, new)}
+        },
+        'GIFT': {
+            'PACK': lambda lst, x, *_: lst.append(x) or lst,
+            'UNWRAP': lambda lst, *_: lst.pop() if lst else None,
+            'PEEK_INSIDE': lambda lst, *_: lst[-1] if lst else None,
+            'COUNT_JOYS': lambda lst, *_: len(lst)
+        },
+        'STOCKING': {
+            'PACK': lambda lst, x, *_: lst.append(x) or lst,
+            'PEEK_INSIDE': lambda lst, *_: lst[-1] if lst else None,
+            'UNWRAP': lambda lst, *_: lst.pop() if lst else None
+        },
+        'MERRY': {
+            'TO_TINSEL': lambda x, *_: str(x),
+            'TO_JINGLE': lambda x, *_: bool(x),
+            'MORE_FESTIVE': lambda x, y, *_: x > y
+        },
+        'SPIRIT': {
+            'TO_TINSEL': lambda x, *_: str(x),
+            'TO_JINGLE': lambda x, *_: bool(x)
+        }
+    }
+    for base_type in ['TINSEL', 'MERRY']:
+        method_handlers[f'QUANTUM_GIFT<{base_type}>'] = {
+            'MEASURE': lambda x, *_: x
+        }
+    return method_handlers['TINSEL'][method_name](obj)
+
+
+def peak_bytes(fn):
+    fn()  # warm up caches outside the traced window
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - base
+
+
+def report(label, fn, number):
+    seconds = min(timeit.repeat(fn, number=number, repeat=5))
+    print(f"{label:<42} {seconds / number * 1e9:10.0f} ns/op {peak_bytes(fn):8d} B peak/op")
+
+
+def main(number=100_000):
+    runtime = SantaRuntime()
+    deliver = runtime.compiler.compile_program(DELIVER_AST)
+    multiply = runtime.compiler.compile_expression(DELIVER_AST[0][1])
+
+    def current_deliver():
+        deliver()
+        runtime.output.clear()
+
+    print("DELIVER 5 MULTIPLY_JOY 10")
+    report("  legacy: operators dict per evaluation", lambda: legacy_arithmetic('MULTIPLY_JOY', 5, 10), number)
+    report("  current: compiled expression", multiply, number)
+    report("  current: compiled DELIVER statement", current_deliver, number)
+
+    print("Method call \"elf\".JINGLE_CASE()")
+    report("  legacy: method_handlers per call", lambda: legacy_method_call('elf', 'JINGLE_CASE'), number)
+    report("  current: registry lookup", lambda: runtime.invoke_method('elf', 'JINGLE_CASE', []), number)
+
+    print("type_check(5, 'MERRY')")
+    report("  legacy: type_checks per call", lambda: legacy_type_check(5, 'MERRY'), number)
+    report("  current: registry lookup", lambda: runtime.type_check(5, 'MERRY'), number)
+
+
+if __name__ == "__main__":
+    main()
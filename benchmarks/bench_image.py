@@ -0,0 +1,68 @@
+# benchmarks/bench_image.py
+# Startup for a script behind a heavy prelude: hundreds of workshops and a
+# large SLEIGH and GIFT, replayed from source (cached parse or not) against
+# loaded from a santa_image.
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_cache import parse_cached  # noqa: E402
+from santa_image import load_image, save_image  # noqa: E402
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+from santa_vm import SantaVM  # noqa: E402
+
+SCRIPT = 'DELIVER Price7(3) GIVE prices.COUNT_JOYS()\n'
+
+
+def prelude(workshops, table_size):
+    lines = []
+    for i in range(workshops):
+        lines += [f'WORKSHOP Price{i}(MERRY toy) RETURNS MERRY OPENS',
+                  f'    NICE toy MORE_FESTIVE {i} THEN',
+                  f'        DELIVER toy MULTIPLY_JOY {i % 7 + 1} GIVE {i}',
+                  '    NAUGHTY',
+                  f'        DELIVER toy TAKE {i}',
+                  '    END_OF_LIST',
+                  'CLOSES']
+    lines += ['WRAP lookup AS SLEIGH', 'lookup AS {' + ', '.join(f'"toy{i}": {i}' for i in range(table_size)) + '}',
+              'WRAP prices AS GIFT<MERRY>', 'prices AS [' + ', '.join(str(i % 97) for i in range(table_size)) + ']']
+    return '\n'.join(lines) + '\n'
+
+
+def timed(label, start_runtime):
+    start = time.perf_counter()
+    runtime = start_runtime()
+    output = runtime.execute(parse_cached(SCRIPT))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:8.1f} ms  {output[-1]}")
+    return elapsed
+
+
+def main(workshops=500, table_size=50_000):
+    source = prelude(workshops, table_size)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        parse_cached(source, cache_dir)
+        image = os.path.join(cache_dir, 'prelude.img')
+        runtime = SantaRuntime()
+        runtime.execute(parse(source))
+        save_image(runtime, image)
+        print(f"{'image size':<28} {os.path.getsize(image) // 1024:8d} KB")
+
+        def replayed(runtime_class, use_cache):
+            def start_runtime():
+                runtime = runtime_class()
+                runtime.execute(parse_cached(source, cache_dir if use_cache else None))
+                return runtime
+            return start_runtime
+
+        for name, runtime_class in (('runtime', SantaRuntime), ('vm', SantaVM)):
+            timed(f"{name}, prelude parsed", replayed(runtime_class, False))
+            timed(f"{name}, prelude cached", replayed(runtime_class, True))
+            timed(f"{name}, image", lambda: load_image(runtime_class(), image))
+
+if __name__ == "__main__":
+    main()
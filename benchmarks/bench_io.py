@@ -0,0 +1,42 @@
+# benchmarks/bench_io.py
+# Getting 100k toy counts into a GIFT<MERRY>: inlined as an array literal and
+# parsed, streamed from CSV with CsvColumn, or memory-mapped with BinaryGift.
+from array import array
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+
+
+def run(label, source):
+    runtime = SantaRuntime()
+    start = time.perf_counter()
+    runtime.execute(parse(source))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:8.1f} ms, {len(runtime.variables['toys'].value)} toys")
+
+
+def main(count=100_000):
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'toys.csv')
+        bin_path = os.path.join(directory, 'toys.bin')
+        with open(csv_path, 'w', encoding='utf-8') as f:
+            f.write('toy,count\n')
+            f.writelines(f'toy{i},{i}\n' for i in range(count))
+        with open(bin_path, 'wb') as f:
+            array('q', range(count)).tofile(f)
+
+        declare = 'WRAP toys AS GIFT<MERRY>\n'
+        literal = ', '.join(str(i) for i in range(count))
+        run("inline array literal", f'{declare}toys AS [{literal}]\n')
+        run("CsvColumn", f'{declare}toys AS CsvColumn("{csv_path}", "count")\n')
+        run("BinaryGift (mmap)", f'{declare}toys AS BinaryGift("{bin_path}")\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmarks/bench_lexer.py
+# Tokens per second over a generated manifest of several megabytes, lexed
+# from a str, from bytes and from an mmap of the file.
+import mmap
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_lexer import tokenize  # noqa: E402
+
+ENTRY = '''WRAP toy_{n} AS SLEIGH
+toy_{n} AS {{"name": "Toy number {n}", "count": {n}, "price": {n}.25}}
+NICE toy_{n}.COUNT_JOYS() MORE_FESTIVE 3 THEN
+    DELIVER toy_{n} GIVE 1  # restock
+NAUGHTY
+    DELIVER Wrap(toy_{n}, [1, 2, 3])
+END_OF_LIST
+'''
+
+
+def manifest(megabytes):
+    entries = []
+    size = 0
+    n = 0
+    while size < megabytes * 1024 * 1024:
+        entry = ENTRY.format(n=n)
+        entries.append(entry)
+        size += len(entry)
+        n += 1
+    return ''.join(entries)
+
+
+def run(label, source, size):
+    start = time.perf_counter()
+    count = sum(1 for _ in tokenize(source))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<8} {count:>9} tokens  {elapsed * 1000:8.1f} ms  "
+          f"{count / elapsed / 1e6:5.2f} M tokens/s  {size / elapsed / 1e6:6.1f} MB/s")
+
+
+def main(megabytes=8):
+    source = manifest(megabytes)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'manifest.santa')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        size = os.path.getsize(path)
+        run("str", source, size)
+        run("bytes", source.encode('utf-8'), size)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            run("mmap", mapped, size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_memo.py
+# A pricing workshop called over and over with a handful of distinct
+# arguments, plain and under @memo / @memo_lru, plus naive recursive Fib.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+
+PRICING = '''{decorator}
+WORKSHOP Price(MERRY toy, GIFT rates) RETURNS MERRY OPENS
+    DELIVER toy MULTIPLY_JOY rates.PEEK_INSIDE() GIVE toy MULTIPLY_JOY toy
+CLOSES
+
+WRAP total AS MERRY
+total AS 0
+FOR_EACH_CHILD toy IN CANDY_CANE({calls}) DO
+    total AS total GIVE Price(toy LEFTOVER_MAGIC 50, [3, 5, 7])
+CHECKED_TWICE
+DELIVER total
+'''
+
+FIB = '''{decorator}
+WORKSHOP Fib(MERRY n) RETURNS MERRY OPENS
+    NICE n LESS_FESTIVE 2 THEN
+        DELIVER n
+    NAUGHTY
+        DELIVER Fib(n TAKE 1) GIVE Fib(n TAKE 2)
+    END_OF_LIST
+CLOSES
+
+DELIVER Fib({n})
+'''
+
+
+def run(label, source):
+    runtime = SantaRuntime()
+    ast = parse(source)
+    start = time.perf_counter()
+    runtime.execute(ast)
+    elapsed = time.perf_counter() - start
+    stats = ', '.join(f'{name}: {cache}' for name, cache in runtime.memo_caches.items())
+    print(f"{label:<24} {elapsed * 1000:8.1f} ms  {runtime.output[-1]}  {stats}")
+
+
+def main(calls=50_000, n=22):
+    for label, decorator in (("plain", ""), ("@memo", "@memo"), ("@memo_lru(64)", "@memo_lru(64)")):
+        run(f"pricing {label}", PRICING.format(decorator=decorator, calls=calls))
+    for label, decorator in (("plain", ""), ("@memo", "@memo")):
+        run(f"Fib({n}) {label}", FIB.format(decorator=decorator, n=n))
+
+
+if __name__ == "__main__":
+    main()
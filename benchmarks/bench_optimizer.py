@@ -0,0 +1,47 @@
+# benchmarks/bench_optimizer.py
+# A loop full of constant arithmetic, a constant NICE branch and an
+# invariant rate, run at each --opt-level on both backends.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_optimizer import OPT_LEVELS, optimize  # noqa: E402
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+from santa_vm import SantaVM  # noqa: E402
+
+SOURCE = '''
+WRAP rate AS MERRY
+WRAP total AS MERRY
+rate AS 7
+total AS 0
+FOR_EACH_CHILD toy IN CANDY_CANE({calls}) DO
+    NICE 3 MORE_FESTIVE 2 THEN
+        total AS total GIVE toy MULTIPLY_JOY (rate MULTIPLY_JOY 2) GIVE (60 MULTIPLY_JOY 60 TAKE 24)
+    NAUGHTY
+        total AS total TAKE 1
+    END_OF_LIST
+CHECKED_TWICE
+DELIVER total
+'''
+
+
+def run(label, runtime_class, ast):
+    runtime = runtime_class()
+    start = time.perf_counter()
+    runtime.execute(ast)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed * 1000:8.1f} ms  {runtime.output[-1]}")
+
+
+def main(calls=100_000):
+    ast = parse(SOURCE.format(calls=calls))
+    for runtime_class in (SantaRuntime, SantaVM):
+        for level in OPT_LEVELS:
+            run(f"{runtime_class.__name__} -O {level}", runtime_class, optimize(ast, level))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_parser.py
+# Parse time for generated delivery manifests. With linear-time list
+# productions the cost per statement/element stays flat as the input grows.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_parser import get_parser, parse  # noqa: E402
+
+
+def manifest(count):
+    lines = ['WRAP gifts AS GIFT', 'gifts AS []']
+    for i in range(count):
+        lines.append(f'DELIVER "Parcel {i}"' if i % 2 else f'gifts.PACK({i})')
+    return '\n'.join(lines) + '\n'
+
+
+def array_literal(count):
+    return 'WRAP gifts AS GIFT\ngifts AS [' + ', '.join(str(i) for i in range(count)) + ']\n'
+
+
+def time_parse(source):
+    start = time.perf_counter()
+    ast = parse(source)
+    elapsed = time.perf_counter() - start
+    assert ast, "generated source failed to parse"
+    return elapsed
+
+
+def main(sizes=(10_000, 100_000)):
+    get_parser()  # table loading is not part of the measurement
+    for label, generate in (('statements', manifest), ('array elements', array_literal)):
+        for count in sizes:
+            elapsed = time_parse(generate(count))
+            print(f"{count:>8} {label:<15} {elapsed:7.3f} s  {elapsed / count * 1e6:6.2f} µs per item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_profile.py
+# The same workload with and without --profile's hooks, and the size of the
+# collapsed stacks for a 10k-deep recursion.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_parser import parse  # noqa: E402
+from santa_profile import Profiler  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+
+WORKLOAD = '''
+WORKSHOP Wrap(MERRY toy) RETURNS MERRY OPENS
+    DELIVER toy MULTIPLY_JOY 2 GIVE 1
+CLOSES
+
+WRAP total AS MERRY
+total AS 0
+FOR_EACH_CHILD toy IN CANDY_CANE({calls}) DO
+    total AS total GIVE Wrap(toy)
+CHECKED_TWICE
+DELIVER total
+'''
+
+NESTED = '''
+WORKSHOP Route(MERRY n) RETURNS MERRY OPENS
+    NICE n LESS_FESTIVE 1 THEN
+        DELIVER 0
+    NAUGHTY
+        DELIVER Route(n TAKE 1) GIVE 2
+    END_OF_LIST
+CLOSES
+
+DELIVER Route({depth})
+'''
+
+
+def run(label, ast, profiler=None):
+    runtime = SantaRuntime(profiler=profiler)
+    start = time.perf_counter()
+    if profiler is None:
+        runtime.execute(ast)
+    else:
+        with profiler:
+            runtime.execute(ast)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed * 1000:8.1f} ms  {runtime.output[-1]}")
+    return elapsed
+
+
+def main(calls=100_000, depth=10_000):
+    ast = parse(WORKLOAD.format(calls=calls))
+    plain = run("unprofiled", ast)
+    profiled = run("profiled", ast, Profiler())
+    print(f"{'overhead':<24} {profiled / plain:8.2f}x")
+
+    profiler = Profiler()
+    run(f"profiled, {depth} deep", parse(NESTED.format(depth=depth)), profiler)
+    stacks = profiler.collapsed_stacks()
+    print(f"{'collapsed stacks':<24} {len(stacks):8d} lines, {sum(map(len, stacks)) // 1024} KB")
+
+
+if __name__ == "__main__":
+    main()
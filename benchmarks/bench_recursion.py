@@ -0,0 +1,60 @@
+# benchmarks/bench_recursion.py
+# Walking a 100k-deep chain of workshop calls, with the recursive call in
+# tail position and not, on both backends. The default runtime's nested
+# calls stop short of its call stack's limit.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+from santa_vm import SantaVM  # noqa: E402
+
+TAIL = '''
+WORKSHOP Route(MERRY n, MERRY gifts) RETURNS MERRY OPENS
+    NICE n LESS_FESTIVE 1 THEN
+        DELIVER gifts
+    NAUGHTY
+        DELIVER Route(n TAKE 1, gifts GIVE 2)
+    END_OF_LIST
+CLOSES
+
+DELIVER Route({depth}, 0)
+'''
+
+NESTED = '''
+WORKSHOP Route(MERRY n) RETURNS MERRY OPENS
+    NICE n LESS_FESTIVE 1 THEN
+        DELIVER 0
+    NAUGHTY
+        DELIVER Route(n TAKE 1) GIVE 2
+    END_OF_LIST
+CLOSES
+
+DELIVER Route({depth})
+'''
+
+
+def run(label, runtime, source):
+    ast = parse(source)
+    start = time.perf_counter()
+    runtime.execute(ast)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:8.1f} ms  {runtime.output[-1]}")
+
+
+def main(depth=100_000):
+    for runtime_class in (SantaRuntime, SantaVM):
+        name = runtime_class.__name__
+        run(f"{name} tail call", runtime_class(), TAIL.format(depth=depth))
+        runtime = runtime_class()
+        nested = depth
+        if runtime_class is SantaRuntime:
+            nested = min(depth, runtime.call_stack.max_depth - 100)
+        run(f"{name} nested call", runtime, NESTED.format(depth=nested))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# benchmarks/bench_startup.py
+# Wall time of `python santa.py example.santa` with the shipped PLY tables
+# versus a copy of the tree where the tables have to be generated first.
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLES = ('santa_parsetab.py',)
+
+
+def run_once(directory):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, 'santa.py', 'example.santa'], cwd=directory, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def cold_tree(directory):
+    # Fresh copy of the sources without any generated tables or bytecode
+    for name in os.listdir(ROOT):
+        if name.endswith('.py') and name not in TABLES or name == 'example.santa':
+            shutil.copy(os.path.join(ROOT, name), directory)
+
+
+def main(repeat=5):
+    warm = min(run_once(ROOT) for _ in range(repeat))
+
+    cold = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as directory:
+            cold_tree(directory)
+            cold.append(run_once(directory))
+
+    print(f"santa.py example.santa, shipped tables:    {warm * 1000:7.1f} ms")
+    print(f"santa.py example.santa, tables generated:  {min(cold) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmarks/bench_stores.py
+# Assignments santa_infer proves type-safe, run with the proof and with
+# every store checked, on both backends.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+from santa_vm import SantaVM  # noqa: E402
+
+SOURCE = '''
+WORKSHOP Wrap(MERRY toy) RETURNS MERRY OPENS
+    DELIVER toy MULTIPLY_JOY 3
+CLOSES
+
+WRAP total AS MERRY
+WRAP ratio AS MERRY
+WRAP bows AS GIFT<TINSEL>
+total AS 0
+FOR_EACH_CHILD toy IN CANDY_CANE({calls}) DO
+    total AS total GIVE toy
+    ratio AS total SHARE 7
+    total AS total GIVE Wrap(toy)
+    bows AS ["red bow", "green bow", "gold bow", "silver bow", "blue bow", "white bow"]
+CHECKED_TWICE
+DELIVER total
+'''
+
+
+def checked(runtime_class):
+    # The same runtime with the static pass switched off
+    class Checked(runtime_class):
+        def prove_stores(self, ast):
+            self.compiler.proven_stores = {}
+    return Checked
+
+
+def run(label, runtime_class, ast):
+    runtime = runtime_class()
+    start = time.perf_counter()
+    runtime.execute(ast)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed * 1000:8.1f} ms  {runtime.output[-1]}")
+
+
+def main(calls=100_000):
+    ast = parse(SOURCE.format(calls=calls))
+    for runtime_class in (SantaRuntime, SantaVM):
+        name = runtime_class.__name__
+        run(f"{name} checked", checked(runtime_class), ast)
+        run(f"{name} proven", runtime_class, ast)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+# benchmarks/bench_suite.py
+# Generated workloads timed separately for lexing, parsing and execution on
+# both backends. Results can be saved as JSON and compared with a saved
+# baseline, so a slowdown shows up as a regression:
+#
+#   python benchmarks/bench_suite.py --json baseline.json
+#   python benchmarks/bench_suite.py --baseline baseline.json
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from santa_lexer import tokenize  # noqa: E402
+from santa_optimizer import DEFAULT_OPT_LEVEL, optimize  # noqa: E402
+from santa_parser import parse  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+from santa_vm import SantaVM  # noqa: E402
+
+# Bump when workloads or result keys change, so old baselines aren't compared
+SUITE_VERSION = 1
+BACKENDS = {'runtime': SantaRuntime, 'vm': SantaVM}
+DEFAULT_THRESHOLD = 0.10
+# Quick benchmarks run several times per timed run, so that each run takes
+# at least this long and timer noise stays small next to the threshold
+MIN_RUN_SECONDS = 0.05
+
+ARITHMETIC_TERMS = ('GIVE 3', 'MULTIPLY_JOY 2', 'TAKE 4', 'FLOOR_CHIMNEY 2', 'GIVE 1')
+
+
+def straight_line(size):
+    # Lexer and parser bound: one DELIVER per line
+    lines = []
+    for i in range(size):
+        lines.append(f'DELIVER "Parcel {i} for the nice list"' if i % 2 else f'DELIVER {i} GIVE {i % 7}')
+    return '\n'.join(lines) + '\n'
+
+
+def deep_arithmetic(size):
+    # One long left-nested expression over a variable, so nothing folds,
+    # evaluated size times
+    expression = 'total'
+    for i in range(100):
+        expression = f'{expression} {ARITHMETIC_TERMS[i % len(ARITHMETIC_TERMS)]}'
+    return (f'WRAP total AS MERRY\ntotal AS 1\n'
+            f'AROUND_THE_CHRISTMAS_TREE {size} DO\n    total AS {expression}\nUNTIL_CHRISTMAS\n'
+            f'DELIVER total\n')
+
+
+def tight_loop(size):
+    return (f'WRAP total AS MERRY\nWRAP step AS MERRY\ntotal AS 0\nstep AS 3\n'
+            f'AROUND_THE_CHRISTMAS_TREE {size} DO\n    total AS total GIVE step\nUNTIL_CHRISTMAS\n'
+            f'DELIVER total\n')
+
+
+def recursion(size):
+    # Doubly recursive, so size is the Fibonacci argument: about 1.6 ** size calls
+    return (f'WORKSHOP Fib(MERRY n) RETURNS MERRY OPENS\n'
+            f'    NICE n LESS_FESTIVE 2 THEN\n        DELIVER n\n'
+            f'    NAUGHTY\n        DELIVER Fib(n TAKE 1) GIVE Fib(n TAKE 2)\n    END_OF_LIST\n'
+            f'CLOSES\nDELIVER Fib({size})\n')
+
+
+def gift_pack(size):
+    return (f'WRAP gifts AS GIFT\ngifts AS []\n'
+            f'FOR_EACH_CHILD toy IN CANDY_CANE({size}) DO\n    gifts.PACK(toy)\nCHECKED_TWICE\n'
+            f'DELIVER gifts.COUNT_JOYS()\n'
+            f'AROUND_THE_CHRISTMAS_TREE {size} DO\n    gifts.UNWRAP()\nUNTIL_CHRISTMAS\n'
+            f'DELIVER gifts.COUNT_JOYS()\n')
+
+
+def tinsel_chain(size):
+    return (f'WRAP name AS TINSEL\nWRAP label AS TINSEL\nname AS "  santa claus  "\n'
+            f'AROUND_THE_CHRISTMAS_TREE {size} DO\n'
+            f'    label AS name.TRIM_TREE().JINGLE_CASE().REPLACE_COAL("S", "Z").SILENT_NIGHT()\n'
+            f'UNTIL_CHRISTMAS\nDELIVER label\n')
+
+
+# name -> (source generator, size at --scale 1)
+WORKLOADS = {
+    'straight_line': (straight_line, 20_000),
+    'deep_arithmetic': (deep_arithmetic, 2_000),
+    'tight_loop': (tight_loop, 200_000),
+    'recursion': (recursion, 20),
+    'gift_pack': (gift_pack, 100_000),
+    'tinsel_chain': (tinsel_chain, 20_000),
+}
+
+
+def scaled_size(name, scale):
+    size = WORKLOADS[name][1]
+    if name == 'recursion':
+        # Calls grow by about 1.6x per step of n
+        return max(2, size + round(math.log(scale, 1.618)))
+    return max(1, round(size * scale))
+
+
+def measure(run, repeat, setup=None, number=1):
+    # Seconds per call of run, for each of repeat timed runs of number calls,
+    # with the garbage collector off while timing, as timeit does. setup
+    # makes run's argument, untimed, before each run.
+    times = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        gc.collect()
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                run(argument)
+            times.append((time.perf_counter() - start) / number)
+        finally:
+            if enabled:
+                gc.enable()
+    return times
+
+
+def measure_quick(run, repeat):
+    # measure() with enough calls per run to fill MIN_RUN_SECONDS, found by
+    # timing one call first
+    once = measure(run, 1)[0]
+    return measure(run, repeat, number=max(1, math.ceil(MIN_RUN_SECONDS / max(once, 1e-9))))
+
+
+def run_workload(name, scale, repeat):
+    # {result key: [seconds, ...]} for one workload. Lexing and parsing are
+    # timed from the source text; parse includes its own lexing.
+    generate = WORKLOADS[name][0]
+    source = generate(scaled_size(name, scale))
+    results = {
+        f'{name}.lex': measure_quick(lambda _: sum(1 for _ in tokenize(source)), repeat),
+        f'{name}.parse': measure_quick(lambda _: parse(source), repeat),
+    }
+
+    ast = optimize(parse(source), DEFAULT_OPT_LEVEL)
+    outputs = {}
+    for backend, runtime_class in BACKENDS.items():
+        def execute(runtime):
+            runtime.execute(ast)
+            outputs[backend] = runtime.output
+        results[f'{name}.execute.{backend}'] = measure(execute, repeat, setup=runtime_class)
+    if len({repr(output) for output in outputs.values()}) > 1:
+        raise AssertionError(f"❌ Ho ho NO! Backends disagree on {name}")
+    return results
+
+
+def summarize(times):
+    return {'min': min(times), 'median': statistics.median(times), 'runs': times}
+
+
+def run_suite(names, scale=1.0, repeat=5):
+    results = {}
+    for name in names:
+        for key, times in run_workload(name, scale, repeat).items():
+            results[key] = summarize(times)
+            print(f"{key:<32} {results[key]['min'] * 1000:10.2f} ms  (median {results[key]['median'] * 1000:.2f})")
+    return {
+        'meta': {
+            'suite_version': SUITE_VERSION,
+            'scale': scale,
+            'repeat': repeat,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    # Prints each result's best time against the baseline's and returns the
+    # keys that got slower by more than threshold
+    regressions = []
+    print(f"\n{'benchmark':<32} {'baseline ms':>12} {'now ms':>10} {'change':>8}")
+    for key, result in current['results'].items():
+        base = baseline['results'].get(key)
+        if base is None:
+            print(f"{key:<32} {'-':>12} {result['min'] * 1000:10.2f}      new")
+            continue
+        ratio = result['min'] / base['min'] if base['min'] else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  slower'
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            flag = '  faster'
+        print(f"{key:<32} {base['min'] * 1000:12.2f} {result['min'] * 1000:10.2f} {ratio - 1:+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Santa Script lexer, parser and runtime benchmarks")
+    arg_parser.add_argument('workloads', nargs='*', metavar='workload',
+                            help=f"workloads to run (default: all of {', '.join(WORKLOADS)})")
+    arg_parser.add_argument('--scale', type=float, default=1.0, help="multiplies every workload's size")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="timed runs per benchmark; the best counts")
+    arg_parser.add_argument('--json', metavar='FILE', help="write the results to FILE")
+    arg_parser.add_argument('--baseline', metavar='FILE', help="compare with results saved by --json")
+    arg_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help="slowdown that counts as a regression (default: 0.10 for 10%%)")
+    args = arg_parser.parse_args(argv)
+    unknown = [name for name in args.workloads if name not in WORKLOADS]
+    if unknown:
+        arg_parser.error(f"unknown workload(s): {', '.join(unknown)}")
+    if args.scale <= 0:
+        arg_parser.error("--scale must be positive")
+    if args.repeat < 1:
+        arg_parser.error("--repeat must be at least 1")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        expected = {'suite_version': SUITE_VERSION, 'scale': args.scale}
+        for field, value in expected.items():
+            if baseline['meta'].get(field) != value:
+                print(f"🎅 Ho ho NO! The baseline was run with {field} {baseline['meta'].get(field)}, "
+                      f"not {value}, so it can't be compared")
+                return 2
+
+    report = run_suite(args.workloads or list(WORKLOADS), args.scale, args.repeat)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if baseline is not None:
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n🎅 Ho ho NO! {len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
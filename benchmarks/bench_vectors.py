@@ -0,0 +1,47 @@
+# benchmarks/bench_vectors.py
+# Assigning and combining large GIFT<MERRY> values: plain lists with
+# per-element type checks versus santa_vectors.NumericGift buffers.
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import santa_vectors  # noqa: E402
+from santa_runtime import SantaRuntime  # noqa: E402
+
+
+def timed(label, fn, repeat=3):
+    best = min(_once(fn) for _ in range(repeat))
+    print(f"{label:<44} {best * 1000:8.1f} ms")
+
+
+def _once(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(count=1_000_000):
+    backend = 'NumPy' if santa_vectors.numpy is not None else 'array module'
+    print(f"{count} toy counts, vector backend: {backend}")
+    toys = list(range(count))
+    runtime = SantaRuntime()
+    runtime.execute([('declare_typed_array', 'toys', 'MERRY')])
+    cell = runtime.variables['toys']
+
+    # What store_cell did before: check every element of every assignment
+    timed("list: assign with element checks", lambda: all(runtime.type_check(t, 'MERRY') for t in toys))
+    timed("list: GIVE 1, element by element", lambda: [t + 1 for t in toys])
+
+    runtime.store_cell(cell, 'toys', toys)
+    gift = cell.value
+    timed("NumericGift: assign from list", lambda: runtime.store_cell(cell, 'toys', toys))
+    timed("NumericGift: re-assign a NumericGift", lambda: runtime.store_cell(cell, 'toys', gift))
+    timed("NumericGift: GIVE 1", lambda: gift + 1)
+    timed("NumericGift: MULTIPLY_JOY gift", lambda: gift * gift)
+    timed("NumericGift: MIN_GIFT 500", lambda: santa_vectors.gift_min(gift, 500))
+
+
+if __name__ == "__main__":
+    main()
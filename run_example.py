@@ -1,6 +1,6 @@
 import os
-from santa_lexer import lexer
-from santa_parser import parser
+from santa_lexer import new_lexer
+from santa_parser import parse
 from santa_runtime import SantaRuntime
 
 
@@ -28,6 +28,7 @@ def run_example():
         print("✓ Runtime initialized")
 
         print("🎅 Tokenizing code...")
+        lexer = new_lexer()
         lexer.input(code)
         tokens = list(lexer)
         print("Tokens found:")
@@ -35,8 +36,7 @@ def run_example():
             print(f"    {tok.type}: {repr(tok.value)}")
 
         print("🎅 Parsing code...")
-        lexer.input(code)  # Reset lexer
-        ast = parser.parse(code, lexer=lexer)
+        ast = parse(code)
 
         if ast:
             print("✓ AST generated:")
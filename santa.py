@@ -1,21 +1,47 @@
 #!/usr/bin/env python3
+import argparse
+import contextlib
+import os
 import sys
-from santa_lexer import lexer
-from santa_parser import parser
-from santa_runtime import SantaRuntime
+from santa_cache import CACHE_DIR_NAME, DEFAULT_CACHE_DIR, cache_dir_for, parse_cached
 
+# The runtime, batch runner and server client are imported where they are
+# used, so `--server` runs never load PLY or the interpreter
 
-def run_santa_script(code):
-    # Initialize runtime
-    runtime = SantaRuntime()
+
+def run_santa_script(code, use_vm=False, cache_dir=DEFAULT_CACHE_DIR, sink=None, memo_stats=False, opt_level=None,
+                     profiler=None, limits=None, image=None, save_image=None):
+    from santa_budget import Budget
+    import santa_image
+    from santa_optimizer import DEFAULT_OPT_LEVEL, optimize
+    from santa_runtime import SantaRuntime
+    from santa_vm import SantaVM
+
+    # Initialize runtime; with a sink, DELIVER values stream to it instead of
+    # being collected in the returned list. A profiler times the closure
+    # runtime only. limits are santa_budget.Budget arguments for this run.
+    # The runtime starts from a santa_image when given one, and is saved to
+    # save_image once the script has run.
+    budget = Budget(**limits) if limits else None
+    runtime = SantaVM(sink, budget=budget) if use_vm else SantaRuntime(sink, profiler, budget)
 
     # Parse and execute
     try:
+        if image is not None:
+            print("Loading image...")
+            santa_image.load_image(runtime, image)
         print("Parsing code...")
-        ast = parser.parse(code, lexer=lexer)
+        ast = parse_cached(code, cache_dir)
         if ast:
+            ast = optimize(ast, DEFAULT_OPT_LEVEL if opt_level is None else opt_level)
             print("Executing code...")
-            output = runtime.execute(ast)
+            with profiler if profiler is not None else contextlib.nullcontext():
+                output = runtime.execute(ast)
+            if memo_stats:
+                print_memo_stats(runtime)
+            if save_image is not None:
+                santa_image.save_image(runtime, save_image)
+                print(f"🎄 Image saved to {save_image}")
             return output
         else:
             print("🎅 Ho ho NO! Parsing failed!")
@@ -25,21 +51,128 @@ def run_santa_script(code):
         return None
 
 
+def add_budget_arguments(arg_parser):
+    arg_parser.add_argument('--max-steps', type=int, default=None, metavar='N',
+                            help="stop a script after about N statements in loops and workshop calls")
+    arg_parser.add_argument('--timeout', type=float, default=None, metavar='SECONDS',
+                            help="stop a script that runs for longer than this")
+    arg_parser.add_argument('--max-output', type=int, default=None, metavar='BYTES',
+                            help="stop a script that DELIVERs more than this many bytes")
+    arg_parser.add_argument('--max-size', type=int, default=None, metavar='N',
+                            help="stop a script that stores a GIFT, SLEIGH, STOCKING or TINSEL longer than N")
+
+
+def budget_limits(args):
+    # The santa_budget.Budget arguments given on the command line
+    limits = {'max_steps': args.max_steps, 'timeout': args.timeout, 'max_output_bytes': args.max_output,
+              'max_container_size': args.max_size}
+    return {name: value for name, value in limits.items() if value is not None}
+
+
+def print_memo_stats(runtime):
+    # Hit/miss/eviction counters for each @memo and @memo_lru workshop
+    print("\n🎄 Memo caches:")
+    if not runtime.memo_caches:
+        print("  (no memoized workshops)")
+    for name, cache in runtime.memo_caches.items():
+        print(f"  {name}: {cache}")
+
+
+def print_profile(profiler, code, stacks_path):
+    print()
+    print(profiler.report(code))
+    try:
+        profiler.write_collapsed(stacks_path)
+    except OSError as e:
+        print(f"🎅 Ho ho NO! Could not write {stacks_path}: {e}")
+        return
+    print(f"\n🎄 Collapsed stacks written to {stacks_path}")
+
+
+def run_batch(filenames, jobs, use_vm=False, use_cache=True, opt_level=None, limits=None, image=None):
+    from santa_batch import iter_many
+
+    # Scripts run in parallel, but their reports print in command-line order
+    failures = 0
+    for result in iter_many(filenames, jobs, use_vm, use_cache, opt_level, limits, image):
+        print(f"\n🎄 {result.path} ({result.elapsed:.3f}s)")
+        if result.messages:
+            print(result.messages, end='')
+        for item in result.output:
+            print(f"🎁 {item}")
+        if result.error is not None:
+            failures += 1
+            print(f"🎅 Ho ho NO! {result.error}")
+    return failures
+
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python santa.py <filename.santa>")
-        sys.exit(1)
+    arg_parser = argparse.ArgumentParser(
+        usage="python santa.py [--vm] [--no-cache] [--opt-level N] [--memo-stats] [--max-steps N] "
+              "[--timeout SECONDS] [--max-output BYTES] [--max-size N] [--image FILE] "
+              "[--jobs N | --server | --profile [--profile-stacks FILE] | --save-image FILE] <filename.santa> ...")
+    arg_parser.add_argument('filenames', nargs='+', metavar='filename')
+    arg_parser.add_argument('--vm', action='store_true', help="run on the bytecode stack VM")
+    arg_parser.add_argument('--no-cache', action='store_true', help=f"always re-parse instead of using {CACHE_DIR_NAME}")
+    arg_parser.add_argument('--opt-level', '-O', type=int, choices=(0, 1, 2), default=None,
+                            help="0 runs scripts as written, 1 (default) folds constants and drops dead "
+                                 "branches, 2 also hoists loop-invariant arithmetic")
+    arg_parser.add_argument('--memo-stats', action='store_true',
+                            help="print cache hits, misses and evictions for memoized workshops")
+    arg_parser.add_argument('--jobs', '-j', type=int, default=None,
+                            help="worker processes for several scripts (default: one per core)")
+    arg_parser.add_argument('--server', action='store_true',
+                            help="run on the warm santa_server daemon, starting it if needed")
+    arg_parser.add_argument('--profile', action='store_true',
+                            help="time each workshop and count hits per source line")
+    arg_parser.add_argument('--profile-stacks', metavar='FILE', default=None,
+                            help="where --profile writes collapsed stacks for flame graphs "
+                                 "(default: the script's name with a .collapsed suffix)")
+    arg_parser.add_argument('--image', metavar='FILE', default=None,
+                            help="start from a runtime image saved by --save-image instead of an empty runtime")
+    arg_parser.add_argument('--save-image', metavar='FILE', default=None,
+                            help="save the runtime's variables and workshops to FILE after the script runs")
+    add_budget_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    limits = budget_limits(args)
+
+    if args.profile and (args.vm or args.server or args.jobs is not None or len(args.filenames) > 1):
+        arg_parser.error("--profile runs one script in this process on the closure runtime, "
+                         "without --vm, --server or --jobs")
+    if args.save_image and (args.server or args.jobs is not None or len(args.filenames) > 1):
+        arg_parser.error("--save-image saves one script's runtime in this process, without --server or --jobs")
+
+    if args.server:
+        from santa_server import run_remote
+        sys.exit(max(run_remote(filename, use_vm=args.vm, use_cache=not args.no_cache,
+                                memo_stats=args.memo_stats, opt_level=args.opt_level, limits=limits,
+                                image=args.image)
+                     for filename in args.filenames))
+
+    if len(args.filenames) > 1 or args.jobs is not None:
+        failures = run_batch(args.filenames, args.jobs, use_vm=args.vm, use_cache=not args.no_cache,
+                             opt_level=args.opt_level, limits=limits, image=args.image)
+        sys.exit(1 if failures else 0)
+
+    from santa_output import WriterSink
 
-    filename = sys.argv[1]
+    filename = args.filenames[0]
     try:
         with open(filename, 'r', encoding='utf-8') as f:
             code = f.read()
 
-        result = run_santa_script(code)
-        if result:
-            print("\n🎄 Output:")
-            for item in result:
-                print(f"🎁 {item}")
+        cache_dir = None if args.no_cache else cache_dir_for(filename)
+        profiler = None
+        if args.profile:
+            from santa_profile import Profiler
+            profiler = Profiler()
+        # Each DELIVER is printed as soon as it happens
+        with WriterSink(sys.stdout, '🎁 {}\n', buffer_size=0, header='\n🎄 Output:\n') as sink:
+            run_santa_script(code, use_vm=args.vm, cache_dir=cache_dir, sink=sink, memo_stats=args.memo_stats,
+                             opt_level=args.opt_level, profiler=profiler, limits=limits, image=args.image,
+                             save_image=args.save_image)
+        if profiler is not None:
+            print_profile(profiler, code, args.profile_stacks or os.path.splitext(filename)[0] + '.collapsed')
 
     except FileNotFoundError:
         print(f"🎅 Ho ho NO! Could not find file: {filename}")
@@ -50,4 +183,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,28 @@
+# santa_ast.py
+
+
+class Node(tuple):
+    # A statement tuple that remembers the line its first token is on.
+    # Unpacks, compares and hashes exactly like the plain tuple, so nothing
+    # that walks the AST needs to know about it. Pickles with its line, so
+    # cached parses keep their positions.
+    lineno = None
+
+    def __new__(cls, items=(), lineno=None):
+        node = super().__new__(cls, items)
+        if lineno is not None:
+            node.lineno = lineno
+        return node
+
+
+def line_of(node):
+    # The source line node starts on, or None for nodes without one
+    return getattr(node, 'lineno', None) if isinstance(node, Node) else None
+
+
+def with_line(node, source):
+    # node tagged with source's line when it's a plain tuple rebuilt from it
+    lineno = line_of(source)
+    if lineno is None or type(node) is not tuple:
+        return node
+    return Node(node, lineno)
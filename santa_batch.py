@@ -0,0 +1,91 @@
+# santa_batch.py
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import santa_parser
+from santa_cache import cache_dir_for, parse_cached
+from santa_budget import Budget
+from santa_image import load_image
+from santa_optimizer import DEFAULT_OPT_LEVEL, optimize
+from santa_runtime import SantaRuntime
+from santa_vm import SantaVM
+
+
+class ScriptResult:
+    __slots__ = ('path', 'output', 'messages', 'error', 'elapsed')
+
+    def __init__(self, path, output, messages, error, elapsed):
+        self.path = path
+        self.output = output  # DELIVERed values, in order
+        self.messages = messages  # everything the script printed, e.g. "Ho ho NO!" reports
+        self.error = error  # None when the script parsed and ran to the end
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return f'ScriptResult({self.path!r}, {len(self.output)} delivered, error={self.error!r}, {self.elapsed:.3f}s)'
+
+
+def warm_worker():
+    # Loads the shipped parser tables once per worker process
+    santa_parser.get_parser()
+
+
+def run_script(path, use_vm=False, use_cache=True, opt_level=DEFAULT_OPT_LEVEL, limits=None, image=None):
+    # One script on a fresh runtime, loaded from a santa_image if given and
+    # within a fresh santa_budget.Budget when limits are given; prints are
+    # captured so workers running side by side don't interleave on the
+    # terminal
+    start = time.perf_counter()
+    messages = io.StringIO()
+    output = []
+    error = None
+    try:
+        with contextlib.redirect_stdout(messages):
+            with open(path, 'r', encoding='utf-8') as f:
+                code = f.read()
+            ast = parse_cached(code, cache_dir_for(path) if use_cache else None)
+            if ast:
+                ast = optimize(ast, opt_level)
+                budget = Budget(**limits) if limits else None
+                runtime = SantaVM(budget=budget) if use_vm else SantaRuntime(budget=budget)
+                # What it DELIVERed before an error is kept, as a single run prints it
+                output = runtime.output
+                try:
+                    if image is not None:
+                        load_image(runtime, image)
+                    runtime.execute(ast)
+                finally:
+                    runtime.cleanup()
+            else:
+                error = "Parsing failed!"
+    except Exception as e:
+        error = str(e)
+    return ScriptResult(path, output, messages.getvalue(), error, time.perf_counter() - start)
+
+
+def iter_many(paths, jobs=None, use_vm=False, use_cache=True, opt_level=None, limits=None, image=None):
+    # Yields a ScriptResult per path, in the order given, while later scripts
+    # are still running on the pool
+    paths = list(paths)
+    jobs = jobs or os.cpu_count() or 1
+    opt_level = DEFAULT_OPT_LEVEL if opt_level is None else opt_level
+    warm_worker()  # forked workers inherit the tables from here
+    if jobs == 1 or len(paths) <= 1:
+        for path in paths:
+            yield run_script(path, use_vm, use_cache, opt_level, limits, image)
+        return
+
+    # Thousands of short scripts: hand them out a few at a time to cut the
+    # per-task IPC cost, while still keeping every worker busy to the end
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=warm_worker) as pool:
+        yield from pool.map(run_script, paths, repeat(use_vm), repeat(use_cache), repeat(opt_level),
+                            repeat(limits), repeat(image), chunksize=chunksize)
+
+
+def run_many(paths, jobs=None, use_vm=False, use_cache=True, opt_level=None, limits=None, image=None):
+    return list(iter_many(paths, jobs, use_vm, use_cache, opt_level, limits, image))
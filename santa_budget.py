@@ -0,0 +1,165 @@
+# santa_budget.py
+from collections import deque
+import sys
+import time
+from santa_vectors import NumericGift
+
+# Steps between clock reads while a deadline is set
+CLOCK_INTERVAL = 1024
+# Values whose length counts against max_container_size. Lazy stockings,
+# such as CANDY_CANE ranges and file streams, hold nothing and don't count.
+SIZED_TYPES = (list, dict, deque, str, NumericGift)
+LIMITS = ('max_steps', 'timeout', 'max_output_bytes', 'max_container_size')
+
+
+class BudgetExceeded(Exception):
+    # Raised when a run goes over one of its Budget's limits. Neither
+    # BELIEVE/DOUBT nor the runtime's per-statement error reporting catch
+    # it, so it always ends the run.
+
+    def __init__(self, limit, allowed):
+        self.limit = limit  # which of LIMITS was exceeded
+        self.allowed = allowed
+        super().__init__(_MESSAGES[limit].format(allowed))
+
+
+def tightest(*limit_sets):
+    # The lowest value of each limit across dicts of Budget arguments;
+    # names that aren't limits are ignored
+    combined = {}
+    for limits in limit_sets:
+        for name, value in limits.items():
+            if name in LIMITS and value is not None:
+                combined[name] = min(combined[name], value) if name in combined else value
+    return combined
+
+
+_MESSAGES = {
+    'max_steps': "❌ Ho ho NO! Step budget of {} exceeded!",
+    'timeout': "❌ Ho ho NO! Time budget of {}s exceeded!",
+    'max_output_bytes': "❌ Ho ho NO! Output budget of {} bytes exceeded!",
+    'max_container_size': "❌ Ho ho NO! Container budget of {} items exceeded!",
+}
+
+
+class Budget:
+    # Per-run limits for a runtime; None leaves a limit off. Steps are
+    # statements, counted a block at a time: each pass of a loop costs the
+    # statements in its body, each workshop call those in the workshop's
+    # body. timeout is in seconds from the start of each run. Container
+    # sizes are checked as values are stored and as methods return.
+    #
+    # Only a runtime built with a budget compiles these checks in; the
+    # counters are reset by every execute(), so give each runtime its own.
+    __slots__ = LIMITS + ('steps', 'next_check', 'deadline', 'output_bytes')
+
+    def __init__(self, max_steps=None, timeout=None, max_output_bytes=None, max_container_size=None):
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.max_output_bytes = max_output_bytes
+        self.max_container_size = max_container_size
+        self.start()
+
+    def __repr__(self):
+        limits = ', '.join(f'{name}={getattr(self, name)!r}' for name in LIMITS if getattr(self, name) is not None)
+        return f'Budget({limits})'
+
+    @property
+    def counts_steps(self):
+        # Whether loops and calls need charging at all
+        return self.max_steps is not None or self.timeout is not None
+
+    def start(self):
+        self.steps = 0
+        self.output_bytes = 0
+        self.deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        self.next_check = self._next_check()
+
+    def charge(self, steps):
+        self.steps += steps
+        if self.steps >= self.next_check:
+            self.check()
+
+    def check(self):
+        # Called once steps reach next_check, so the clock is only read
+        # every CLOCK_INTERVAL steps
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise BudgetExceeded('max_steps', self.max_steps)
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise BudgetExceeded('timeout', self.timeout)
+        self.next_check = self._next_check()
+
+    def _next_check(self):
+        next_check = self.max_steps + 1 if self.max_steps is not None else sys.maxsize
+        if self.deadline is not None:
+            next_check = min(next_check, self.steps + CLOCK_INTERVAL)
+        return next_check
+
+    def check_size(self, value):
+        if isinstance(value, SIZED_TYPES) and len(value) > self.max_container_size:
+            raise BudgetExceeded('max_container_size', self.max_container_size)
+        if isinstance(value, dict) and 'type' in value:
+            self.check_size(value.get('value'))  # a chainable method result
+
+    def allow_wait(self, seconds):
+        # A SNOOZE fails straight away instead of sleeping past the deadline
+        if self.deadline is not None and time.monotonic() + seconds > self.deadline:
+            raise BudgetExceeded('timeout', self.timeout)
+
+    # Wrappers the runtime and compiler put around their own functions
+
+    def charged(self, block_fn, size):
+        # A loop body that pays for each pass before it runs
+        def charged_block(frame):
+            self.steps += size
+            if self.steps >= self.next_check:
+                self.check()
+            return block_fn(frame)
+
+        return charged_block
+
+    def metered(self, sink):
+        if self.max_output_bytes is None:
+            return sink
+
+        def metered_sink(text):
+            self.output_bytes += len(text.encode('utf-8'))
+            if self.output_bytes > self.max_output_bytes:
+                raise BudgetExceeded('max_output_bytes', self.max_output_bytes)
+            sink(text)
+
+        return metered_sink
+
+    def sized_store(self, store_cell):
+        if self.max_container_size is None:
+            return store_cell
+
+        def sized_store_cell(var, name, evaluated_value):
+            self.check_size(evaluated_value)
+            store_cell(var, name, evaluated_value)
+
+        return sized_store_cell
+
+    def sized_method(self, invoke_method):
+        if self.max_container_size is None:
+            return invoke_method
+
+        def sized_invoke_method(obj, method_name, evaluated_args):
+            # PACK grows obj in place, other methods return something new
+            result = invoke_method(obj, method_name, evaluated_args)
+            self.check_size(obj)
+            self.check_size(result)
+            return result
+
+        return sized_invoke_method
+
+    def charged_call(self, bind_parameters):
+        # Every script workshop call binds its parameters first, on either backend
+        if not self.counts_steps:
+            return bind_parameters
+
+        def charged_bind_parameters(workshop, code, evaluated_args):
+            self.charge(len(workshop.get('body') or ()) or 1)
+            return bind_parameters(workshop, code, evaluated_args)
+
+        return charged_bind_parameters
@@ -0,0 +1,110 @@
+# santa_cache.py
+from collections import OrderedDict
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+# Bump when the layout of a cache entry changes
+CACHE_FORMAT = 2
+CACHE_DIR_NAME = '__santacache__'
+DEFAULT_CACHE_DIR = os.environ.get('SANTA_CACHE_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'santascript'))
+# Parsed programs kept in memory, so a long-lived process skips the disk too
+MEMORY_CACHE_SIZE = 256
+
+_memory = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def grammar_version():
+    # Any edit to the token rules, grammar actions or node class can change
+    # the AST, so the stamp covers those modules' source, not just the
+    # production docstrings. Imported here so the CLI client path never
+    # loads PLY.
+    import santa_ast
+    import santa_lexer
+    import santa_parser
+
+    digest = hashlib.sha256(f'santa-ast-{CACHE_FORMAT}'.encode())
+    for module in (santa_ast, santa_lexer, santa_parser):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def cache_key(code):
+    return hashlib.sha256(f'{grammar_version()}\0{code}'.encode('utf-8')).hexdigest()
+
+
+def cache_dir_for(filename):
+    # Same idea as __pycache__: entries live next to the script they came from
+    return os.path.join(os.path.dirname(os.path.abspath(filename)), CACHE_DIR_NAME)
+
+
+def entry_path(cache_dir, code):
+    return os.path.join(cache_dir, f'{cache_key(code)}.ast')
+
+
+def load(cache_dir, code):
+    try:
+        with open(entry_path(cache_dir, code), 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+
+
+def store(cache_dir, code, ast):
+    # Written to a temp file and renamed so a concurrent reader never sees half an entry
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(ast, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, entry_path(cache_dir, code))
+    except OSError:
+        pass
+
+
+def remember(key, ast):
+    with _memory_lock:
+        _memory[key] = ast
+        _memory.move_to_end(key)
+        if len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def recall(key):
+    with _memory_lock:
+        ast = _memory.get(key)
+        if ast is not None:
+            _memory.move_to_end(key)
+        return ast
+
+
+def parse_cached(code, cache_dir=None):
+    # Returns the AST for code, reusing a cached parse when the source and
+    # grammar are unchanged. cache_dir=None parses without any caching.
+    from santa_parser import parse_with_errors
+
+    if cache_dir is not None:
+        key = cache_key(code)
+        ast = recall(key)
+        if ast is not None:
+            return ast
+        ast = load(cache_dir, code)
+        if ast is not None:
+            remember(key, ast)
+            return ast
+
+    ast, error_count = parse_with_errors(code)
+
+    # Parses that recovered from syntax errors are never cached, so the
+    # errors are reported again on the next run
+    if cache_dir is not None and ast and not error_count:
+        store(cache_dir, code, ast)
+        remember(key, ast)
+    return ast
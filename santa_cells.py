@@ -0,0 +1,63 @@
+# santa_cells.py
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def parse_type(var_type):
+    # 'GIFT<MERRY>' -> ('GIFT', 'MERRY'); plain types have no element type
+    if isinstance(var_type, str) and var_type.endswith('>') and '<' in var_type:
+        base_type, element_type = var_type[:-1].split('<', 1)
+        return base_type, element_type
+    return var_type, None
+
+
+class Cell:
+    # One declared variable. The declared type is split once, here, instead
+    # of being re-sliced on every assignment.
+    __slots__ = ('type', 'value', 'element_type', 'quantum', 'superposition')
+
+    def __init__(self, var_type, value=None):
+        self.type = var_type
+        self.value = value
+        if '<' in var_type:
+            base_type, element_type = parse_type(var_type)
+            self.quantum = base_type == 'QUANTUM_GIFT'
+            self.element_type = element_type if base_type == 'GIFT' else None
+        else:
+            self.quantum = False
+            self.element_type = None
+        self.superposition = self.quantum
+
+    @classmethod
+    def from_dict(cls, var):
+        if isinstance(var, cls):
+            return var
+        cell = cls(var['type'], var.get('value'))
+        if 'superposition' in var:
+            cell.superposition = var['superposition']
+        return cell
+
+    # Read-only mapping access for embedders that used the old dict variables
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def __repr__(self):
+        return f'Cell({self.type!r}, {self.value!r})'
+
+
+class LoopCell(Cell):
+    # FOR_EACH_CHILD's binding. Each pass refills the same cell instead of
+    # allocating a new one per child.
+    __slots__ = ()
+
+    def __init__(self, value=None):
+        self.type = 'TINSEL'
+        self.value = value
+        self.element_type = None
+        self.quantum = False
+        self.superposition = False
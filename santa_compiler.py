@@ -0,0 +1,774 @@
+# santa_compiler.py
+from santa_ast import line_of
+from santa_budget import BudgetExceeded
+from santa_cells import Cell, LoopCell
+from santa_stack import CallsTooDeep, TailCall
+from santa_vectors import gift_max, gift_min, typed_array
+
+ARITHMETIC_OPERATORS = {
+    'GIVE': lambda x, y: x + y,
+    'TAKE': lambda x, y: x - y,
+    'MULTIPLY_JOY': lambda x, y: x * y,
+    'SHARE': lambda x, y: x / y if y != 0 else float('inf'),  # Handle division by zero
+    'LEFTOVER_MAGIC': lambda x, y: x % y if y != 0 else float('inf'),
+    'POWER_OF_BELIEF': lambda x, y: x ** y,
+    'FLOOR_CHIMNEY': lambda x, y: x // y if y != 0 else float('inf'),
+    'ROUND_PRESENTS': lambda x, y: round(x, int(y)),
+    'MIN_GIFT': gift_min,
+    'MAX_GIFT': gift_max
+}
+
+COMPARISON_OPERATORS = {
+    'MORE_FESTIVE': lambda x, y: x > y,
+    'LESS_FESTIVE': lambda x, y: x < y,
+    'SAME_GIFT': lambda x, y: x == y
+}
+
+
+def declared_names(statements):
+    # Resolver pass: every name a block declares with WRAP or binds in
+    # FOR_EACH_CHILD, not descending into nested workshop definitions.
+    names = []
+    for statement in statements:
+        if not isinstance(statement, tuple):
+            continue
+        kind = statement[0]
+        if kind in ('declare', 'declare_quantum', 'declare_typed_array'):
+            names.append(statement[1])
+        elif kind == 'foreach':
+            names.append(statement[1])
+            names.extend(declared_names(statement[3]))
+        elif kind == 'if':
+            names.extend(declared_names(statement[2]))
+            names.extend(declared_names(statement[3]))
+        elif kind in ('while', 'count'):
+            names.extend(declared_names(statement[2]))
+        elif kind == 'try_catch':
+            names.extend(declared_names(statement[1]))
+            names.extend(declared_names(statement[2]))
+        elif kind == 'nested_conditional':
+            for block in statement[2]:
+                names.extend(declared_names(block))
+    return names
+
+
+class Scope:
+    # Slot layout of one workshop call or QUICK_ELF invocation. A nested
+    # scope keeps its defining frame in slot 0 to reach enclosing locals.
+
+    def __init__(self, names=(), parent=None):
+        self.parent = parent
+        self.slots = {}
+        self.size = 0 if parent is None else 1
+        for name in names:
+            if name not in self.slots:
+                self.slots[name] = self.size
+                self.size += 1
+
+    def resolve(self, name):
+        depth = 0
+        scope = self
+        while scope is not None:
+            slot = scope.slots.get(name)
+            if slot is not None:
+                return depth, slot
+            depth += 1
+            scope = scope.parent
+        return None
+
+
+class CompiledWorkshop:
+    __slots__ = ('run', 'frame_size', 'param_slots')
+
+    def __init__(self, run, frame_size, param_slots):
+        self.run = run
+        self.frame_size = frame_size
+        self.param_slots = param_slots
+
+
+class SantaCompiler:
+    # Turns parser tuples into pre-bound closures once, so loops and workshop
+    # calls never re-dispatch on node tags. Every closure takes the current
+    # frame (None at top level). Statements return None to fall through, or
+    # a 1-tuple holding the value a workshop DELIVERs.
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self.in_workshop = False
+        self.scope = None
+        self.tail_calls = False  # DELIVER f(...) may hand back a TailCall
+        # id(assign statement) -> (statement, declared type), from santa_infer
+        self.proven_stores = {}
+        # A santa_profile.Profiler while profiling. Only checked as code is
+        # compiled, so unprofiled programs pay nothing at run time.
+        self.profiler = None
+        # A santa_budget.Budget whose step limits loop bodies are charged
+        # against, compiled in the same way
+        self.budget = None
+
+    def compile_program(self, ast):
+        if not isinstance(ast, list):
+            ast = [ast]
+        return self.compile_block(ast)
+
+    def compile_async_program(self, ast):
+        # Top-level steps for execute_async, which may pause on AWAIT_CHRISTMAS.
+        # An AWAIT_CHRISTMAS it couldn't pause on is refused before anything runs.
+        if not isinstance(ast, list):
+            ast = [ast]
+        misplaced = misplaced_await(ast)
+        if misplaced is not None:
+            line = line_of(misplaced)
+            where = f" on line {line}" if line is not None else ""
+            raise RuntimeError(f"❌ Ho ho NO! AWAIT_CHRISTMAS{where} can only pause at the top level of a "
+                               "MAGIC_WORKSHOP or program!")
+        return self._magic_steps(ast)
+
+    def compile_workshop(self, params, body, name=None):
+        scope = Scope([param_name for _, param_name in params] + declared_names(body))
+        param_slots = tuple(scope.slots[param_name] for _, param_name in params)
+        run = self.compile_in_scope(scope, True, self.compile_block, body, tail_calls=True)
+        if self.profiler is not None and name is not None:
+            run = self.profiler.wrap_workshop(run, name)
+        return CompiledWorkshop(run, scope.size, param_slots)
+
+    def compile_magic_workshop(self, params, body):
+        # Magic workshops run as a list of steps so the scheduler can pause
+        # between them on AWAIT_CHRISTMAS
+        scope = Scope([param_name for _, param_name in params] + declared_names(body))
+        param_slots = tuple(scope.slots[param_name] for _, param_name in params)
+        steps = self.compile_in_scope(scope, True, self._magic_steps, body)
+        return CompiledWorkshop(steps, scope.size, param_slots)
+
+    def compile_in_scope(self, scope, in_workshop, compile_fn, node, tail_calls=False):
+        previous = self.scope, self.in_workshop, self.tail_calls
+        self.scope, self.in_workshop, self.tail_calls = scope, in_workshop, tail_calls
+        try:
+            return compile_fn(node)
+        finally:
+            self.scope, self.in_workshop, self.tail_calls = previous
+
+    def proven_type(self, statement):
+        # The target's declared type if the assignment was proven to fit it
+        proven = self.proven_stores.get(id(statement))
+        if proven is None or proven[0] is not statement:
+            return None
+        return proven[1]
+
+    def compile_block(self, statements):
+        compiled = tuple(self.compile_statement(stmt) for stmt in statements)
+
+        def run_block(frame):
+            for stmt in compiled:
+                try:
+                    result = stmt(frame)
+                except (ValueError, ZeroDivisionError, TypeError, BudgetExceeded, RecursionError):
+                    raise
+                except Exception as e:
+                    print(f"❌ Ho ho NO! {str(e)}")
+                    continue
+                if result is not None:
+                    return result
+            return None
+
+        return run_block
+
+    def compile_loop_body(self, block):
+        # Under a step or time budget each pass pays for the body's
+        # statements, so a runaway loop stops at its back-edge
+        block_fn = self.compile_block(block)
+        if self.budget is None or not self.budget.counts_steps:
+            return block_fn
+        return self.budget.charged(block_fn, len(block) or 1)
+
+    def compile_statement(self, statement):
+        if not isinstance(statement, tuple):
+            return _noop
+
+        handler = getattr(self, f'_stmt_{statement[0]}', None)
+        if handler is None:
+            return _noop
+        statement_fn = handler(statement)
+        if self.profiler is not None and line_of(statement) is not None:
+            return self.profiler.wrap_statement(statement_fn, line_of(statement))
+        return statement_fn
+
+    def compile_expression(self, expression):
+        if not isinstance(expression, tuple):
+            return _constant(expression)
+
+        handler = getattr(self, f'_expr_{expression[0]}', None)
+        if handler is None:
+            return _constant(None)
+        return handler(expression)
+
+    # Name resolution
+
+    def cell_getter(self, name):
+        # Returns frame -> variable dict, or None when the name is unbound
+        rt = self.runtime
+        resolved = self.scope.resolve(name) if self.scope is not None else None
+
+        if resolved is None:
+            def global_cell(frame):
+                return rt.variables.get(name)
+            return global_cell
+
+        depth, slot = resolved
+
+        if depth == 0:
+            def frame_cell(frame):
+                var = frame[slot]
+                if var is None:
+                    return rt.variables.get(name)
+                return var
+            return frame_cell
+
+        def enclosing_cell(frame):
+            for _ in range(depth):
+                frame = frame[0]
+            var = frame[slot]
+            if var is None:
+                return rt.variables.get(name)
+            return var
+
+        return enclosing_cell
+
+    def cell_setter(self, name):
+        # Returns (frame, variable dict) -> None for declarations and bindings
+        rt = self.runtime
+        resolved = self.scope.resolve(name) if self.scope is not None else None
+
+        if resolved is None:
+            def set_global(frame, var):
+                rt.variables[name] = var
+            return set_global
+
+        depth, slot = resolved
+
+        def set_local(frame, var):
+            for _ in range(depth):
+                frame = frame[0]
+            frame[slot] = var
+
+        return set_local
+
+    # Statements
+
+    def _stmt_workshop(self, statement):
+        rt = self.runtime
+        name, params, ret_type, body = statement[1:]
+        code = self.compile_workshop(params, body, name)
+
+        def define_workshop(frame):
+            rt.workshops[name] = {
+                'params': params,
+                'return_type': ret_type,
+                'body': body,
+                'name': name,  # Add name to help with error messages
+                'code': code
+            }
+
+        return define_workshop
+
+    def _stmt_magic_workshop(self, statement):
+        rt = self.runtime
+        name, params, body = statement[1:]
+        code = self.compile_magic_workshop(params, body)
+
+        def define_magic_workshop(frame):
+            rt.workshops[name] = {
+                'params': params,
+                'body': body,
+                'is_magic': True,
+                'code': code
+            }
+
+        return define_magic_workshop
+
+    def _magic_steps(self, body):
+        # (kind, step, target) for each statement. await, deliver and assign
+        # steps give a value the runner may wait on first; an assign's target
+        # is (cell getter, name).
+        steps = []
+        for stmt in body:
+            if isinstance(stmt, tuple) and stmt[0] in ('await', 'deliver', 'assign'):
+                step = self.compile_expression(stmt[-1])
+                if self.profiler is not None and line_of(stmt) is not None:
+                    step = self.profiler.wrap_statement(step, line_of(stmt))
+                target = (self.cell_getter(stmt[1]), stmt[1]) if stmt[0] == 'assign' else None
+                steps.append((stmt[0], step, target))
+            else:
+                steps.append(('statement', self.compile_block([stmt]), None))
+        return tuple(steps)
+
+    def _stmt_declare(self, statement):
+        rt = self.runtime
+        _, name, var_type = statement
+        set_cell = self.cell_setter(name)
+
+        def declare(frame):
+            set_cell(frame, Cell(var_type, rt.get_default_value(var_type)))
+
+        return declare
+
+    def _stmt_declare_quantum(self, statement):
+        _, name, base_type = statement
+        var_type = f'QUANTUM_GIFT<{base_type}>'
+        set_cell = self.cell_setter(name)
+
+        def declare_quantum(frame):
+            set_cell(frame, Cell(var_type))
+
+        return declare_quantum
+
+    def _stmt_declare_typed_array(self, statement):
+        _, name, element_type = statement
+        var_type = f'GIFT<{element_type}>'
+        set_cell = self.cell_setter(name)
+
+        def declare_typed_array(frame):
+            set_cell(frame, Cell(var_type, typed_array(element_type)))
+
+        return declare_typed_array
+
+    def _stmt_assign(self, statement):
+        rt = self.runtime
+        store_cell = rt.store_cell
+        _, name, value = statement
+        value_fn = self.compile_expression(value)
+        get_cell = self.cell_getter(name)
+        var_type = self.proven_type(statement)
+
+        if var_type is not None:
+            def assign_proven(frame):
+                # Skips the type check while the cell is still the declared
+                # one. A workshop's result may be None if it ran off its end.
+                evaluated_value = value_fn(frame)
+                var = get_cell(frame)
+                if var is not None and var.type == var_type and evaluated_value is not None:
+                    var.value = evaluated_value
+                    return
+                if var is None:
+                    raise NameError(f"❌ Ho ho NO! Variable '{name}' not declared!")
+                store_cell(var, name, evaluated_value)
+            return assign_proven
+
+        def assign(frame):
+            evaluated_value = value_fn(frame)
+            var = get_cell(frame)
+            if var is None:
+                raise NameError(f"❌ Ho ho NO! Variable '{name}' not declared!")
+            store_cell(var, name, evaluated_value)
+
+        return assign
+
+    def _stmt_deliver(self, statement):
+        if self.tail_calls and is_tail_call(statement[1]):
+            return self._tail_call(statement[1])
+        value_fn = self.compile_expression(statement[1])
+
+        if self.in_workshop:
+            def deliver_result(frame):
+                return (value_fn(frame),)
+            return deliver_result
+
+        sink = self.runtime.deliver
+
+        def deliver(frame):
+            sink(str(value_fn(frame)))
+
+        return deliver
+
+    def _tail_call(self, expression):
+        # DELIVERing a script workshop's call hands the callee back to
+        # run_workshop, which runs it in place of this call. Arguments are
+        # evaluated and the name looked up here, so errors surface in the
+        # caller just as for an ordinary call.
+        rt = self.runtime
+        call_workshop = rt.call_workshop
+        _, name, args = expression
+        arg_fns = tuple(self.compile_expression(arg) for arg in args)
+
+        def deliver_tail_call(frame):
+            evaluated_args = [arg_fn(frame) for arg_fn in arg_fns]
+            workshop = rt.workshops.get(name)
+            if workshop is None or 'code' not in workshop or 'wrapper' in workshop or workshop.get('is_magic'):
+                return (call_workshop(name, evaluated_args),)
+            return (TailCall(workshop, evaluated_args),)
+
+        return deliver_tail_call
+
+    def _stmt_if(self, statement):
+        _, condition, true_block, false_block = statement
+        condition_fn = self.compile_expression(condition)
+        true_fn = self.compile_block(true_block)
+        false_fn = self.compile_block(false_block)
+
+        def run_if(frame):
+            if condition_fn(frame):
+                return true_fn(frame)
+            return false_fn(frame)
+
+        return run_if
+
+    def _stmt_while(self, statement):
+        _, condition, block = statement
+        condition_fn = self.compile_expression(condition)
+        block_fn = self.compile_loop_body(block)
+
+        def run_while(frame):
+            while condition_fn(frame):
+                result = block_fn(frame)
+                if result is not None:
+                    return result
+            return None
+
+        return run_while
+
+    def _stmt_foreach(self, statement):
+        _, var_name, iterable, block = statement
+        iterable_fn = self.compile_expression(iterable)
+        loop_fn = self.compile_foreach_loop(var_name, block)
+
+        def run_foreach(frame):
+            return loop_fn(frame, iterable_fn(frame))
+
+        return run_foreach
+
+    def compile_foreach_loop(self, var_name, block):
+        # A FOR_EACH_CHILD once its iterable is known: loop_fn(frame, iterable)
+        block_fn = self.compile_loop_body(block)
+        set_cell = self.cell_setter(var_name)
+
+        def foreach_loop(frame, iterable):
+            # Children are pulled one at a time, so lazy stockings and
+            # CANDY_CANE ranges never materialise
+            cell = LoopCell()
+            for item in iterable:
+                cell.value = item
+                set_cell(frame, cell)
+                result = block_fn(frame)
+                if result is not None:
+                    return result
+            return None
+
+        return foreach_loop
+
+    def _stmt_count(self, statement):
+        _, count, block = statement
+        count_fn = self.compile_expression(count)
+        loop_fn = self.compile_count_loop(block)
+
+        def run_count(frame):
+            return loop_fn(frame, count_fn(frame))
+
+        return run_count
+
+    def compile_count_loop(self, block):
+        # An AROUND_THE_CHRISTMAS_TREE once its count is known: loop_fn(frame, count)
+        block_fn = self.compile_loop_body(block)
+
+        def count_loop(frame, count):
+            for _ in loop_range(count):
+                result = block_fn(frame)
+                if result is not None:
+                    return result
+            return None
+
+        return count_loop
+
+    def _stmt_try_catch(self, statement):
+        _, try_block, catch_block = statement
+        # A call made in the try block has to finish inside it to be caught
+        tail_calls, self.tail_calls = self.tail_calls, False
+        try:
+            try_fn = self.compile_block(try_block)
+        finally:
+            self.tail_calls = tail_calls
+        catch_fn = self.compile_block(catch_block)
+
+        def run_try_catch(frame):
+            try:
+                return try_fn(frame)
+            except (BudgetExceeded, CallsTooDeep):
+                raise
+            except Exception:
+                return catch_fn(frame)
+
+        return run_try_catch
+
+    def _stmt_decorator(self, statement):
+        rt = self.runtime
+        decorator_name, workshop = statement[1], statement[2]
+        arg_fns = [self.compile_expression(arg) for arg in statement[3]] if len(statement) > 3 else []
+
+        def run_decorator(frame):
+            rt.decorate(decorator_name, workshop, [fn(frame) for fn in arg_fns])
+
+        return run_decorator
+
+    def _stmt_await(self, statement):
+        # Only reached outside the step runner, so the wait has to block
+        wait_blocking = self.runtime.wait_blocking
+        value_fn = self.compile_expression(statement[1])
+
+        def run_await(frame):
+            wait_blocking(value_fn(frame))
+
+        return run_await
+
+    def _stmt_lambda(self, statement):
+        return _noop  # Lambda definitions don't need immediate execution
+
+    def _stmt_nested_conditional(self, statement):
+        _, conditions, blocks = statement
+        branches = tuple(
+            (self.compile_expression(condition), self.compile_block(block))
+            for condition, block in zip(conditions, blocks)
+        )
+        else_fn = self.compile_block(blocks[-1]) if len(blocks) > len(conditions) else None
+
+        def run_nested_conditional(frame):
+            for condition_fn, block_fn in branches:
+                if condition_fn(frame):
+                    return block_fn(frame)
+            if else_fn is not None:
+                return else_fn(frame)
+            return None
+
+        return run_nested_conditional
+
+    def _stmt_method_call(self, statement):
+        call = self._expr_method_call(statement)
+
+        def run_method_call(frame):
+            call(frame)
+
+        return run_method_call
+
+    def _stmt_function_call(self, statement):
+        call = self._expr_function_call(statement)
+
+        def run_function_call(frame):
+            call(frame)
+
+        return run_function_call
+
+    # Expressions
+
+    def _expr_value(self, expression):
+        value = expression[1]
+        if not isinstance(value, str):
+            return _constant(value)
+
+        rt = self.runtime
+        resolved = self.scope.resolve(value) if self.scope is not None else None
+
+        if resolved is None:
+            def load_global(frame):
+                var = rt.variables.get(value)
+                if var is None:
+                    return value
+                return var.value
+            return load_global
+
+        if resolved[0] == 0:
+            slot = resolved[1]
+
+            def load_local(frame):
+                var = frame[slot]
+                if var is None:
+                    var = rt.variables.get(value)
+                    if var is None:
+                        return value
+                return var.value
+
+            return load_local
+
+        get_cell = self.cell_getter(value)
+
+        def load_enclosing(frame):
+            var = get_cell(frame)
+            if var is None:
+                return value
+            return var.value
+
+        return load_enclosing
+
+    def _expr_arithmetic(self, expression):
+        _, op, left, right = expression
+        operator_fn = ARITHMETIC_OPERATORS[op]
+        left_fn = self.compile_expression(left)
+        right_fn = self.compile_expression(right)
+
+        def arithmetic(frame):
+            try:
+                return operator_fn(left_fn(frame), right_fn(frame))
+            except ZeroDivisionError:
+                raise ValueError("Cannot divide by zero!")
+
+        return arithmetic
+
+    def _expr_comparison(self, expression):
+        _, op, left, right = expression
+        operator_fn = COMPARISON_OPERATORS[op]
+        left_fn = self.compile_expression(left)
+        right_fn = self.compile_expression(right)
+
+        def comparison(frame):
+            return operator_fn(left_fn(frame), right_fn(frame))
+
+        return comparison
+
+    def _expr_array(self, expression):
+        item_fns = tuple(self.compile_expression(item) for item in expression[1])
+
+        def array(frame):
+            return [item_fn(frame) for item_fn in item_fns]
+
+        return array
+
+    def _expr_dictionary(self, expression):
+        entries = tuple((key, self.compile_expression(value)) for key, value in expression[1])
+
+        def dictionary(frame):
+            return {key: value_fn(frame) for key, value_fn in entries}
+
+        return dictionary
+
+    def _expr_dictionary_access(self, expression):
+        _, dict_name, key = expression
+        key_fn = self.compile_expression(key)
+        get_cell = self.cell_getter(dict_name)
+
+        def dictionary_access(frame):
+            var = get_cell(frame)
+            if var is None:
+                raise KeyError(dict_name)
+            return var.value[key_fn(frame)]
+
+        return dictionary_access
+
+    def _expr_boolean(self, expression):
+        return _constant(expression[1])
+
+    def _expr_method_call(self, expression):
+        invoke_method = self.runtime.invoke_method
+        _, obj_name, method_name, args = expression
+        arg_fns = tuple(self.compile_expression(arg) for arg in args)
+
+        if isinstance(obj_name, tuple) and obj_name[0] == 'method_result':
+            # Handle chained method calls
+            inner_fn = self.compile_expression(obj_name[1])
+
+            def chained_method_call(frame):
+                intermediate_result = inner_fn(frame)
+                if isinstance(intermediate_result, dict) and 'type' in intermediate_result:
+                    intermediate_result = intermediate_result['value']
+                return invoke_method(intermediate_result, method_name, [arg_fn(frame) for arg_fn in arg_fns])
+
+            return chained_method_call
+
+        if not isinstance(obj_name, str):
+            raise ValueError("❌ Ho ho NO! Invalid method call!")
+
+        get_cell = self.cell_getter(obj_name)
+
+        def method_call(frame):
+            var = get_cell(frame)
+            if var is None:
+                raise NameError(f"❌ Ho ho NO! Object '{obj_name}' not found!")
+            if method_name == 'MEASURE' and var.superposition:
+                return var.value
+            return invoke_method(var.value, method_name, [arg_fn(frame) for arg_fn in arg_fns])
+
+        return method_call
+
+    def _expr_function_call(self, expression):
+        call_workshop = self.runtime.call_workshop
+        name, args = expression[1:]
+        arg_fns = tuple(self.compile_expression(arg) for arg in args)
+
+        if isinstance(name, tuple) and name[0] == 'function_composition':
+            functions = tuple(name[1])
+        elif isinstance(name, str) and '.' in name:
+            functions = tuple(name.split('.'))
+        else:
+            def function_call(frame):
+                return call_workshop(name, [arg_fn(frame) for arg_fn in arg_fns])
+            return function_call
+
+        def composed_call(frame):
+            result = call_workshop(functions[0], [arg_fn(frame) for arg_fn in arg_fns])
+            for func in functions[1:]:
+                result = call_workshop(func, [result])
+            return result
+
+        return composed_call
+
+    def _expr_lambda(self, expression):
+        param, body = expression[1:]
+        scope = Scope([param], parent=self.scope) if self.scope is not None else Scope([param])
+        slot = scope.slots[param]
+        body_fn = self.compile_in_scope(scope, self.in_workshop, self.compile_expression, body)
+        size = scope.size
+
+        def make_lambda(frame):
+            def quick_elf(x):
+                lambda_frame = [None] * size
+                if slot:
+                    lambda_frame[0] = frame
+                lambda_frame[slot] = Cell('MERRY', x)
+                return body_fn(lambda_frame)
+            return quick_elf
+
+        return make_lambda
+
+
+def is_tail_call(expression):
+    # DELIVER of a single, uncomposed workshop call
+    return (isinstance(expression, tuple) and expression[0] == 'function_call'
+            and isinstance(expression[1], str) and '.' not in expression[1])
+
+
+def misplaced_await(statements):
+    # The first AWAIT_CHRISTMAS in statements that isn't itself one of them
+    # or a top-level statement of a MAGIC_WORKSHOP among them
+    for statement in statements:
+        if not isinstance(statement, tuple) or statement[0] == 'await':
+            continue
+        if statement[0] == 'magic_workshop':
+            found = misplaced_await(statement[3])
+        else:
+            found = _find_await(statement[1:])
+        if found is not None:
+            return found
+    return None
+
+
+def _find_await(node):
+    if isinstance(node, tuple) and node and node[0] == 'await':
+        return node
+    if isinstance(node, (tuple, list)):
+        for item in node:
+            found = _find_await(item)
+            if found is not None:
+                return found
+    return None
+
+
+def loop_range(count):
+    # AROUND_THE_CHRISTMAS_TREE takes a count, or any stocking to go round
+    # once per child
+    return range(count) if isinstance(count, int) else count
+
+
+def _noop(frame):
+    return None
+
+
+def _constant(value):
+    def constant(frame):
+        return value
+    return constant
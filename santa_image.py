@@ -0,0 +1,89 @@
+# santa_image.py
+import os
+import pickle
+import tempfile
+from santa_cache import grammar_version
+from santa_optimizer import TEMP_PREFIX
+
+# Bump when the layout of an image changes
+IMAGE_FORMAT = 1
+# Compiled code is rebuilt from the body the first time a workshop is called
+COMPILED_KEYS = frozenset(['code', 'vmcode'])
+
+
+class ImageError(ValueError):
+    pass
+
+
+def snapshot(runtime):
+    # The state a later run needs: declared variables, script workshops with
+    # their bodies, and the decorators to apply again. Builtin workshops come
+    # with every runtime, and the optimizer's hoisted temporaries are only
+    # meaningful inside the loops that made them, so those are left out.
+    variables = {name: cell for name, cell in runtime.variables.items() if not name.startswith(TEMP_PREFIX)}
+    workshops = {}
+    decorations = []
+    for name, entry in runtime.workshops.items():
+        if 'decorator' in entry:
+            decorations.append(entry['decorator'])
+        elif entry.get('wrapper') is None or entry['wrapper'] is not runtime.builtin_workshops.get(name):
+            workshops[name] = {key: value for key, value in entry.items() if key not in COMPILED_KEYS}
+    return {'variables': variables, 'workshops': workshops, 'decorations': decorations}
+
+
+def save_image(runtime, path):
+    # A header checked before anything else is read, then the snapshot.
+    # Written to a temp file and renamed, like cache entries.
+    header = {'format': IMAGE_FORMAT, 'grammar': grammar_version()}
+    state = snapshot(runtime)
+    try:
+        data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        raise ImageError(f"❌ Ho ho NO! Can't save {_unpicklable(state)} in an image: {e}") from None
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _unpicklable(state):
+    # The first variable or workshop that can't be pickled, for the error
+    for kind in ('variables', 'workshops'):
+        for name, value in state[kind].items():
+            try:
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                return name
+    return 'a decorator argument'
+
+
+def load_image(runtime, path):
+    # Restores an image into runtime, which should be fresh. Either backend
+    # can load an image saved by either. Images are pickles, so only load
+    # ones you trust.
+    with open(path, 'rb') as f:
+        header = _read(f, path)
+        if not isinstance(header, dict) or header.get('format') != IMAGE_FORMAT:
+            raise ImageError(f"❌ Ho ho NO! {path} is not a Santa Script image!")
+        if header.get('grammar') != grammar_version():
+            raise ImageError(f"❌ Ho ho NO! {path} was saved by another version of Santa Script!")
+        state = _read(f, path)
+
+    runtime.variables.update(state['variables'])
+    runtime.workshops.update(state['workshops'])
+    for decorator_name, workshop, args in state['decorations']:
+        runtime.decorate(decorator_name, workshop, args)
+    return runtime
+
+
+def _read(f, path):
+    try:
+        return pickle.load(f)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ValueError, ImportError):
+        raise ImageError(f"❌ Ho ho NO! {path} is not a Santa Script image!") from None
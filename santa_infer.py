@@ -0,0 +1,306 @@
+# santa_infer.py
+from santa_cells import parse_type
+from santa_compiler import declared_names
+from santa_io import candy_cane
+from santa_vectors import VECTOR_TYPES
+
+# Declared types a variable's value can be trusted to hold when it's read
+# back. GIFT, SLEIGH and SNOWFLAKE may hold a dict, which store_cell treats
+# specially, and PACK can put any child into a typed GIFT in place.
+VALUE_TYPES = frozenset(['MERRY', 'SPARKLE', 'JINGLE', 'TINSEL', 'SPIRIT', 'STOCKING'])
+# Values of the types on the right also pass the built-in check on the left
+WIDER_TYPES = {
+    'MERRY': frozenset(['SPARKLE', 'JINGLE', 'SPIRIT']),
+    'GIFT': frozenset(['TINSEL']),
+    'SNOWFLAKE': VALUE_TYPES,
+}
+# Operators that always give a number when both sides are numbers
+NUMBER_OPERATORS = frozenset(['GIVE', 'TAKE', 'MULTIPLY_JOY', 'SHARE', 'LEFTOVER_MAGIC', 'FLOOR_CHIMNEY',
+                              'ROUND_PRESENTS', 'MIN_GIFT', 'MAX_GIFT'])
+# ... of which these give a float whenever either side is one
+FLOAT_OPERATORS = frozenset(['GIVE', 'TAKE', 'MULTIPLY_JOY'])
+WORKSHOP_KINDS = frozenset(['workshop', 'magic_workshop'])
+BINDING_KINDS = frozenset(['declare', 'declare_quantum', 'declare_typed_array', 'foreach', 'lambda'])
+
+
+def prove_stores(ast, runtime):
+    # Maps id(statement) to (statement, declared type) for each assignment
+    # whose value is known to pass its target's type check
+    if not isinstance(ast, list):
+        ast = [ast]
+    return StoreProver(ast, runtime).prove()
+
+
+class StoreProver:
+    # Walks a program once per workshop body, in order, tracking which names
+    # are definitely declared at each statement and with what type. Facts
+    # about an expression's value are small tuples:
+    #   ('literal', value)  the value itself
+    #   ('type', T)         passes the check for declared type T
+    #   ('result', T)       a workshop call that passes T's check, or None if
+    #                       the workshop ran off its end without DELIVERing
+    #   ('array', facts)    a fresh list, one fact per child
+    #   ('dictionary',)     a fresh dict with no 'type' key
+
+    def __init__(self, ast, runtime):
+        self.ast = ast
+        self.runtime = runtime
+        # Types still checked by the built-in checks, whose behaviour the
+        # rules here are written against
+        self.builtin_types = runtime.builtin_types()
+        self.value_types = VALUE_TYPES & self.builtin_types
+        self.workshops = []
+        self.names = set(runtime.variables)
+        self.arities = {}
+        self.decorated = set()
+        _survey(ast, self.workshops, self.names, self.arities, self.decorated)
+        self.returns = {}
+        self.proven = {}
+
+    def prove(self):
+        self.returns = self.trusted_returns()
+        self.proven = {}
+        self.block(self.ast, {}, None)
+        for statement in self.workshops:
+            self.block(statement[-1], self.workshop_env(statement), None)
+        return self.proven
+
+    def trusted_returns(self):
+        # Workshops whose RETURNS type holds for every DELIVER in every
+        # definition. Each starts trusted and is dropped once one of its
+        # DELIVERs can't be shown to fit, until nothing changes, so recursive
+        # workshops can rely on their own result.
+        definitions = {}
+        untrusted = set(self.runtime.builtin_workshops)
+        for statement in self.workshops:
+            if statement[0] == 'workshop' and statement[1] not in self.decorated:
+                definitions.setdefault(statement[1], []).append(statement)
+            else:
+                untrusted.add(statement[1])
+        for name, entry in self.runtime.workshops.items():
+            if 'body' not in entry:
+                untrusted.add(name)
+
+        returns = {}
+        for name, statements in definitions.items():
+            return_types = {statement[3] for statement in statements}
+            if name not in untrusted and len(return_types) == 1 and None not in return_types:
+                returns[name] = return_types.pop()
+
+        while True:
+            self.returns = returns
+            failed = [name for name in returns if not self.honours(name, returns[name], definitions[name])]
+            if not failed:
+                return returns
+            returns = {name: return_type for name, return_type in returns.items() if name not in failed}
+
+    def honours(self, name, return_type, statements):
+        for statement in statements:
+            delivered = []
+            self.block(statement[4], self.workshop_env(statement), delivered)
+            if not all(self.fits(fact, return_type) for fact in delivered):
+                return False
+        return True
+
+    def workshop_env(self, statement):
+        # Parameters are checked as they're bound, but only hold their value
+        # if every call passes one for each of them
+        params = statement[2]
+        bound = self.arities.get(statement[1], set()) <= {len(params)}
+        env = {}
+        for param_type, param_name in params:
+            fact = ('type', param_type) if bound and param_type in self.value_types else None
+            env[param_name] = (param_type, fact)
+        return env
+
+    # Statements. env maps each definitely declared name to (declared type,
+    # fact about its value); delivered collects facts about DELIVERed values
+    # inside a workshop body.
+
+    def block(self, statements, env, delivered):
+        for statement in statements:
+            if not isinstance(statement, tuple):
+                continue
+            kind = statement[0]
+            if kind == 'declare':
+                _, name, var_type = statement
+                env[name] = (var_type, ('type', var_type) if var_type in self.value_types else None)
+            elif kind == 'declare_typed_array':
+                env[statement[1]] = (f'GIFT<{statement[2]}>', None)
+            elif kind == 'declare_quantum':
+                env.pop(statement[1], None)
+            elif kind == 'assign':
+                _, name, value = statement
+                binding = env.get(name)
+                if binding is not None and self.fits(self.infer(value, env), binding[0]):
+                    self.proven[id(statement)] = (statement, binding[0])
+            elif kind == 'deliver':
+                if delivered is not None:
+                    delivered.append(self.infer(statement[1], env))
+            elif kind in ('if', 'nested_conditional', 'while', 'count', 'foreach', 'try_catch'):
+                self.compound(statement, env, delivered)
+
+    def compound(self, statement, env, delivered):
+        # Inner blocks may run any number of times, or stop part way, so
+        # whatever they declare or bind is unknown inside them until it's
+        # declared again, and unknown after them
+        for name in declared_names([statement]):
+            env.pop(name, None)
+        kind = statement[0]
+        if kind == 'foreach':
+            _, var_name, iterable, body = statement
+            body_env = dict(env)
+            body_env[var_name] = (None, self.child_fact(iterable))
+            self.block(body, body_env, delivered)
+        elif kind == 'if':
+            self.block(statement[2], dict(env), delivered)
+            self.block(statement[3], dict(env), delivered)
+        elif kind in ('while', 'count'):
+            self.block(statement[2], dict(env), delivered)
+        elif kind == 'try_catch':
+            self.block(statement[1], dict(env), delivered)
+            self.block(statement[2], dict(env), delivered)
+        else:
+            for block in statement[2]:
+                self.block(block, dict(env), delivered)
+
+    def child_fact(self, iterable):
+        # CANDY_CANE counts in whole numbers, unless a script or embedder
+        # has put another workshop in its place
+        if (isinstance(iterable, tuple) and iterable[0] == 'function_call' and iterable[1] == 'CANDY_CANE'
+                and 'MERRY' in self.builtin_types and self.counts()):
+            return ('type', 'MERRY')
+        return None
+
+    def counts(self):
+        entry = self.runtime.workshops.get('CANDY_CANE')
+        return (entry is not None and entry.get('wrapper') is candy_cane
+                and not any(statement[1] == 'CANDY_CANE' for statement in self.workshops))
+
+    # Expressions
+
+    def infer(self, expression, env):
+        if not isinstance(expression, tuple):
+            return None if isinstance(expression, (list, dict)) else ('literal', expression)
+        kind = expression[0]
+        if kind == 'value':
+            value = expression[1]
+            if not isinstance(value, str):
+                return ('literal', value)
+            if value in env:
+                return env[value][1]
+            # A name nothing ever declares evaluates to itself
+            return None if value in self.names else ('literal', value)
+        if kind == 'boolean':
+            return ('literal', expression[1])
+        if kind == 'arithmetic':
+            return self.arithmetic(expression[1], self.infer(expression[2], env), self.infer(expression[3], env))
+        if kind == 'comparison':
+            left, right = self.infer(expression[2], env), self.infer(expression[3], env)
+            if _scalar(left) and _scalar(right) and 'JINGLE' in self.builtin_types:
+                return ('type', 'JINGLE')
+            return None
+        if kind == 'array':
+            return ('array', tuple(self.infer(item, env) for item in expression[1]))
+        if kind == 'dictionary':
+            if any(key == 'type' for key, _ in expression[1]):
+                return None
+            return ('dictionary',)
+        if kind == 'function_call':
+            return_type = self.returns.get(expression[1]) if isinstance(expression[1], str) else None
+            return None if return_type is None else ('result', return_type)
+        return None
+
+    def arithmetic(self, op, left, right):
+        left_number, right_number = _number(left), _number(right)
+        if op in NUMBER_OPERATORS and left_number and right_number:
+            if op == 'SHARE' or (op in FLOAT_OPERATORS and 'float' in (left_number, right_number)):
+                result = 'SPARKLE'
+            else:
+                result = 'MERRY'
+        elif op == 'GIVE' and _text(left) and _text(right):
+            result = 'TINSEL'
+        else:
+            return None
+        return ('type', result) if result in self.builtin_types else None
+
+    def fits(self, fact, target):
+        # Whether a value described by fact passes the check for target
+        if fact is None or target is None:
+            return False
+        kind = fact[0]
+        if kind == 'literal':
+            return not isinstance(fact[1], (list, dict)) and self.runtime.type_check(fact[1], target)
+        if kind in ('type', 'result'):
+            return fact[1] == target or (target in self.builtin_types
+                                         and fact[1] in WIDER_TYPES.get(target, ()))
+        if kind == 'dictionary':
+            return target in ('SLEIGH', 'GIFT', 'SNOWFLAKE') and target in self.builtin_types
+        # Arrays. Numeric GIFTs are left to store_cell, which packs them.
+        if target in ('GIFT', 'STOCKING', 'SNOWFLAKE'):
+            return target in self.builtin_types
+        # A workshop's result may be None, which the stores only let through
+        # as a whole value, never as a child.
+        base_type, element_type = parse_type(target)
+        return (base_type == 'GIFT' and element_type is not None and element_type not in VECTOR_TYPES
+                and target not in self.runtime.type_checks
+                and all(item is not None and item[0] != 'result' and self.fits(item, element_type)
+                        for item in fact[1]))
+
+
+def _survey(node, workshops, names, arities, decorated):
+    # Every workshop definition, every name anything binds, the number of
+    # arguments each workshop is called with, and which workshops are
+    # decorated. Composed calls pass one argument down the chain, so their
+    # workshops get no fixed count.
+    if isinstance(node, list):
+        for child in node:
+            _survey(child, workshops, names, arities, decorated)
+        return
+    if not isinstance(node, tuple) or not node:
+        return
+    kind = node[0]
+    if kind in WORKSHOP_KINDS and len(node) in (4, 5):
+        workshops.append(node)
+        names.update(param_name for _, param_name in node[2])
+    elif kind in BINDING_KINDS and len(node) > 1 and isinstance(node[1], str):
+        names.add(node[1])
+    elif kind == 'function_call' and len(node) == 3:
+        name, args = node[1], node[2]
+        if isinstance(name, str) and '.' not in name:
+            arities.setdefault(name, set()).add(len(args))
+        else:
+            functions = name[1] if isinstance(name, tuple) else name.split('.')
+            for function in functions:
+                arities.setdefault(function, set()).add(None)
+    elif kind == 'decorator' and len(node) > 2 and isinstance(node[2], tuple) and len(node[2]) > 1:
+        decorated.add(node[2][1])
+    for child in node:
+        _survey(child, workshops, names, arities, decorated)
+
+
+def _number(fact):
+    if fact is None:
+        return None
+    if fact[0] == 'literal':
+        value = fact[1]
+        if isinstance(value, float):
+            return 'float'
+        return 'int' if isinstance(value, int) else None
+    if fact[0] in ('type', 'result'):
+        if fact[1] == 'SPARKLE':
+            return 'float'
+        return 'number' if fact[1] in ('MERRY', 'JINGLE', 'SPIRIT') else None
+    return None
+
+
+def _text(fact):
+    if fact is None:
+        return False
+    if fact[0] == 'literal':
+        return isinstance(fact[1], str)
+    return fact[0] in ('type', 'result') and fact[1] == 'TINSEL'
+
+
+def _scalar(fact):
+    return _number(fact) is not None or _text(fact)
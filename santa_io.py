@@ -0,0 +1,134 @@
+# santa_io.py
+from array import array
+import csv
+from itertools import islice
+import json
+import mmap
+import os
+
+from santa_vectors import NumericGift
+
+# Typecodes BinaryGift accepts, by the element type they hold
+BINARY_TYPECODES = {'MERRY': 'q', 'SPARKLE': 'd'}
+CHUNK_ROWS = 64 * 1024
+
+
+def scalar(text):
+    # CSV fields come in as text; numbers are handed to scripts as numbers
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+class StreamStocking:
+    # A STOCKING whose children are read from a file one at a time while
+    # FOR_EACH_CHILD walks it. Every walk reopens the file, so it can be
+    # looped over more than once and never holds more than one row.
+    __slots__ = ('path', 'read')
+
+    def __init__(self, path, read):
+        self.path = path
+        self.read = read
+
+    def __iter__(self):
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            yield from self.read(f)
+
+    def __str__(self):
+        return f'<stocking {self.path}>'
+
+    __repr__ = __str__
+
+
+def _csv_rows(f):
+    for row in csv.DictReader(f):
+        yield {key: scalar(value) for key, value in row.items()}
+
+
+def _json_lines(f):
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def csv_stocking(path):
+    # CsvStocking("toys.csv"): one SLEIGH per row, keyed by the header
+    return StreamStocking(os.fspath(path), _csv_rows)
+
+
+def json_lines_stocking(path):
+    # JsonLinesStocking("deliveries.jsonl"): one value per non-blank line
+    return StreamStocking(os.fspath(path), _json_lines)
+
+
+def csv_column(path, column):
+    # CsvColumn("toys.csv", "count"): one numeric column as a GIFT<MERRY>,
+    # read in chunks straight into the buffer
+    gift = NumericGift()
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        try:
+            index = next(reader).index(column)
+        except (StopIteration, ValueError):
+            raise ValueError(f"❌ Ho ho NO! {path} has no column {column}!")
+        while True:
+            chunk = [row[index] for row in islice(reader, CHUNK_ROWS)]
+            if not chunk:
+                return gift
+            try:
+                values = list(map(int, chunk))
+            except ValueError:
+                values = [scalar(text) for text in chunk]
+            gift.extend(values)
+
+
+def binary_gift(path, element_type='MERRY'):
+    # BinaryGift("counts.bin"): a file of native 64-bit integers (or doubles
+    # for "SPARKLE") mapped read-only as a GIFT<MERRY>, without copying it
+    typecode = BINARY_TYPECODES.get(element_type)
+    if typecode is None:
+        raise ValueError(f"❌ Ho ho NO! BinaryGift can't hold {element_type}!")
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size % 8:
+            raise ValueError(f"❌ Ho ho NO! {path} is not a whole number of 8-byte values!")
+        if size == 0:
+            return NumericGift(array(typecode))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return NumericGift(memoryview(mapped).cast(typecode))
+
+
+def candy_cane(start, stop=None, step=1):
+    # CANDY_CANE(stop) or CANDY_CANE(start, stop, step): a lazy STOCKING of
+    # whole numbers, like Python's range
+    if stop is None:
+        return range(start)
+    return range(start, stop, step)
+
+
+class Snooze:
+    # SNOOZE(seconds): what AWAIT_CHRISTMAS sleeps on. A plain number is
+    # never a wait, so a workshop result that happens to be one can't become
+    # a sleep in one mode and not the other.
+    __slots__ = ('seconds',)
+
+    def __init__(self, seconds):
+        if not isinstance(seconds, (int, float)) or isinstance(seconds, bool):
+            raise TypeError("❌ Ho ho NO! SNOOZE takes a number of seconds!")
+        self.seconds = max(seconds, 0)
+
+    def __repr__(self):
+        return f'SNOOZE({self.seconds})'
+
+
+IO_WORKSHOPS = {
+    'CsvStocking': csv_stocking,
+    'JsonLinesStocking': json_lines_stocking,
+    'CsvColumn': csv_column,
+    'BinaryGift': binary_gift,
+}
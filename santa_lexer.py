@@ -1,5 +1,6 @@
 # santa_lexer.py
-import ply.lex as lex
+import functools
+import re
 
 OPERATORS = {
     'GIVE': '+',
@@ -58,133 +59,200 @@ tokens = (
     'DELIVER', 'QUANTUM_GIFT'
 )
 
-# Simple tokens
-t_DOT = r'\.'
-t_COMMA = r','
-t_LPAREN = r'\('
-t_RPAREN = r'\)'
-t_LBRACKET = r'\['
-t_RBRACKET = r'\]'
-t_LBRACE = r'\{'
-t_RBRACE = r'\}'
-t_COLON = r':'
-t_AT = r'@'
-t_LT = r'<'
-t_GT = r'>'
-t_ARROW = r'->'
-
-def t_NUMBER(t):
-    r'\d*\.?\d+'
-    try:
-        t.value = int(t.value)
-    except ValueError:
-        t.value = float(t.value)
-    return t
-
-def t_STRING(t):
-    r'\"([^\\\n]|(\\.))*?\"'
-    t.value = t.value[1:-1]
-    return t
-
-def t_IDENTIFIER(t):
-    r'[a-zA-Z_][a-zA-Z0-9_]*'
-    keywords = {
-        # Methods first (to prevent conflicts with declarations)
-        'WRAP_STRING': 'WRAP_STRING',
-        'SPARKLE': 'SPARKLE',
-        'UNTANGLE': 'UNTANGLE',
-        'COUNT_JOYS': 'COUNT_JOYS',
-        'TO_TINSEL': 'TO_TINSEL',
-        'TO_JINGLE': 'TO_JINGLE',
-        'TRIM_TREE': 'TRIM_TREE',
-        'JINGLE_CASE': 'JINGLE_CASE',
-        'SILENT_NIGHT': 'SILENT_NIGHT',
-        'GIFT_WRAP': 'GIFT_WRAP',
-        'FIND_CHIMNEY': 'FIND_CHIMNEY',
-        'REPLACE_COAL': 'REPLACE_COAL',
-        'PACK': 'PACK',
-        'PEEK_INSIDE': 'PEEK_INSIDE',
-        'UNWRAP': 'UNWRAP',
-        'MEASURE': 'MEASURE',
-
-        # Operators
-        'GIVE': 'GIVE',
-        'TAKE': 'TAKE',
-        'MULTIPLY_JOY': 'MULTIPLY_JOY',
-        'SHARE': 'SHARE',
-        'LEFTOVER_MAGIC': 'LEFTOVER_MAGIC',
-        'POWER_OF_BELIEF': 'POWER_OF_BELIEF',
-        'MORE_FESTIVE': 'MORE_FESTIVE',
-        'LESS_FESTIVE': 'LESS_FESTIVE',
-        'SAME_GIFT': 'SAME_GIFT',
-        'FLOOR_CHIMNEY': 'FLOOR_CHIMNEY',
-        'ROUND_PRESENTS': 'ROUND_PRESENTS',
-        'MIN_GIFT': 'MIN_GIFT',
-        'MAX_GIFT': 'MAX_GIFT',
-
-        # Declaration keywords
-        'WRAP_TEXT': 'WRAP_TEXT',  # Only one WRAP entry
-        'AS': 'AS',
-        'MERRY': 'MERRY',
-        'JINGLE': 'JINGLE',
-        'TINSEL': 'TINSEL',
-        'GIFT': 'GIFT',
-        'SPIRIT': 'SPIRIT',
-        'SNOWFLAKE': 'SNOWFLAKE',
-        'SLEIGH': 'SLEIGH',
-        'STOCKING': 'STOCKING',
-
-        # Control structures
-        'NICE': 'NICE',
-        'NAUGHTY': 'NAUGHTY',
-        'THEN': 'THEN',
-        'END_OF_LIST': 'END_OF_LIST',
-        'WHILE_CHRISTMAS_SPIRIT': 'WHILE_CHRISTMAS_SPIRIT',
-        'DO': 'DO',
-        'STILL_BELIEVING': 'STILL_BELIEVING',
-        'FOR_EACH_CHILD': 'FOR_EACH_CHILD',
-        'IN': 'IN',
-        'CHECKED_TWICE': 'CHECKED_TWICE',
-        'AROUND_THE_CHRISTMAS_TREE': 'AROUND_THE_CHRISTMAS_TREE',
-        'UNTIL_CHRISTMAS': 'UNTIL_CHRISTMAS',
-
-        # Functions
-        'WORKSHOP': 'WORKSHOP',
-        'OPENS': 'OPENS',
-        'CLOSES': 'CLOSES',
-        'RETURNS': 'RETURNS',
-        'MAGIC_WORKSHOP': 'MAGIC_WORKSHOP',
-        'AWAIT_CHRISTMAS': 'AWAIT_CHRISTMAS',
-        'QUICK_ELF': 'QUICK_ELF',
-
-        # Error handling
-        'BELIEVE': 'BELIEVE',
-        'DOUBT': 'DOUBT',
-        'KEEP_FAITH': 'KEEP_FAITH',
-
-        # Values
-        'HO': 'HO',
-        'NAH': 'NAH',
-
-        # Special keywords
-        'DELIVER': 'DELIVER',
-        'QUANTUM_GIFT': 'QUANTUM_GIFT',
-    }
-    t.type = keywords.get(t.value, 'IDENTIFIER')
-    return t
-
-t_ignore = ' \t'
-
-def t_newline(t):
-    r'\n+'
-    t.lexer.lineno += len(t.value)
-
-def t_COMMENT(t):
-    r'\#.*'
-    pass
-
-def t_error(t):
-    print(f"❌ Ho ho NO! Invalid character '{t.value[0]}' at line {t.lexer.lineno}")
-    t.lexer.skip(1)
-
-lexer = lex.lex()
\ No newline at end of file
+# Symbols, by token type. ARROW comes first so '->' never splits.
+PUNCTUATION = {
+    'ARROW': '->',
+    'DOT': '.',
+    'COMMA': ',',
+    'LPAREN': '(',
+    'RPAREN': ')',
+    'LBRACKET': '[',
+    'RBRACKET': ']',
+    'LBRACE': '{',
+    'RBRACE': '}',
+    'COLON': ':',
+    'AT': '@',
+    'LT': '<',
+    'GT': '>',
+}
+
+# Every other token is a word spelled the same as its type. Words that
+# aren't in here are IDENTIFIERs.
+KEYWORDS = {name: name for name in tokens if name not in PUNCTUATION and name not in ('IDENTIFIER', 'NUMBER', 'STRING')}
+BYTE_KEYWORDS = {name.encode('ascii'): name for name in KEYWORDS}
+
+# One pattern for the whole language. Each match skips the spaces and tabs
+# in front of a token, and m.lastindex says which group the token is.
+NEWLINES, COMMENT, FLOAT, INTEGER, STRING, WORD = range(1, 7)
+FIRST_SYMBOL = WORD + 1
+TOKEN_PATTERN = (
+    r'[ \t]*(?:'
+    r'(\n+)'
+    r'|(\#[^\n]*)'
+    r'|(\d*\.\d+)'
+    r'|(\d+)'
+    r'|("(?:[^\\\n]|\\.)*?")'
+    r'|([a-zA-Z_][a-zA-Z0-9_]*)'
+    + ''.join(f'|({re.escape(symbol)})' for symbol in PUNCTUATION.values()) +
+    r')'
+)
+# Characters no token can start with, reported as one run
+INVALID_PATTERN = r'[^ \t\na-zA-Z0-9_.,()\[\]{}:@<>"#\-]+'
+SYMBOL_TYPES = (None,) * FIRST_SYMBOL + tuple(PUNCTUATION)
+
+_TEXT_TOKEN = re.compile(TOKEN_PATTERN)
+_TEXT_INVALID = re.compile(INVALID_PATTERN)
+_BYTES_TOKEN = re.compile(TOKEN_PATTERN.encode('ascii'))
+_BYTES_INVALID = re.compile(INVALID_PATTERN.encode('ascii'))
+_SPACES = re.compile(r'[ \t]*')
+_BYTE_SPACES = re.compile(rb'[ \t]*')
+
+
+class LexToken:
+    # What the parser reads: the same fields as PLY's tokens. yacc sets
+    # lexer itself on the token it reports a syntax error at.
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self):
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+
+class LexError:
+    # One run of characters no token starts with
+    __slots__ = ('text', 'lineno', 'column', 'lexpos')
+
+    def __init__(self, text, lineno, column, lexpos):
+        self.text = text
+        self.lineno = lineno
+        self.column = column
+        self.lexpos = lexpos
+
+    def __str__(self):
+        noun = 'character' if len(self.text) == 1 else 'characters'
+        return f"❌ Ho ho NO! Invalid {noun} '{self.text}' at line {self.lineno}, column {self.column}"
+
+    def __repr__(self):
+        return f'LexError({self.text!r}, line {self.lineno}, column {self.column})'
+
+
+class SantaLexer:
+    # Single-pass scanner with PLY's lexer interface, so yacc can drive it.
+    # input() takes a str, or bytes, an mmap or anything else re can match
+    # against, which is scanned in place and only the text of each token is
+    # decoded. Invalid characters are printed as they're found and kept in
+    # errors. Callers can keep their own attributes on a lexer, as they
+    # could on PLY's.
+    __slots__ = ('data', 'lineno', 'lexpos', 'error_count', 'errors', 'token', '__dict__')
+
+    def __init__(self):
+        self.data = ''
+        self.lineno = 1
+        self.lexpos = 0
+        self.error_count = 0
+        self.errors = []
+        self.token = _no_token
+
+    def input(self, data):
+        # Like PLY, carries on counting lines from wherever lineno was left
+        self.data = data
+        self.lexpos = 0
+        self.errors = []
+        # yacc calls token() once per token, so it's bound straight to the
+        # scanner instead of going through a method
+        self.token = functools.partial(next, self._scan(data), None)
+
+    def __iter__(self):
+        return iter(self.token, None)
+
+    def column(self, lexpos):
+        # 1-based column of a position in the current input, in characters
+        data = self.data
+        if isinstance(data, str):
+            return lexpos - data.rfind('\n', 0, lexpos)
+        line_start = data.rfind(b'\n', 0, lexpos) + 1
+        return len(bytes(data[line_start:lexpos]).decode('utf-8', 'replace')) + 1
+
+    def _scan(self, data):
+        text = isinstance(data, str)
+        match = (_TEXT_TOKEN if text else _BYTES_TOKEN).match
+        keywords = KEYWORDS if text else BYTE_KEYWORDS
+        symbol_types = SYMBOL_TYPES
+        pos = 0
+        end = len(data)
+        lineno = self.lineno
+        while pos < end:
+            m = match(data, pos)
+            if m is None:
+                pos = self._invalid(data, pos, lineno)
+                continue
+            kind = m.lastindex
+            pos = m.end()
+            if kind >= FIRST_SYMBOL:
+                yield LexToken(symbol_types[kind], PUNCTUATION[symbol_types[kind]], lineno, m.start(kind))
+            elif kind == WORD:
+                word = m.group(kind)
+                token_type = keywords.get(word)
+                if token_type is None:
+                    yield LexToken('IDENTIFIER', word if text else word.decode('ascii'), lineno, m.start(kind))
+                else:
+                    yield LexToken(token_type, token_type, lineno, m.start(kind))
+            elif kind == NEWLINES:
+                lineno += pos - m.start(kind)
+                self.lineno = lineno
+            elif kind == INTEGER:
+                yield LexToken('NUMBER', int(m.group(kind)), lineno, m.start(kind))
+            elif kind == FLOAT:
+                yield LexToken('NUMBER', float(m.group(kind)), lineno, m.start(kind))
+            elif kind == STRING:
+                value = m.group(kind)[1:-1]
+                yield LexToken('STRING', value if text else value.decode('utf-8'), lineno, m.start(kind))
+        self.lexpos = end
+
+    def _invalid(self, data, pos, lineno):
+        # Reports the run of bad characters at pos and returns where the
+        # next token may start
+        text = isinstance(data, str)
+        pos = (_SPACES if text else _BYTE_SPACES).match(data, pos).end()
+        if pos >= len(data):
+            return pos
+        bad = (_TEXT_INVALID if text else _BYTES_INVALID).match(data, pos)
+        stop = bad.end() if bad is not None else pos + 1
+        chunk = data[pos:stop]
+        error = LexError(chunk if text else bytes(chunk).decode('utf-8', 'replace'), lineno, self.column(pos), pos)
+        self.errors.append(error)
+        self.error_count += 1
+        print(error)
+        return stop
+
+
+def _no_token():
+    return None
+
+
+def tokenize(data):
+    # Every token in data, from a fresh lexer
+    lexer = new_lexer()
+    lexer.input(data)
+    return iter(lexer)
+
+
+def get_lexer():
+    # The shared module-level lexer, for callers that drive one lexer and
+    # keep state on it. Threads should each use new_lexer().
+    return lexer
+
+
+def new_lexer():
+    # Independent input position, line count and errors
+    return SantaLexer()
+
+
+# One instance for the life of the module, as PLY's module-level lexer was;
+# the token patterns are compiled once, at import, and shared by every lexer
+lexer = SantaLexer()
@@ -0,0 +1,82 @@
+# santa_memo.py
+from collections import OrderedDict, deque
+
+from santa_vectors import NumericGift
+
+# Bound used by @memo_lru when no size is given
+DEFAULT_LRU_SIZE = 128
+
+_MISSING = object()
+
+
+def freeze(value):
+    # Hashable stand-in for a workshop argument. Containers are keyed on their
+    # contents at call time, tagged with their kind so a GIFT and a STOCKING
+    # holding the same children don't share an entry. Scalars keep their type
+    # so 1, 1.0 and YES stay apart.
+    if isinstance(value, (list, NumericGift)):
+        return ('GIFT', tuple(map(freeze, value)))
+    if isinstance(value, dict):
+        return ('SLEIGH', frozenset((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (deque, range)):
+        return ('STOCKING', tuple(map(freeze, value)))
+    return (type(value), value)
+
+
+class MemoCache:
+    # Results of one pure workshop, keyed on its arguments. maxsize=None keeps
+    # every result; otherwise the least recently used entry is evicted once
+    # the cache is full. Cached GIFTs and SLEIGHs are handed back as the same
+    # object each time, so memoized workshops shouldn't have their results
+    # changed in place.
+    __slots__ = ('maxsize', 'entries', 'hits', 'misses', 'evictions')
+
+    def __init__(self, maxsize=None):
+        if maxsize is not None and (not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1):
+            raise ValueError("❌ Ho ho NO! Memo size must be a positive whole number!")
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def wrap(self, fn):
+        entries = self.entries
+        maxsize = self.maxsize
+
+        def memoized(*args):
+            # Scalar arguments hash as they are; only calls with a GIFT,
+            # SLEIGH or STOCKING pay for freezing
+            key = args + tuple(map(type, args))
+            try:
+                result = entries.get(key, _MISSING)
+            except TypeError:
+                key = tuple(map(freeze, args))
+                result = entries.get(key, _MISSING)
+            if result is not _MISSING:
+                self.hits += 1
+                if maxsize is not None:
+                    entries.move_to_end(key)
+                return result
+
+            self.misses += 1
+            result = fn(*args)
+            entries[key] = result
+            if maxsize is not None and len(entries) > maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+            return result
+
+        return memoized
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self.entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        self.entries.clear()
+
+    def __str__(self):
+        limit = 'unbounded' if self.maxsize is None else f'max {self.maxsize}'
+        return (f'{self.hits} hits, {self.misses} misses, {self.evictions} evictions, '
+                f'{len(self.entries)} cached ({limit})')
@@ -0,0 +1,393 @@
+# santa_optimizer.py
+from santa_ast import with_line
+from santa_compiler import ARITHMETIC_OPERATORS, COMPARISON_OPERATORS
+
+# 0 runs the AST as parsed. 1 folds arithmetic and comparisons on literals and
+# drops branches and loops that can never run. 2 also hoists loop-invariant
+# arithmetic out of loop bodies.
+DEFAULT_OPT_LEVEL = 1
+OPT_LEVELS = (0, 1, 2)
+
+# Declared types that only ever hold plain numbers
+NUMERIC_TYPES = frozenset(['MERRY', 'SPARKLE', 'SPIRIT'])
+# Operators that can't fail on two numbers, so a hoisted expression is safe
+# to evaluate before the loop even if the loop never gets to it
+SAFE_ARITHMETIC = frozenset(['GIVE', 'TAKE', 'MULTIPLY_JOY', 'MIN_GIFT', 'MAX_GIFT'])
+# Anything that can run a workshop, which may change top-level variables
+CALL_KINDS = frozenset(['function_call', 'await', 'decorator'])
+# Bigger literal powers are left for the runtime, in case they never run
+MAX_FOLDED_EXPONENT = 64
+TEMP_PREFIX = '~invariant'
+
+
+def optimize(ast, level=DEFAULT_OPT_LEVEL):
+    if not level:
+        return ast
+    if not isinstance(ast, list):
+        ast = [ast]
+    return Optimizer(level).optimize_program(ast)
+
+
+class _HoistScope:
+    # What hoisting needs to know about the program or workshop being optimized
+    __slots__ = ('in_workshop', 'unsafe')
+
+    def __init__(self, in_workshop, unsafe):
+        self.in_workshop = in_workshop
+        # Names that may hold something other than a number somewhere in scope
+        self.unsafe = unsafe
+
+
+class Optimizer:
+    # Rewrites parser tuples into an equivalent, cheaper AST. Returns new
+    # tuples and lists throughout: the input may be shared by the parse cache.
+    # Rewritten statements keep the source line of the one they replace.
+    # Folding calls the same operator functions the runtime does, so SHARE by
+    # zero still gives inf. Anything that raises is left in place so the
+    # error is reported at run time, as before.
+
+    def __init__(self, level=DEFAULT_OPT_LEVEL):
+        self.level = level
+        self.scope = None
+        self.temp_count = 0
+
+    def optimize_program(self, statements):
+        self.scope = _HoistScope(False, _unsafe_names((), statements))
+        return self.optimize_block(statements, frozenset())
+
+    def optimize_block(self, statements, numeric):
+        # numeric: names declared as numbers on every path to this point
+        optimized = []
+        for statement in statements:
+            optimized.extend(self.optimize_statement(statement, numeric))
+            if (isinstance(statement, tuple) and statement[0] == 'declare'
+                    and statement[2] in NUMERIC_TYPES and statement[1] not in self.scope.unsafe):
+                numeric = numeric | {statement[1]}
+        return optimized
+
+    def optimize_statement(self, statement, numeric):
+        # A list, since a pruned branch is spliced into the enclosing block
+        if not isinstance(statement, tuple):
+            return [statement]
+        handler = getattr(self, f'_stmt_{statement[0]}', None)
+        if handler is not None:
+            return [with_line(optimized, statement) for optimized in handler(statement, numeric)]
+        return [with_line(_map_statement(statement, self.optimize_expression,
+                                         lambda block: self.optimize_block(block, numeric)), statement)]
+
+    def optimize_expression(self, expression):
+        if not isinstance(expression, tuple):
+            return expression
+        if expression[0] in ('arithmetic', 'comparison'):
+            op, left, right = expression[1:]
+            folded = (expression[0], op, self.optimize_expression(left), self.optimize_expression(right))
+            return self.fold(folded)
+        return _map_expression(expression, self.optimize_expression)
+
+    def fold(self, expression):
+        kind, op, left, right = expression
+        left_value, right_value = _literal(left), _literal(right)
+        if left_value is _UNKNOWN or right_value is _UNKNOWN:
+            return expression
+        if (op == 'POWER_OF_BELIEF' and isinstance(right_value, (int, float))
+                and abs(right_value) > MAX_FOLDED_EXPONENT):
+            return expression
+        operator_fn = ARITHMETIC_OPERATORS[op] if kind == 'arithmetic' else COMPARISON_OPERATORS[op]
+        try:
+            result = operator_fn(left_value, right_value)
+        except Exception:
+            return expression
+        if isinstance(result, bool):
+            return ('boolean', result)
+        if isinstance(result, (int, float)):
+            return ('value', result)
+        return expression
+
+    # Statements
+
+    def _stmt_if(self, statement, numeric):
+        _, condition, true_block, false_block = statement
+        condition = self.optimize_expression(condition)
+        value = _literal(condition)
+        if value is not _UNKNOWN:
+            return self.optimize_block(true_block if value else false_block, numeric)
+        return [('if', condition, self.optimize_block(true_block, numeric),
+                 self.optimize_block(false_block, numeric))]
+
+    def _stmt_nested_conditional(self, statement, numeric):
+        _, conditions, blocks = statement
+        kept_conditions, kept_blocks = [], []
+        else_block = blocks[-1] if len(blocks) > len(conditions) else None
+        for condition, block in zip(conditions, blocks):
+            condition = self.optimize_expression(condition)
+            value = _literal(condition)
+            if value is _UNKNOWN:
+                kept_conditions.append(condition)
+                kept_blocks.append(self.optimize_block(block, numeric))
+            elif value:
+                else_block = block  # later branches can never be reached
+                break
+        else_block = self.optimize_block(else_block, numeric) if else_block is not None else None
+        if not kept_conditions:
+            return else_block or []
+        if else_block is not None:
+            kept_blocks.append(else_block)
+        return [('nested_conditional', kept_conditions, kept_blocks)]
+
+    def _stmt_while(self, statement, numeric):
+        _, condition, block = statement
+        condition = self.optimize_expression(condition)
+        value = _literal(condition)
+        if value is not _UNKNOWN and not value:
+            return []
+        return self.hoist(('while', condition, self.optimize_block(block, numeric)), 2, numeric)
+
+    def _stmt_count(self, statement, numeric):
+        _, count, block = statement
+        count = self.optimize_expression(count)
+        value = _literal(count)
+        if isinstance(value, int) and value <= 0:
+            return []
+        return self.hoist(('count', count, self.optimize_block(block, numeric)), 2, numeric)
+
+    def _stmt_foreach(self, statement, numeric):
+        _, var_name, iterable, block = statement
+        loop = ('foreach', var_name, self.optimize_expression(iterable), self.optimize_block(block, numeric))
+        return self.hoist(loop, 3, numeric)
+
+    def _stmt_workshop(self, statement, numeric):
+        _, name, params, ret_type, body = statement
+        return [('workshop', name, params, ret_type, self.optimize_workshop_body(params, body))]
+
+    def _stmt_magic_workshop(self, statement, numeric):
+        _, name, params, body = statement
+        return [('magic_workshop', name, params, self.optimize_workshop_body(params, body))]
+
+    def _stmt_decorator(self, statement, numeric):
+        workshop = self.optimize_statement(statement[2], numeric)[0]
+        if len(statement) > 3:
+            return [('decorator', statement[1], workshop, [self.optimize_expression(arg) for arg in statement[3]])]
+        return [('decorator', statement[1], workshop)]
+
+    def optimize_workshop_body(self, params, body):
+        # Workshop locals can only change in the workshop's own body
+        previous = self.scope
+        self.scope = _HoistScope(True, _unsafe_names(params, body))
+        try:
+            numeric = frozenset(param_name for param_type, param_name in params
+                                if param_type in NUMERIC_TYPES and param_name not in self.scope.unsafe)
+            return self.optimize_block(body, numeric)
+        finally:
+            self.scope = previous
+
+    # Loop-invariant hoisting
+
+    def hoist(self, loop, body_index, numeric):
+        # Arithmetic and comparisons over numeric variables the loop never
+        # changes are computed once into a temporary before the loop
+        body = loop[body_index]
+        if self.level < 2 or not numeric:
+            return [loop]
+        # Any workshop call could change a top-level variable; a workshop's
+        # own locals can only change in its body
+        if not self.scope.in_workshop and _contains_kind(body, CALL_KINDS):
+            return [loop]
+        stable = numeric - _written_names(body)
+        if not stable:
+            return [loop]
+
+        temps = {}
+        hoister = _Hoister(stable, temps, self.new_temp)
+        # Temporaries an inner loop hoisted into this body move out whole
+        # when they don't change here either
+        hoisted, rest = [], []
+        position = 0
+        while position < len(body):
+            statement = body[position]
+            if _is_temp_declare(statement) and hoister.invariant(body[position + 1][2]):
+                hoisted.extend(body[position:position + 2])
+                position += 2
+            else:
+                rest.append(statement)
+                position += 1
+        body = hoister.rewrite_block(rest)
+        if not temps and not hoisted:
+            return [loop]
+        for expression, (temp, temp_type) in temps.items():
+            hoisted.append(('declare', temp, temp_type))
+            hoisted.append(('assign', temp, expression))
+        return hoisted + [loop[:body_index] + (body,) + loop[body_index + 1:]]
+
+    def new_temp(self):
+        # Not a valid identifier, so it can't clash with a script's names
+        self.temp_count += 1
+        return f'{TEMP_PREFIX}{self.temp_count}'
+
+
+class _Hoister:
+    __slots__ = ('stable', 'temps', 'new_temp')
+
+    def __init__(self, stable, temps, new_temp):
+        self.stable = stable
+        self.temps = temps  # expression -> (temp name, declared type)
+        self.new_temp = new_temp
+
+    def rewrite_block(self, statements):
+        return [self.rewrite_statement(statement) for statement in statements]
+
+    def rewrite_statement(self, statement):
+        if not isinstance(statement, tuple) or statement[0] in ('workshop', 'magic_workshop', 'decorator', 'lambda'):
+            return statement
+        return with_line(_map_statement(statement, self.rewrite_expression, self.rewrite_block), statement)
+
+    def rewrite_expression(self, expression):
+        if not isinstance(expression, tuple) or expression[0] == 'lambda':
+            return expression  # a QUICK_ELF parameter can shadow a stable name
+        if expression[0] in ('arithmetic', 'comparison') and self.invariant(expression):
+            entry = self.temps.get(expression)
+            if entry is None:
+                temp_type = 'MERRY' if expression[0] == 'arithmetic' else 'JINGLE'
+                entry = self.temps[expression] = (self.new_temp(), temp_type)
+            return ('value', entry[0])
+        return _map_expression(expression, self.rewrite_expression)
+
+    def invariant(self, expression):
+        if not isinstance(expression, tuple):
+            return _is_number(expression)
+        kind = expression[0]
+        if kind == 'value':
+            value = expression[1]
+            return value in self.stable if isinstance(value, str) else _is_number(value)
+        if kind == 'boolean':
+            return True
+        if kind == 'arithmetic' and expression[1] not in SAFE_ARITHMETIC:
+            return False
+        if kind in ('arithmetic', 'comparison'):
+            return self.invariant(expression[2]) and self.invariant(expression[3])
+        return False
+
+
+def _map_statement(statement, expression_fn, block_fn):
+    # The statement rebuilt with expression_fn applied to each expression and
+    # block_fn to each nested block. Definitions come back unchanged.
+    kind = statement[0]
+    if kind == 'assign':
+        return (kind, statement[1], expression_fn(statement[2]))
+    if kind in ('deliver', 'await'):
+        return (kind, expression_fn(statement[1]))
+    if kind == 'if':
+        return (kind, expression_fn(statement[1]), block_fn(statement[2]), block_fn(statement[3]))
+    if kind == 'nested_conditional':
+        return (kind, [expression_fn(condition) for condition in statement[1]],
+                [block_fn(block) for block in statement[2]])
+    if kind in ('while', 'count'):
+        return (kind, expression_fn(statement[1]), block_fn(statement[2]))
+    if kind == 'foreach':
+        return (kind, statement[1], expression_fn(statement[2]), block_fn(statement[3]))
+    if kind == 'try_catch':
+        return (kind, block_fn(statement[1]), block_fn(statement[2]))
+    if kind in ('method_call', 'function_call'):
+        return _map_expression(statement, expression_fn)
+    return statement
+
+
+def _map_expression(expression, expression_fn):
+    # The expression with expression_fn applied to each direct subexpression
+    kind = expression[0]
+    if kind in ('arithmetic', 'comparison'):
+        return (kind, expression[1], expression_fn(expression[2]), expression_fn(expression[3]))
+    if kind == 'array':
+        return (kind, [expression_fn(item) for item in expression[1]])
+    if kind == 'dictionary':
+        return (kind, [(key, expression_fn(value)) for key, value in expression[1]])
+    if kind == 'dictionary_access':
+        return (kind, expression[1], expression_fn(expression[2]))
+    if kind == 'function_call':
+        return (kind, expression[1], [expression_fn(arg) for arg in expression[2]])
+    if kind == 'method_call':
+        obj = expression[1]
+        if isinstance(obj, tuple) and obj[0] == 'method_result':
+            obj = ('method_result', expression_fn(obj[1]))
+        return (kind, obj, expression[2], [expression_fn(arg) for arg in expression[3]])
+    if kind == 'lambda':
+        return (kind, expression[1], expression_fn(expression[2]))
+    return expression
+
+
+_UNKNOWN = object()
+
+
+def _literal(expression):
+    # The value of a literal number or boolean; _UNKNOWN for anything else.
+    # A quoted string parses the same as a name, so strings never count.
+    if not isinstance(expression, tuple):
+        return expression if _is_number(expression) else _UNKNOWN
+    if expression[0] == 'boolean':
+        return expression[1]
+    if expression[0] == 'value' and _is_number(expression[1]):
+        return expression[1]
+    return _UNKNOWN
+
+
+def _is_temp_declare(statement):
+    # Hoisted temporaries are always declared and assigned as a pair
+    return (isinstance(statement, tuple) and statement[0] == 'declare'
+            and statement[1].startswith(TEMP_PREFIX))
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _unsafe_names(params, body):
+    # Names declared with a non-numeric type, or bound by FOR_EACH_CHILD,
+    # anywhere in a program or workshop body
+    unsafe = {param_name for param_type, param_name in params if param_type not in NUMERIC_TYPES}
+    for statement in _walk_statements(body):
+        kind = statement[0]
+        if kind == 'declare' and statement[2] not in NUMERIC_TYPES:
+            unsafe.add(statement[1])
+        elif kind in ('declare_quantum', 'declare_typed_array', 'foreach'):
+            unsafe.add(statement[1])
+    return frozenset(unsafe)
+
+
+def _written_names(statements):
+    written = set()
+    for statement in _walk_statements(statements):
+        if statement[0] in ('assign', 'declare', 'declare_quantum', 'declare_typed_array', 'foreach'):
+            written.add(statement[1])
+    return written
+
+
+def _walk_statements(statements):
+    # Every statement in statements and the blocks nested in them, without
+    # going into workshop definitions
+    for statement in statements:
+        if not isinstance(statement, tuple):
+            continue
+        yield statement
+        kind = statement[0]
+        if kind == 'if':
+            yield from _walk_statements(statement[2])
+            yield from _walk_statements(statement[3])
+        elif kind in ('while', 'count'):
+            yield from _walk_statements(statement[2])
+        elif kind == 'foreach':
+            yield from _walk_statements(statement[3])
+        elif kind == 'try_catch':
+            yield from _walk_statements(statement[1])
+            yield from _walk_statements(statement[2])
+        elif kind == 'nested_conditional':
+            for block in statement[2]:
+                yield from _walk_statements(block)
+
+
+def _contains_kind(node, kinds):
+    if isinstance(node, tuple):
+        if node and isinstance(node[0], str) and node[0] in kinds:
+            return True
+        return any(_contains_kind(item, kinds) for item in node)
+    if isinstance(node, list):
+        return any(_contains_kind(item, kinds) for item in node)
+    return False
@@ -0,0 +1,97 @@
+# santa_output.py
+import queue
+import sys
+import threading
+import time
+
+
+class DeliveryStopped(BaseException):
+    # Raised inside a running program once nobody is listening any more.
+    # BaseException so the per-statement error handlers let it through.
+    pass
+
+
+class WriterSink:
+    # DELIVER sink for file-like objects. Lines are joined and written once
+    # buffer_size characters are pending or flush_interval seconds have passed
+    # since the last write; buffer_size=0 writes every line straight through.
+    def __init__(self, stream=None, line_format='{}\n', buffer_size=64 * 1024, flush_interval=1.0, header=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self.line_format = line_format
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.header = header
+        self.pending = []
+        self.pending_size = 0
+        self.last_flush = time.monotonic()
+        self.count = 0
+
+    def __call__(self, text):
+        if self.count == 0 and self.header:
+            self.pending.append(self.header)
+        self.count += 1
+        line = self.line_format.format(text)
+        self.pending.append(line)
+        self.pending_size += len(line)
+        if self.pending_size >= self.buffer_size or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.stream.write(''.join(self.pending))
+            self.pending.clear()
+            self.pending_size = 0
+        self.stream.flush()
+        self.last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+_FINISHED = object()
+
+
+def iter_deliveries(execute, max_pending=1024):
+    # Runs execute(sink) on a helper thread and yields each delivered value as
+    # it is produced. The queue is bounded, so a slow consumer pauses the
+    # program instead of letting output pile up in memory.
+    deliveries = queue.Queue(max_pending)
+    stopped = threading.Event()
+
+    def sink(text):
+        if stopped.is_set():
+            raise DeliveryStopped()
+        deliveries.put(text)
+
+    def run():
+        try:
+            execute(sink)
+        except DeliveryStopped:
+            return
+        except BaseException as e:
+            deliveries.put((_FINISHED, e))
+            return
+        deliveries.put((_FINISHED, None))
+
+    worker = threading.Thread(target=run, name='santa-iter-execute', daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = deliveries.get()
+            if type(item) is tuple and item[0] is _FINISHED:
+                if item[1] is not None:
+                    raise item[1]
+                return
+            yield item
+    finally:
+        # Closed early: stop the program at its next DELIVER and unblock it
+        # if it is waiting on a full queue
+        stopped.set()
+        while not deliveries.empty():
+            try:
+                deliveries.get_nowait()
+            except queue.Empty:
+                break
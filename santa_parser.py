@@ -1,7 +1,19 @@
 # santa_parser.py
+import copy
+import os
+import sys
+import threading
 import ply.yacc as yacc
+import santa_lexer
+from santa_ast import Node
 from santa_lexer import tokens
 
+# Pre-generated LALR tables ship next to this file as santa_parsetab.py.
+# PLY checks them against the grammar signature and rewrites them if stale.
+# Regenerate them with `python santa_parser.py` after changing the grammar.
+PARSETAB = 'santa_parsetab'
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 precedence = (
     ('left', 'DOT'),  # Highest precedence for method and function chaining
     ('left', 'GIVE', 'TAKE'),
@@ -11,6 +23,12 @@ precedence = (
     ('left', 'MORE_FESTIVE', 'LESS_FESTIVE', 'SAME_GIFT'),
 )
 
+def _node(p, *items):
+    # A statement tagged with the line of its first token. A rule starting
+    # with another tagged node takes that node's line.
+    first = p[1]
+    return Node(items, first.lineno if isinstance(first, Node) else p.lineno(1))
+
 def p_program(p):
     '''program : statement_list'''
     p[0] = p[1]
@@ -21,7 +39,9 @@ def p_statement_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        # Append in place: p[1] + [p[2]] copied the list on every reduction
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_statement(p):
     '''statement : variable_declaration
@@ -43,11 +63,11 @@ def p_variable_declaration(p):
                           | WRAP IDENTIFIER AS QUANTUM_GIFT LT type GT
                           | WRAP IDENTIFIER AS GIFT LT type GT'''
     if len(p) == 5:
-        p[0] = ('declare', p[2], p[4])
+        p[0] = _node(p, 'declare', p[2], p[4])
     elif p[4] == 'QUANTUM_GIFT':
-        p[0] = ('declare_quantum', p[2], p[6])
+        p[0] = _node(p, 'declare_quantum', p[2], p[6])
     else:  # GIFT<TYPE>
-        p[0] = ('declare_typed_array', p[2], p[6])
+        p[0] = _node(p, 'declare_typed_array', p[2], p[6])
 
 def p_type(p):
     '''type : MERRY
@@ -62,11 +82,11 @@ def p_type(p):
 
 def p_assignment_statement(p):
     '''assignment_statement : IDENTIFIER AS expression'''
-    p[0] = ('assign', p[1], p[3])
+    p[0] = _node(p, 'assign', p[1], p[3])
 
 def p_if_statement(p):
     '''if_statement : NICE expression THEN statement_list NAUGHTY statement_list END_OF_LIST'''
-    p[0] = ('if', p[2], p[4], p[6])
+    p[0] = _node(p, 'if', p[2], p[4], p[6])
 
 def p_loop_statement(p):
     '''loop_statement : while_loop
@@ -76,27 +96,31 @@ def p_loop_statement(p):
 
 def p_while_loop(p):
     '''while_loop : WHILE_CHRISTMAS_SPIRIT condition DO statement_list STILL_BELIEVING'''
-    p[0] = ('while', p[2], p[4])
+    p[0] = _node(p, 'while', p[2], p[4])
 
 def p_foreach_loop(p):
-    '''foreach_loop : FOR_EACH_CHILD IN expression DO statement_list CHECKED_TWICE'''
-    p[0] = ('foreach', 'IN', p[3], p[5])
+    '''foreach_loop : FOR_EACH_CHILD IDENTIFIER IN expression DO statement_list CHECKED_TWICE
+                   | FOR_EACH_CHILD IN expression DO statement_list CHECKED_TWICE'''
+    if len(p) == 8:
+        p[0] = _node(p, 'foreach', p[2], p[4], p[6])
+    else:  # Unnamed loops bind each child to IN, as they always have
+        p[0] = _node(p, 'foreach', 'IN', p[3], p[5])
 
 def p_count_loop(p):
     '''count_loop : AROUND_THE_CHRISTMAS_TREE expression DO statement_list UNTIL_CHRISTMAS'''
-    p[0] = ('count', p[2], p[4])
+    p[0] = _node(p, 'count', p[2], p[4])
 
 def p_lambda_expression(p):
     '''lambda_expression : QUICK_ELF LPAREN IDENTIFIER RPAREN ARROW expression'''
-    p[0] = ('lambda', p[3], p[6])
+    p[0] = _node(p, 'lambda', p[3], p[6])
 
 def p_deliver_statement(p):
     '''deliver_statement : DELIVER expression'''
-    p[0] = ('deliver', p[2])
+    p[0] = _node(p, 'deliver', p[2])
 
 def p_await_statement(p):
     '''await_statement : AWAIT_CHRISTMAS expression'''
-    p[0] = ('await', p[2])
+    p[0] = _node(p, 'await', p[2])
 
 def p_method_call_statement(p):
     '''method_call_statement : method_call'''
@@ -112,11 +136,11 @@ def p_workshop_definition(p):
                          | MAGIC_WORKSHOP IDENTIFIER LPAREN parameter_list RPAREN OPENS statement_list CLOSES'''
     if p[1] == 'WORKSHOP':
         if len(p) == 11:
-            p[0] = ('workshop', p[2], p[4], p[7], p[9])
+            p[0] = _node(p, 'workshop', p[2], p[4], p[7], p[9])
         else:
-            p[0] = ('workshop', p[2], p[4], None, p[7])
+            p[0] = _node(p, 'workshop', p[2], p[4], None, p[7])
     else:
-        p[0] = ('magic_workshop', p[2], p[4], p[7])
+        p[0] = _node(p, 'magic_workshop', p[2], p[4], p[7])
 
 def p_parameter_list(p):
     '''parameter_list : parameter
@@ -128,7 +152,8 @@ def p_parameter_list(p):
         else:
             p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_parameter(p):
     '''parameter : type IDENTIFIER
@@ -140,11 +165,15 @@ def p_parameter(p):
 
 def p_error_handling(p):
     '''error_handling : BELIEVE statement_list DOUBT statement_list KEEP_FAITH'''
-    p[0] = ('try_catch', p[2], p[4])
+    p[0] = _node(p, 'try_catch', p[2], p[4])
 
 def p_decorator_statement(p):
-    '''decorator_statement : AT IDENTIFIER workshop_definition'''
-    p[0] = ('decorator', p[2], p[3])
+    '''decorator_statement : AT IDENTIFIER workshop_definition
+                          | AT IDENTIFIER LPAREN expression_list RPAREN workshop_definition'''
+    if len(p) == 4:
+        p[0] = _node(p, 'decorator', p[2], p[3])
+    else:
+        p[0] = _node(p, 'decorator', p[2], p[6], p[4])
 
 def p_method_call(p):
     '''method_call : IDENTIFIER DOT method_name LPAREN RPAREN
@@ -153,15 +182,15 @@ def p_method_call(p):
                   | method_call DOT method_name LPAREN expression_list RPAREN'''
     if isinstance(p[1], str):
         if len(p) == 6:
-            p[0] = ('method_call', p[1], p[3], [])
+            p[0] = _node(p, 'method_call', p[1], p[3], [])
         else:
-            p[0] = ('method_call', p[1], p[3], p[5])
+            p[0] = _node(p, 'method_call', p[1], p[3], p[5])
     else:
         prev_call = p[1]
         if len(p) == 6:
-            p[0] = ('method_call', ('method_result', prev_call), p[3], [])
+            p[0] = _node(p, 'method_call', ('method_result', prev_call), p[3], [])
         else:
-            p[0] = ('method_call', ('method_result', prev_call), p[3], p[5])
+            p[0] = _node(p, 'method_call', ('method_result', prev_call), p[3], p[5])
 
 def p_method_chain(p):
     '''method_chain : method_name LPAREN RPAREN
@@ -214,7 +243,7 @@ def p_lambda_statement(p):
 
 def p_lambda_expression(p):
     '''lambda_expression : QUICK_ELF LPAREN IDENTIFIER RPAREN ARROW expression'''
-    p[0] = ('lambda', p[3], p[6])
+    p[0] = _node(p, 'lambda', p[3], p[6])
 
 def p_simple_expression(p):
     '''simple_expression : NUMBER
@@ -267,7 +296,8 @@ def p_key_value_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_key_value(p):
     '''key_value : STRING COLON expression'''
@@ -283,7 +313,8 @@ def p_expression_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_boolean_literal(p):
     '''boolean_literal : HO
@@ -294,11 +325,11 @@ def p_function_composition(p):
     '''function_composition : IDENTIFIER DOT IDENTIFIER
                           | function_composition DOT IDENTIFIER'''
     if isinstance(p[1], str):
-        p[0] = ('function_composition', [p[1], p[3]])
+        p[0] = _node(p, 'function_composition', [p[1], p[3]])
     else:
         funcs = p[1][1].copy()
         funcs.append(p[3])
-        p[0] = ('function_composition', funcs)
+        p[0] = _node(p, 'function_composition', funcs)
 
 def p_function_call(p):
     '''function_call : IDENTIFIER LPAREN expression_list RPAREN
@@ -306,9 +337,9 @@ def p_function_call(p):
                     | function_composition LPAREN expression_list RPAREN
                     | function_composition LPAREN RPAREN'''
     if isinstance(p[1], str):  # Simple function call
-        p[0] = ('function_call', p[1], [] if len(p) == 4 else p[3])
+        p[0] = _node(p, 'function_call', p[1], [] if len(p) == 4 else p[3])
     else:  # Function composition
-        p[0] = ('function_call', p[1], [] if len(p) == 4 else p[3])
+        p[0] = _node(p, 'function_call', p[1], [] if len(p) == 4 else p[3])
 
 def p_function_chain(p):
     '''function_chain : IDENTIFIER
@@ -329,8 +360,66 @@ def p_condition(p):
 
 def p_error(p):
     if p:
-        print(f"🎅 Syntax error at '{p.value}', line {p.lineno}")
+        print(f"🎅 Syntax error at '{p.value}', line {p.lineno}, column {p.lexer.column(p.lexpos)}")
+        p.lexer.error_count += 1
     else:
         print("🎅 Syntax error at EOF")
 
-parser = yacc.yacc()
\ No newline at end of file
+_parser = None
+_build_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_parser():
+    # Built on first use so importing this module stays cheap
+    global _parser
+    if _parser is None:
+        with _build_lock:
+            if _parser is None:
+                _parser = yacc.yacc(module=sys.modules[__name__], tabmodule=PARSETAB,
+                                    outputdir=TABLE_DIR, write_tables=True, debug=False)
+    return _parser
+
+
+def parse_with_errors(source):
+    # LRParser keeps its stacks on the instance and lexers keep their input
+    # position, so every thread gets its own copy of both. The LALR tables
+    # and the token patterns are shared read-only. source is a str, or
+    # bytes or an mmap of UTF-8 text, which is lexed without copying.
+    state = getattr(_local, 'state', None)
+    if state is None:
+        state = _local.state = (santa_lexer.new_lexer(), copy.copy(get_parser()))
+    lexer, parser = state
+    lexer.lineno = 1
+    lexer.error_count = 0
+    ast = parser.parse(source, lexer=lexer)
+    return ast, lexer.error_count
+
+
+def parse(source):
+    # Safe to call from any number of threads at once
+    return parse_with_errors(source)[0]
+
+
+def build_tables():
+    # Regenerates the shipped table module from the current grammar
+    global _parser
+    path = os.path.join(TABLE_DIR, f'{PARSETAB}.py')
+    if os.path.exists(path):
+        os.remove(path)
+    sys.modules.pop(PARSETAB, None)
+    _parser = None
+    _local.__dict__.pop('state', None)
+    get_parser()
+
+
+def __getattr__(name):
+    # Keeps `from santa_parser import parser` working without building at import
+    if name == 'parser':
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    build_tables()
+    print(f"🎄 Wrote {PARSETAB}.py to {TABLE_DIR}")
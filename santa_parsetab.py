@@ -0,0 +1,157 @@
+
+# santa_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftDOTleftGIVETAKEleftMULTIPLY_JOYSHARELEFTOVER_MAGICFLOOR_CHIMNEYleftMIN_GIFTMAX_GIFTROUND_PRESENTSrightPOWER_OF_BELIEFleftMORE_FESTIVELESS_FESTIVESAME_GIFTAROUND_THE_CHRISTMAS_TREE ARROW AS AT AWAIT_CHRISTMAS BELIEVE CHECKED_TWICE CLOSES COLON COMMA COUNT_JOYS DELIVER DO DOT DOUBT END_OF_LIST FIND_CHIMNEY FLOOR_CHIMNEY FOR_EACH_CHILD GIFT GIFT_WRAP GIVE GT HO IDENTIFIER IN JINGLE JINGLE_CASE KEEP_FAITH LBRACE LBRACKET LEFTOVER_MAGIC LESS_FESTIVE LPAREN LT MAGIC_WORKSHOP MAX_GIFT MEASURE MERRY MIN_GIFT MORE_FESTIVE MULTIPLY_JOY NAH NAUGHTY NICE NUMBER OPENS PACK PEEK_INSIDE POWER_OF_BELIEF QUANTUM_GIFT QUICK_ELF RBRACE RBRACKET REPLACE_COAL RETURNS ROUND_PRESENTS RPAREN SAME_GIFT SHARE SILENT_NIGHT SLEIGH SNOWFLAKE SPARKLE SPIRIT STILL_BELIEVING STOCKING STRING TAKE THEN TINSEL TO_JINGLE TO_TINSEL TRIM_TREE UNTANGLE UNTIL_CHRISTMAS UNWRAP WHILE_CHRISTMAS_SPIRIT WORKSHOP WRAP WRAP_STRINGprogram : statement_liststatement_list : statement\n                     | statement_list statementstatement : variable_declaration\n                | assignment_statement\n                | if_statement\n                | loop_statement\n                | deliver_statement\n                | method_call_statement\n                | workshop_definition\n                | error_handling\n                | function_call_statement\n                | decorator_statement\n                | await_statement\n                | lambda_statementvariable_declaration : WRAP IDENTIFIER AS type\n                          | WRAP IDENTIFIER AS QUANTUM_GIFT LT type GT\n                          | WRAP IDENTIFIER AS GIFT LT type GTtype : MERRY\n            | JINGLE\n            | TINSEL\n            | GIFT\n            | SPIRIT\n            | SNOWFLAKE\n            | SLEIGH\n            | STOCKINGassignment_statement : IDENTIFIER AS expressionif_statement : NICE expression THEN statement_list NAUGHTY statement_list END_OF_LISTloop_statement : while_loop\n                     | foreach_loop\n                     | count_loopwhile_loop : WHILE_CHRISTMAS_SPIRIT condition DO statement_list STILL_BELIEVINGforeach_loop : FOR_EACH_CHILD IDENTIFIER IN expression DO statement_list CHECKED_TWICE\n                   | FOR_EACH_CHILD IN expression DO statement_list CHECKED_TWICEcount_loop : AROUND_THE_CHRISTMAS_TREE expression DO statement_list UNTIL_CHRISTMASdeliver_statement : DELIVER expressionawait_statement : AWAIT_CHRISTMAS expressionmethod_call_statement : method_callfunction_call_statement : function_callworkshop_definition : WORKSHOP IDENTIFIER LPAREN parameter_list RPAREN RETURNS type OPENS statement_list CLOSES\n                         | WORKSHOP IDENTIFIER LPAREN parameter_list RPAREN OPENS statement_list CLOSES\n                         | MAGIC_WORKSHOP IDENTIFIER LPAREN parameter_list RPAREN OPENS statement_list CLOSESparameter_list : parameter\n                     | parameter_list COMMA parameter\n                     | emptyparameter : type IDENTIFIER\n                | GIFT LT type GT IDENTIFIERerror_handling : BELIEVE statement_list DOUBT statement_list KEEP_FAITHdecorator_statement : AT IDENTIFIER workshop_definition\n                          | AT IDENTIFIER LPAREN expression_list RPAREN workshop_definitionmethod_call : IDENTIFIER DOT method_name LPAREN RPAREN\n                  | IDENTIFIER DOT method_name LPAREN expression_list RPAREN\n                  | method_call DOT method_name LPAREN RPAREN\n                  | method_call DOT method_name LPAREN expression_list RPARENmethod_chain : method_name LPAREN RPAREN\n                   | method_name LPAREN expression_list RPARENmethod_name : IDENTIFIER\n                  | PACK\n                  | PEEK_INSIDE\n                  | UNWRAP\n                  | SPARKLE\n                  | WRAP_STRING\n                  | UNTANGLE\n                  | COUNT_JOYS\n                  | TO_TINSEL\n                  | TO_JINGLE\n                  | MEASURE\n                  | MORE_FESTIVE\n                  | LESS_FESTIVE\n                  | TRIM_TREE\n                  | JINGLE_CASE\n                  | SILENT_NIGHT\n                  | GIFT_WRAP\n                  | FIND_CHIMNEY\n                  | REPLACE_COALexpression : simple_expression\n                 | arithmetic_expression\n                 | array_literal\n                 | dictionary_literal\n                 | boolean_literal\n                 | method_call\n                 | function_call\n                 | comparison_expression\n                 | lambda_expression\n                 | dictionary_accesslambda_statement : lambda_expressionlambda_expression : QUICK_ELF LPAREN IDENTIFIER RPAREN ARROW expressionsimple_expression : NUMBER\n                        | STRING\n                        | IDENTIFIERarithmetic_expression : expression GIVE expression\n                           | expression TAKE expression\n                           | expression MULTIPLY_JOY expression\n                           | expression SHARE expression\n                           | expression LEFTOVER_MAGIC expression\n                           | expression POWER_OF_BELIEF expression\n                           | expression FLOOR_CHIMNEY expression\n                           | expression ROUND_PRESENTS expression\n                           | expression MIN_GIFT expression\n                           | expression MAX_GIFT expression\n                           | LPAREN arithmetic_expression RPARENcomparison_expression : expression MORE_FESTIVE expression\n                           | expression LESS_FESTIVE expression\n                           | expression SAME_GIFT expressionarray_literal : LBRACKET expression_list RBRACKET\n                    | LBRACKET RBRACKETdictionary_literal : LBRACE key_value_list RBRACE\n                        | LBRACE RBRACEkey_value_list : key_value\n                     | key_value_list COMMA key_valuekey_value : STRING COLON expressiondictionary_access : IDENTIFIER LBRACKET expression RBRACKETexpression_list : expression\n                      | expression_list COMMA expressionboolean_literal : HO\n                      | NAHfunction_composition : IDENTIFIER DOT IDENTIFIER\n                          | function_composition DOT IDENTIFIERfunction_call : IDENTIFIER LPAREN expression_list RPAREN\n                    | IDENTIFIER LPAREN RPAREN\n                    | function_composition LPAREN expression_list RPAREN\n                    | function_composition LPAREN RPARENfunction_chain : IDENTIFIER\n                     | function_chain DOT IDENTIFIERempty :condition : comparison_expression\n                | boolean_literal'
+    
+_lr_action_items = {'WRAP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[16,16,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,16,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,16,-37,-27,-120,16,-106,-108,16,-49,16,16,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,16,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,16,16,16,16,-121,-51,16,-112,-53,-48,-32,16,16,-35,-52,16,-54,16,16,-50,16,-34,-87,-17,-18,-28,16,16,-33,16,-41,-42,16,-40,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,36,38,39,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,64,66,72,74,75,76,78,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,120,122,129,130,131,132,133,135,137,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,172,173,175,178,180,182,184,185,186,190,193,194,197,204,206,207,208,209,210,214,215,216,218,221,222,223,224,225,226,227,228,230,231,232,233,234,235,237,238,239,],[17,17,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,37,54,-29,-30,-31,54,-38,62,63,17,-39,65,54,-86,54,71,54,-3,54,79,54,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,54,54,-115,-116,-36,126,17,-37,54,54,138,139,-27,-120,17,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-106,-108,17,-49,54,17,54,17,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,54,-119,54,17,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,54,54,201,-22,17,17,17,17,-121,-51,17,-112,-53,-48,-32,17,17,-35,54,-52,17,-54,17,17,-50,17,-34,-87,-17,-18,-28,17,236,17,-33,17,-41,-42,17,-40,]),'NICE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[18,18,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,18,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,18,-37,-27,-120,18,-106,-108,18,-49,18,18,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,18,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,18,18,18,18,-121,-51,18,-112,-53,-48,-32,18,18,-35,-52,18,-54,18,18,-50,18,-34,-87,-17,-18,-28,18,18,-33,18,-41,-42,18,-40,]),'DELIVER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[22,22,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,22,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,22,-37,-27,-120,22,-106,-108,22,-49,22,22,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,22,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,22,22,22,22,-121,-51,22,-112,-53,-48,-32,22,22,-35,-52,22,-54,22,22,-50,22,-34,-87,-17,-18,-28,22,22,-33,22,-41,-42,22,-40,]),'WORKSHOP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,65,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,205,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[24,24,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,24,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,24,24,-37,-27,-120,24,-106,-108,24,-49,24,24,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,24,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,24,24,24,24,-121,-51,24,-112,-53,-48,24,-32,24,24,-35,-52,24,-54,24,24,-50,24,-34,-87,-17,-18,-28,24,24,-33,24,-41,-42,24,-40,]),'MAGIC_WORKSHOP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,65,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,205,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[25,25,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,25,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,25,25,-37,-27,-120,25,-106,-108,25,-49,25,25,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,25,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,25,25,25,25,-121,-51,25,-112,-53,-48,25,-32,25,25,-35,-52,25,-54,25,25,-50,25,-34,-87,-17,-18,-28,25,25,-33,25,-41,-42,25,-40,]),'BELIEVE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[26,26,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,26,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,26,-37,-27,-120,26,-106,-108,26,-49,26,26,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,26,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,26,26,26,26,-121,-51,26,-112,-53,-48,-32,26,26,-35,-52,26,-54,26,26,-50,26,-34,-87,-17,-18,-28,26,26,-33,26,-41,-42,26,-40,]),'AT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[28,28,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,28,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,28,-37,-27,-120,28,-106,-108,28,-49,28,28,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,28,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,28,28,28,28,-121,-51,28,-112,-53,-48,-32,28,28,-35,-52,28,-54,28,28,-50,28,-34,-87,-17,-18,-28,28,28,-33,28,-41,-42,28,-40,]),'AWAIT_CHRISTMAS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[29,29,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,29,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,29,-37,-27,-120,29,-106,-108,29,-49,29,29,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,29,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,29,29,29,29,-121,-51,29,-112,-53,-48,-32,29,29,-35,-52,29,-54,29,29,-50,29,-34,-87,-17,-18,-28,29,29,-33,29,-41,-42,29,-40,]),'WHILE_CHRISTMAS_SPIRIT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[31,31,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,31,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,31,-37,-27,-120,31,-106,-108,31,-49,31,31,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,31,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,31,31,31,31,-121,-51,31,-112,-53,-48,-32,31,31,-35,-52,31,-54,31,31,-50,31,-34,-87,-17,-18,-28,31,31,-33,31,-41,-42,31,-40,]),'FOR_EACH_CHILD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[32,32,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,32,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,32,-37,-27,-120,32,-106,-108,32,-49,32,32,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,32,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,32,32,32,32,-121,-51,32,-112,-53,-48,-32,32,32,-35,-52,32,-54,32,32,-50,32,-34,-87,-17,-18,-28,32,32,-33,32,-41,-42,32,-40,]),'AROUND_THE_CHRISTMAS_TREE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,26,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,102,120,122,129,130,132,135,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,182,184,185,186,190,193,194,197,204,206,207,208,209,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[33,33,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,33,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,33,-37,-27,-120,33,-106,-108,33,-49,33,33,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,33,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,33,33,33,33,-121,-51,33,-112,-53,-48,-32,33,33,-35,-52,33,-54,33,33,-50,33,-34,-87,-17,-18,-28,33,33,-33,33,-41,-42,33,-40,]),'QUICK_ELF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,18,19,20,21,22,23,26,27,29,30,31,33,36,38,40,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,64,66,72,74,78,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,120,122,129,130,131,132,133,135,137,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,172,173,180,182,184,185,186,190,193,194,197,204,206,207,208,209,210,214,215,216,218,221,222,223,224,225,226,227,228,230,232,233,234,235,237,238,239,],[35,35,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,35,-29,-30,-31,35,-38,35,-39,35,-86,35,35,-3,35,35,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,35,35,-115,-116,-36,35,-37,35,35,-27,-120,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-106,-108,35,-49,35,35,35,35,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,35,-119,35,35,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,35,35,35,35,35,35,-121,-51,35,-112,-53,-48,-32,35,35,-35,35,-52,35,-54,35,35,-50,35,-34,-87,-17,-18,-28,35,35,-33,35,-41,-42,35,-40,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,197,204,206,209,214,216,222,224,225,226,227,228,233,235,237,239,],[0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-53,-48,-32,-35,-52,-54,-50,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'DOUBT':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,64,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,197,204,206,209,214,216,222,224,225,226,227,228,233,235,237,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,129,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-53,-48,-32,-35,-52,-54,-50,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'NAUGHTY':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,197,204,206,209,214,216,222,224,225,226,227,228,233,235,237,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,193,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-53,-48,-32,-35,-52,-54,-50,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'KEEP_FAITH':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,180,186,190,194,197,204,206,209,214,216,222,224,225,226,227,228,233,235,237,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,204,-121,-51,-112,-53,-48,-32,-35,-52,-54,-50,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'STILL_BELIEVING':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,182,186,190,194,197,204,206,209,214,216,222,224,225,226,227,228,233,235,237,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,206,-121,-51,-112,-53,-48,-32,-35,-52,-54,-50,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'UNTIL_CHRISTMAS':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,185,186,190,194,197,204,206,209,214,216,222,224,225,226,227,228,233,235,237,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,209,-121,-51,-112,-53,-48,-32,-35,-52,-54,-50,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'CHECKED_TWICE':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,197,204,206,208,209,214,216,222,223,224,225,226,227,228,233,235,237,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-53,-48,-32,224,-35,-52,-54,-50,233,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'END_OF_LIST':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,197,204,206,209,214,215,216,222,224,225,226,227,228,233,235,237,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-53,-48,-32,-35,-52,228,-54,-50,-34,-87,-17,-18,-28,-33,-41,-42,-40,]),'CLOSES':([3,4,5,6,7,8,9,10,11,12,13,14,15,19,20,21,23,27,30,36,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,78,100,120,122,130,137,140,142,143,144,145,146,147,148,149,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,197,204,206,209,214,216,222,224,225,226,227,228,230,232,233,235,237,238,239,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-29,-30,-31,-38,-39,-86,-3,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-36,-37,-27,-120,-106,-108,-49,-122,-16,-22,-19,-20,-21,-23,-24,-25,-26,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-53,-48,-32,-35,-52,-54,-50,-34,-87,-17,-18,-28,235,237,-33,-41,-42,239,-40,]),'AS':([17,37,],[38,77,]),'DOT':([17,23,34,47,54,79,138,190,197,214,216,],[39,61,75,61,39,-117,-118,-51,-53,-52,-54,]),'LPAREN':([17,18,22,29,31,33,34,35,38,40,54,55,56,62,63,65,72,74,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,103,104,105,106,107,108,109,110,111,112,113,114,115,116,125,126,131,133,138,150,152,172,173,210,],[40,55,55,55,55,55,74,76,55,55,40,55,55,127,128,131,55,55,-57,150,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,55,55,55,55,55,55,55,55,55,55,55,55,55,55,173,-57,55,55,-118,55,55,55,55,55,]),'NUMBER':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'STRING':([18,22,29,31,33,38,40,55,56,57,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,171,172,173,210,],[53,53,53,53,53,53,53,53,53,124,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,124,53,53,53,]),'LBRACKET':([18,22,29,31,33,38,40,54,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[56,56,56,56,56,56,56,116,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'LBRACE':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'HO':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'NAH':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'IN':([32,71,],[72,133,]),'PACK':([39,61,],[81,81,]),'PEEK_INSIDE':([39,61,],[82,82,]),'UNWRAP':([39,61,],[83,83,]),'SPARKLE':([39,61,],[84,84,]),'WRAP_STRING':([39,61,],[85,85,]),'UNTANGLE':([39,61,],[86,86,]),'COUNT_JOYS':([39,61,],[87,87,]),'TO_TINSEL':([39,61,],[88,88,]),'TO_JINGLE':([39,61,],[89,89,]),'MEASURE':([39,61,],[90,90,]),'MORE_FESTIVE':([39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,61,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[91,113,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,113,91,113,-83,-80,113,113,113,-120,113,-77,113,-106,-108,113,-122,-119,113,113,113,113,113,113,113,113,113,113,-102,-103,-104,113,-101,-105,-107,113,-121,-51,113,-112,113,-53,-52,-54,113,]),'LESS_FESTIVE':([39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,61,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[92,114,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,114,92,114,-83,-80,114,114,114,-120,114,-77,114,-106,-108,114,-122,-119,114,114,114,114,114,114,114,114,114,114,-102,-103,-104,114,-101,-105,-107,114,-121,-51,114,-112,114,-53,-52,-54,114,]),'TRIM_TREE':([39,61,],[93,93,]),'JINGLE_CASE':([39,61,],[94,94,]),'SILENT_NIGHT':([39,61,],[95,95,]),'GIFT_WRAP':([39,61,],[96,96,]),'FIND_CHIMNEY':([39,61,],[97,97,]),'REPLACE_COAL':([39,61,],[98,98,]),'RPAREN':([40,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,74,99,100,101,117,120,122,127,128,136,137,139,150,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,173,174,176,177,179,181,186,190,191,192,194,197,198,201,214,216,219,225,236,],[100,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,137,151,-120,-113,168,-106,-108,-125,-125,186,-122,187,190,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,197,199,-43,-45,203,205,-121,-51,214,-114,-112,-53,216,-46,-52,-54,-44,-87,-47,]),'THEN':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,100,120,122,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,197,214,216,225,],[102,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,-120,-106,-108,-122,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-53,-52,-54,-87,]),'GIVE':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[103,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,103,103,-83,-80,103,103,103,-120,103,-77,103,-106,-108,103,-122,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,103,-101,-105,-107,103,-121,-51,103,-112,103,-53,-52,-54,103,]),'TAKE':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[104,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,104,104,-83,-80,104,104,104,-120,104,-77,104,-106,-108,104,-122,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,104,-101,-105,-107,104,-121,-51,104,-112,104,-53,-52,-54,104,]),'MULTIPLY_JOY':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[105,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,105,105,-83,-80,105,105,105,-120,105,-77,105,-106,-108,105,-122,-119,105,105,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,105,-101,-105,-107,105,-121,-51,105,-112,105,-53,-52,-54,105,]),'SHARE':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[106,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,106,106,-83,-80,106,106,106,-120,106,-77,106,-106,-108,106,-122,-119,106,106,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,106,-101,-105,-107,106,-121,-51,106,-112,106,-53,-52,-54,106,]),'LEFTOVER_MAGIC':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[107,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,107,107,-83,-80,107,107,107,-120,107,-77,107,-106,-108,107,-122,-119,107,107,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,107,-101,-105,-107,107,-121,-51,107,-112,107,-53,-52,-54,107,]),'POWER_OF_BELIEF':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[108,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,108,108,-83,-80,108,108,108,-120,108,-77,108,-106,-108,108,-122,-119,108,108,108,108,108,108,108,108,108,108,-102,-103,-104,108,-101,-105,-107,108,-121,-51,108,-112,108,-53,-52,-54,108,]),'FLOOR_CHIMNEY':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[109,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,109,109,-83,-80,109,109,109,-120,109,-77,109,-106,-108,109,-122,-119,109,109,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,109,-101,-105,-107,109,-121,-51,109,-112,109,-53,-52,-54,109,]),'ROUND_PRESENTS':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[110,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,110,110,-83,-80,110,110,110,-120,110,-77,110,-106,-108,110,-122,-119,110,110,110,110,110,-96,110,-98,-99,-100,-102,-103,-104,110,-101,-105,-107,110,-121,-51,110,-112,110,-53,-52,-54,110,]),'MIN_GIFT':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[111,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,111,111,-83,-80,111,111,111,-120,111,-77,111,-106,-108,111,-122,-119,111,111,111,111,111,-96,111,-98,-99,-100,-102,-103,-104,111,-101,-105,-107,111,-121,-51,111,-112,111,-53,-52,-54,111,]),'MAX_GIFT':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[112,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,112,112,-83,-80,112,112,112,-120,112,-77,112,-106,-108,112,-122,-119,112,112,112,112,112,-96,112,-98,-99,-100,-102,-103,-104,112,-101,-105,-107,112,-121,-51,112,-112,112,-53,-52,-54,112,]),'SAME_GIFT':([41,42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,60,66,68,69,70,73,78,100,101,117,118,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,183,186,190,192,194,196,197,214,216,225,],[115,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,115,115,-83,-80,115,115,115,-120,115,-77,115,-106,-108,115,-122,-119,115,115,115,115,115,115,115,115,115,115,-102,-103,-104,115,-101,-105,-107,115,-121,-51,115,-112,115,-53,-52,-54,115,]),'DO':([42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,67,68,69,73,100,120,122,134,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,183,186,190,194,197,214,216,225,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,132,-126,-127,135,-120,-106,-108,184,-122,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,207,-121,-51,-112,-53,-52,-54,-87,]),'COMMA':([42,43,44,45,46,47,48,49,50,51,52,53,54,58,59,99,100,101,119,120,121,122,123,127,128,136,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,174,176,177,179,181,186,190,191,192,194,195,196,197,198,201,214,216,219,225,236,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,-115,-116,152,-120,-113,152,-106,171,-108,-109,-125,-125,152,-122,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,200,-43,-45,200,152,-121,-51,152,-114,-112,-110,-111,-53,152,-46,-52,-54,-44,-87,-47,]),'RBRACKET':([42,43,44,45,46,47,48,49,50,51,52,53,54,56,58,59,100,101,119,120,122,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,186,190,192,194,197,214,216,225,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,120,-115,-116,-120,-113,169,-106,-108,-122,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,194,-101,-105,-107,-121,-51,-114,-112,-53,-52,-54,-87,]),'RBRACE':([42,43,44,45,46,47,48,49,50,51,52,53,54,57,58,59,100,120,121,122,123,137,151,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,186,190,194,195,196,197,214,216,225,],[-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-88,-89,-90,122,-115,-116,-120,-106,170,-108,-109,-122,-119,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-102,-103,-104,-101,-105,-107,-121,-51,-112,-110,-111,-53,-52,-54,-87,]),'QUANTUM_GIFT':([77,],[141,]),'GIFT':([77,127,128,188,189,200,202,217,],[142,178,178,212,212,178,212,212,]),'MERRY':([77,127,128,188,189,200,202,217,],[143,143,143,143,143,143,143,143,]),'JINGLE':([77,127,128,188,189,200,202,217,],[144,144,144,144,144,144,144,144,]),'TINSEL':([77,127,128,188,189,200,202,217,],[145,145,145,145,145,145,145,145,]),'SPIRIT':([77,127,128,188,189,200,202,217,],[146,146,146,146,146,146,146,146,]),'SNOWFLAKE':([77,127,128,188,189,200,202,217,],[147,147,147,147,147,147,147,147,]),'SLEIGH':([77,127,128,188,189,200,202,217,],[148,148,148,148,148,148,148,148,]),'STOCKING':([77,127,128,188,189,200,202,217,],[149,149,149,149,149,149,149,149,]),'COLON':([124,],[172,]),'LT':([141,142,178,],[188,189,202,]),'GT':([143,144,145,146,147,148,149,211,212,213,220,],[-19,-20,-21,-23,-24,-25,-26,226,-22,227,231,]),'OPENS':([143,144,145,146,147,148,149,199,203,212,229,],[-19,-20,-21,-23,-24,-25,-26,218,221,-22,234,]),'ARROW':([187,],[210,]),'RETURNS':([199,],[217,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,26,102,129,132,135,184,193,207,218,221,234,],[2,64,153,180,182,185,208,215,223,230,232,238,]),'statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[3,36,3,36,3,3,3,3,36,36,36,3,36,3,3,36,36,3,3,36,36,36,3,36,]),'variable_declaration':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'assignment_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'if_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'loop_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'deliver_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'method_call_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'workshop_definition':([0,2,26,64,65,102,129,132,135,153,180,182,184,185,193,205,207,208,215,218,221,223,230,232,234,238,],[10,10,10,10,130,10,10,10,10,10,10,10,10,10,10,222,10,10,10,10,10,10,10,10,10,10,]),'error_handling':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'function_call_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'decorator_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'await_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'lambda_statement':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'while_loop':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'foreach_loop':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'count_loop':([0,2,26,64,102,129,132,135,153,180,182,184,185,193,207,208,215,218,221,223,230,232,234,238,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'method_call':([0,2,18,22,26,29,31,33,38,40,55,56,64,72,74,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,129,131,132,133,135,150,152,153,172,173,180,182,184,185,193,207,208,210,215,218,221,223,230,232,234,238,],[23,23,47,47,23,47,47,47,47,47,47,47,23,47,47,23,47,47,47,47,47,47,47,47,47,47,47,47,47,47,23,47,23,47,23,47,47,23,47,47,23,23,23,23,23,23,23,47,23,23,23,23,23,23,23,23,]),'function_call':([0,2,18,22,26,29,31,33,38,40,55,56,64,72,74,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,129,131,132,133,135,150,152,153,172,173,180,182,184,185,193,207,208,210,215,218,221,223,230,232,234,238,],[27,27,48,48,27,48,48,48,48,48,48,48,27,48,48,27,48,48,48,48,48,48,48,48,48,48,48,48,48,48,27,48,27,48,27,48,48,27,48,48,27,27,27,27,27,27,27,48,27,27,27,27,27,27,27,27,]),'lambda_expression':([0,2,18,22,26,29,31,33,38,40,55,56,64,72,74,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,129,131,132,133,135,150,152,153,172,173,180,182,184,185,193,207,208,210,215,218,221,223,230,232,234,238,],[30,30,50,50,30,50,50,50,50,50,50,50,30,50,50,30,50,50,50,50,50,50,50,50,50,50,50,50,50,50,30,50,30,50,30,50,50,30,50,50,30,30,30,30,30,30,30,50,30,30,30,30,30,30,30,30,]),'function_composition':([0,2,18,22,26,29,31,33,38,40,55,56,64,72,74,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,129,131,132,133,135,150,152,153,172,173,180,182,184,185,193,207,208,210,215,218,221,223,230,232,234,238,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'expression':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[41,60,66,70,73,78,101,118,101,134,101,154,155,156,157,158,159,160,161,162,163,164,165,166,167,101,183,101,192,196,101,225,]),'simple_expression':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'arithmetic_expression':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[43,43,43,43,43,43,43,117,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'array_literal':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'dictionary_literal':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'boolean_literal':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[46,46,46,69,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'comparison_expression':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[49,49,49,68,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'dictionary_access':([18,22,29,31,33,38,40,55,56,72,74,103,104,105,106,107,108,109,110,111,112,113,114,115,116,131,133,150,152,172,173,210,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'condition':([31,],[67,]),'method_name':([39,61,],[80,125,]),'expression_list':([40,56,74,131,150,173,],[99,119,136,181,191,198,]),'key_value_list':([57,],[121,]),'key_value':([57,171,],[123,195,]),'type':([77,127,128,188,189,200,202,217,],[140,175,175,211,213,175,220,229,]),'parameter_list':([127,128,],[174,179,]),'parameter':([127,128,200,],[176,176,219,]),'empty':([127,128,],[177,177,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> statement_list','program',1,'p_program','santa_parser.py',24),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','santa_parser.py',28),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','santa_parser.py',29),
+  ('statement -> variable_declaration','statement',1,'p_statement','santa_parser.py',38),
+  ('statement -> assignment_statement','statement',1,'p_statement','santa_parser.py',39),
+  ('statement -> if_statement','statement',1,'p_statement','santa_parser.py',40),
+  ('statement -> loop_statement','statement',1,'p_statement','santa_parser.py',41),
+  ('statement -> deliver_statement','statement',1,'p_statement','santa_parser.py',42),
+  ('statement -> method_call_statement','statement',1,'p_statement','santa_parser.py',43),
+  ('statement -> workshop_definition','statement',1,'p_statement','santa_parser.py',44),
+  ('statement -> error_handling','statement',1,'p_statement','santa_parser.py',45),
+  ('statement -> function_call_statement','statement',1,'p_statement','santa_parser.py',46),
+  ('statement -> decorator_statement','statement',1,'p_statement','santa_parser.py',47),
+  ('statement -> await_statement','statement',1,'p_statement','santa_parser.py',48),
+  ('statement -> lambda_statement','statement',1,'p_statement','santa_parser.py',49),
+  ('variable_declaration -> WRAP IDENTIFIER AS type','variable_declaration',4,'p_variable_declaration','santa_parser.py',53),
+  ('variable_declaration -> WRAP IDENTIFIER AS QUANTUM_GIFT LT type GT','variable_declaration',7,'p_variable_declaration','santa_parser.py',54),
+  ('variable_declaration -> WRAP IDENTIFIER AS GIFT LT type GT','variable_declaration',7,'p_variable_declaration','santa_parser.py',55),
+  ('type -> MERRY','type',1,'p_type','santa_parser.py',64),
+  ('type -> JINGLE','type',1,'p_type','santa_parser.py',65),
+  ('type -> TINSEL','type',1,'p_type','santa_parser.py',66),
+  ('type -> GIFT','type',1,'p_type','santa_parser.py',67),
+  ('type -> SPIRIT','type',1,'p_type','santa_parser.py',68),
+  ('type -> SNOWFLAKE','type',1,'p_type','santa_parser.py',69),
+  ('type -> SLEIGH','type',1,'p_type','santa_parser.py',70),
+  ('type -> STOCKING','type',1,'p_type','santa_parser.py',71),
+  ('assignment_statement -> IDENTIFIER AS expression','assignment_statement',3,'p_assignment_statement','santa_parser.py',75),
+  ('if_statement -> NICE expression THEN statement_list NAUGHTY statement_list END_OF_LIST','if_statement',7,'p_if_statement','santa_parser.py',79),
+  ('loop_statement -> while_loop','loop_statement',1,'p_loop_statement','santa_parser.py',83),
+  ('loop_statement -> foreach_loop','loop_statement',1,'p_loop_statement','santa_parser.py',84),
+  ('loop_statement -> count_loop','loop_statement',1,'p_loop_statement','santa_parser.py',85),
+  ('while_loop -> WHILE_CHRISTMAS_SPIRIT condition DO statement_list STILL_BELIEVING','while_loop',5,'p_while_loop','santa_parser.py',89),
+  ('foreach_loop -> FOR_EACH_CHILD IDENTIFIER IN expression DO statement_list CHECKED_TWICE','foreach_loop',7,'p_foreach_loop','santa_parser.py',93),
+  ('foreach_loop -> FOR_EACH_CHILD IN expression DO statement_list CHECKED_TWICE','foreach_loop',6,'p_foreach_loop','santa_parser.py',94),
+  ('count_loop -> AROUND_THE_CHRISTMAS_TREE expression DO statement_list UNTIL_CHRISTMAS','count_loop',5,'p_count_loop','santa_parser.py',101),
+  ('deliver_statement -> DELIVER expression','deliver_statement',2,'p_deliver_statement','santa_parser.py',109),
+  ('await_statement -> AWAIT_CHRISTMAS expression','await_statement',2,'p_await_statement','santa_parser.py',113),
+  ('method_call_statement -> method_call','method_call_statement',1,'p_method_call_statement','santa_parser.py',117),
+  ('function_call_statement -> function_call','function_call_statement',1,'p_function_call_statement','santa_parser.py',121),
+  ('workshop_definition -> WORKSHOP IDENTIFIER LPAREN parameter_list RPAREN RETURNS type OPENS statement_list CLOSES','workshop_definition',10,'p_workshop_definition','santa_parser.py',125),
+  ('workshop_definition -> WORKSHOP IDENTIFIER LPAREN parameter_list RPAREN OPENS statement_list CLOSES','workshop_definition',8,'p_workshop_definition','santa_parser.py',126),
+  ('workshop_definition -> MAGIC_WORKSHOP IDENTIFIER LPAREN parameter_list RPAREN OPENS statement_list CLOSES','workshop_definition',8,'p_workshop_definition','santa_parser.py',127),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','santa_parser.py',137),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','santa_parser.py',138),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','santa_parser.py',139),
+  ('parameter -> type IDENTIFIER','parameter',2,'p_parameter','santa_parser.py',150),
+  ('parameter -> GIFT LT type GT IDENTIFIER','parameter',5,'p_parameter','santa_parser.py',151),
+  ('error_handling -> BELIEVE statement_list DOUBT statement_list KEEP_FAITH','error_handling',5,'p_error_handling','santa_parser.py',158),
+  ('decorator_statement -> AT IDENTIFIER workshop_definition','decorator_statement',3,'p_decorator_statement','santa_parser.py',162),
+  ('decorator_statement -> AT IDENTIFIER LPAREN expression_list RPAREN workshop_definition','decorator_statement',6,'p_decorator_statement','santa_parser.py',163),
+  ('method_call -> IDENTIFIER DOT method_name LPAREN RPAREN','method_call',5,'p_method_call','santa_parser.py',170),
+  ('method_call -> IDENTIFIER DOT method_name LPAREN expression_list RPAREN','method_call',6,'p_method_call','santa_parser.py',171),
+  ('method_call -> method_call DOT method_name LPAREN RPAREN','method_call',5,'p_method_call','santa_parser.py',172),
+  ('method_call -> method_call DOT method_name LPAREN expression_list RPAREN','method_call',6,'p_method_call','santa_parser.py',173),
+  ('method_chain -> method_name LPAREN RPAREN','method_chain',3,'p_method_chain','santa_parser.py',187),
+  ('method_chain -> method_name LPAREN expression_list RPAREN','method_chain',4,'p_method_chain','santa_parser.py',188),
+  ('method_name -> IDENTIFIER','method_name',1,'p_method_name','santa_parser.py',197),
+  ('method_name -> PACK','method_name',1,'p_method_name','santa_parser.py',198),
+  ('method_name -> PEEK_INSIDE','method_name',1,'p_method_name','santa_parser.py',199),
+  ('method_name -> UNWRAP','method_name',1,'p_method_name','santa_parser.py',200),
+  ('method_name -> SPARKLE','method_name',1,'p_method_name','santa_parser.py',201),
+  ('method_name -> WRAP_STRING','method_name',1,'p_method_name','santa_parser.py',202),
+  ('method_name -> UNTANGLE','method_name',1,'p_method_name','santa_parser.py',203),
+  ('method_name -> COUNT_JOYS','method_name',1,'p_method_name','santa_parser.py',204),
+  ('method_name -> TO_TINSEL','method_name',1,'p_method_name','santa_parser.py',205),
+  ('method_name -> TO_JINGLE','method_name',1,'p_method_name','santa_parser.py',206),
+  ('method_name -> MEASURE','method_name',1,'p_method_name','santa_parser.py',207),
+  ('method_name -> MORE_FESTIVE','method_name',1,'p_method_name','santa_parser.py',208),
+  ('method_name -> LESS_FESTIVE','method_name',1,'p_method_name','santa_parser.py',209),
+  ('method_name -> TRIM_TREE','method_name',1,'p_method_name','santa_parser.py',210),
+  ('method_name -> JINGLE_CASE','method_name',1,'p_method_name','santa_parser.py',211),
+  ('method_name -> SILENT_NIGHT','method_name',1,'p_method_name','santa_parser.py',212),
+  ('method_name -> GIFT_WRAP','method_name',1,'p_method_name','santa_parser.py',213),
+  ('method_name -> FIND_CHIMNEY','method_name',1,'p_method_name','santa_parser.py',214),
+  ('method_name -> REPLACE_COAL','method_name',1,'p_method_name','santa_parser.py',215),
+  ('expression -> simple_expression','expression',1,'p_expression','santa_parser.py',219),
+  ('expression -> arithmetic_expression','expression',1,'p_expression','santa_parser.py',220),
+  ('expression -> array_literal','expression',1,'p_expression','santa_parser.py',221),
+  ('expression -> dictionary_literal','expression',1,'p_expression','santa_parser.py',222),
+  ('expression -> boolean_literal','expression',1,'p_expression','santa_parser.py',223),
+  ('expression -> method_call','expression',1,'p_expression','santa_parser.py',224),
+  ('expression -> function_call','expression',1,'p_expression','santa_parser.py',225),
+  ('expression -> comparison_expression','expression',1,'p_expression','santa_parser.py',226),
+  ('expression -> lambda_expression','expression',1,'p_expression','santa_parser.py',227),
+  ('expression -> dictionary_access','expression',1,'p_expression','santa_parser.py',228),
+  ('lambda_statement -> lambda_expression','lambda_statement',1,'p_lambda_statement','santa_parser.py',232),
+  ('lambda_expression -> QUICK_ELF LPAREN IDENTIFIER RPAREN ARROW expression','lambda_expression',6,'p_lambda_expression','santa_parser.py',236),
+  ('simple_expression -> NUMBER','simple_expression',1,'p_simple_expression','santa_parser.py',240),
+  ('simple_expression -> STRING','simple_expression',1,'p_simple_expression','santa_parser.py',241),
+  ('simple_expression -> IDENTIFIER','simple_expression',1,'p_simple_expression','santa_parser.py',242),
+  ('arithmetic_expression -> expression GIVE expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',246),
+  ('arithmetic_expression -> expression TAKE expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',247),
+  ('arithmetic_expression -> expression MULTIPLY_JOY expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',248),
+  ('arithmetic_expression -> expression SHARE expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',249),
+  ('arithmetic_expression -> expression LEFTOVER_MAGIC expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',250),
+  ('arithmetic_expression -> expression POWER_OF_BELIEF expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',251),
+  ('arithmetic_expression -> expression FLOOR_CHIMNEY expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',252),
+  ('arithmetic_expression -> expression ROUND_PRESENTS expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',253),
+  ('arithmetic_expression -> expression MIN_GIFT expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',254),
+  ('arithmetic_expression -> expression MAX_GIFT expression','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',255),
+  ('arithmetic_expression -> LPAREN arithmetic_expression RPAREN','arithmetic_expression',3,'p_arithmetic_expression','santa_parser.py',256),
+  ('comparison_expression -> expression MORE_FESTIVE expression','comparison_expression',3,'p_comparison_expression','santa_parser.py',263),
+  ('comparison_expression -> expression LESS_FESTIVE expression','comparison_expression',3,'p_comparison_expression','santa_parser.py',264),
+  ('comparison_expression -> expression SAME_GIFT expression','comparison_expression',3,'p_comparison_expression','santa_parser.py',265),
+  ('array_literal -> LBRACKET expression_list RBRACKET','array_literal',3,'p_array_literal','santa_parser.py',269),
+  ('array_literal -> LBRACKET RBRACKET','array_literal',2,'p_array_literal','santa_parser.py',270),
+  ('dictionary_literal -> LBRACE key_value_list RBRACE','dictionary_literal',3,'p_dictionary_literal','santa_parser.py',277),
+  ('dictionary_literal -> LBRACE RBRACE','dictionary_literal',2,'p_dictionary_literal','santa_parser.py',278),
+  ('key_value_list -> key_value','key_value_list',1,'p_key_value_list','santa_parser.py',285),
+  ('key_value_list -> key_value_list COMMA key_value','key_value_list',3,'p_key_value_list','santa_parser.py',286),
+  ('key_value -> STRING COLON expression','key_value',3,'p_key_value','santa_parser.py',294),
+  ('dictionary_access -> IDENTIFIER LBRACKET expression RBRACKET','dictionary_access',4,'p_dictionary_access','santa_parser.py',298),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','santa_parser.py',302),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','santa_parser.py',303),
+  ('boolean_literal -> HO','boolean_literal',1,'p_boolean_literal','santa_parser.py',311),
+  ('boolean_literal -> NAH','boolean_literal',1,'p_boolean_literal','santa_parser.py',312),
+  ('function_composition -> IDENTIFIER DOT IDENTIFIER','function_composition',3,'p_function_composition','santa_parser.py',316),
+  ('function_composition -> function_composition DOT IDENTIFIER','function_composition',3,'p_function_composition','santa_parser.py',317),
+  ('function_call -> IDENTIFIER LPAREN expression_list RPAREN','function_call',4,'p_function_call','santa_parser.py',326),
+  ('function_call -> IDENTIFIER LPAREN RPAREN','function_call',3,'p_function_call','santa_parser.py',327),
+  ('function_call -> function_composition LPAREN expression_list RPAREN','function_call',4,'p_function_call','santa_parser.py',328),
+  ('function_call -> function_composition LPAREN RPAREN','function_call',3,'p_function_call','santa_parser.py',329),
+  ('function_chain -> IDENTIFIER','function_chain',1,'p_function_chain','santa_parser.py',336),
+  ('function_chain -> function_chain DOT IDENTIFIER','function_chain',3,'p_function_chain','santa_parser.py',337),
+  ('empty -> <empty>','empty',0,'p_empty','santa_parser.py',344),
+  ('condition -> comparison_expression','condition',1,'p_condition','santa_parser.py',348),
+  ('condition -> boolean_literal','condition',1,'p_condition','santa_parser.py',349),
+]
@@ -0,0 +1,167 @@
+# santa_profile.py
+import time
+
+PROGRAM = '<program>'
+# Calls nested deeper than this share the frame at this depth in the
+# collapsed stacks, so a 100k-deep recursion doesn't write 100k-frame lines
+MAX_STACK_DEPTH = 256
+
+
+class WorkshopStats:
+    __slots__ = ('name', 'calls', 'cumulative', 'self_time', 'active')
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        # Time inside the outermost of any recursive calls, so it never
+        # adds up to more than the program's own time
+        self.cumulative = 0.0
+        self.self_time = 0.0
+        self.active = 0  # calls in progress
+
+
+class _Frame:
+    # One entry in the collapsed-stack tree: a workshop reached by one path
+    __slots__ = ('name', 'parent', 'children', 'depth', 'self_time')
+
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.children = {}
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.self_time = 0.0
+
+    def child(self, name):
+        if self.depth >= MAX_STACK_DEPTH:
+            return self
+        frame = self.children.get(name)
+        if frame is None:
+            frame = self.children[name] = _Frame(name, self)
+        return frame
+
+    def path(self):
+        names = []
+        frame = self
+        while frame is not None:
+            names.append(frame.name)
+            frame = frame.parent
+        return ';'.join(reversed(names))
+
+
+class Profiler:
+    # Collects per-line hit counts and times, and per-workshop calls, self
+    # and cumulative time, for one program run. The compiler wraps each
+    # statement and workshop body it compiles while a profiler is attached;
+    # without one nothing is wrapped and the program runs as before.
+    # Use it as a context manager around execute().
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.workshops = {}  # workshop name -> WorkshopStats
+        self.line_hits = {}  # line -> statements run there
+        self.line_times = {}  # line -> seconds, outermost runs only
+        self.running_lines = {}  # line -> runs in progress
+        self.root = _Frame(PROGRAM, None)
+        # [stats, start, time in calls made from here, tree frame] for each
+        # workshop call in progress, the program's own entry first
+        self.calls = []
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self.calls.append([None, self.clock(), 0.0, self.root])
+        return self
+
+    def __exit__(self, *exc_info):
+        _, start, child_time, root = self.calls.pop()
+        elapsed = self.clock() - start
+        self.elapsed += elapsed
+        root.self_time += elapsed - child_time
+        return False
+
+    # Hooks for the compiler
+
+    def wrap_statement(self, statement_fn, lineno):
+        clock = self.clock
+        hits = self.line_hits
+        times = self.line_times
+        running = self.running_lines
+        hits.setdefault(lineno, 0)
+        times.setdefault(lineno, 0.0)
+        running.setdefault(lineno, 0)
+
+        def profiled_statement(frame):
+            hits[lineno] += 1
+            if running[lineno]:
+                return statement_fn(frame)
+            running[lineno] = 1
+            start = clock()
+            try:
+                return statement_fn(frame)
+            finally:
+                times[lineno] += clock() - start
+                running[lineno] = 0
+
+        return profiled_statement
+
+    def wrap_workshop(self, run, name):
+        stats = self.workshops.get(name)
+        if stats is None:
+            stats = self.workshops[name] = WorkshopStats(name)
+        clock = self.clock
+        calls = self.calls
+
+        def profiled_workshop(frame):
+            stats.calls += 1
+            stats.active += 1
+            calls.append([stats, clock(), 0.0, calls[-1][3].child(stats.name)])
+            try:
+                return run(frame)
+            finally:
+                _, start, child_time, tree_frame = calls.pop()
+                elapsed = clock() - start
+                calls[-1][2] += elapsed
+                tree_frame.self_time += elapsed - child_time
+                stats.self_time += elapsed - child_time
+                stats.active -= 1
+                if not stats.active:
+                    stats.cumulative += elapsed
+
+        return profiled_workshop
+
+    # Reports
+
+    def report(self, source=None):
+        # The workshop and line tables, as text
+        lines = [f"🎄 Profile: {self.elapsed * 1000:.3f} ms", "",
+                 f"{'workshop':<24} {'calls':>9} {'cumulative ms':>14} {'self ms':>10}"]
+        for stats in sorted(self.workshops.values(), key=lambda stats: stats.self_time, reverse=True):
+            lines.append(f"{stats.name:<24} {stats.calls:>9} {stats.cumulative * 1000:>14.3f} "
+                         f"{stats.self_time * 1000:>10.3f}")
+        if not self.workshops:
+            lines.append("  (no workshops called)")
+
+        source_lines = source.splitlines() if source is not None else []
+        lines += ["", f"{'line':>6} {'hits':>9} {'total ms':>10}  source"]
+        for lineno in sorted(self.line_hits):
+            text = source_lines[lineno - 1].strip() if 0 < lineno <= len(source_lines) else ''
+            lines.append(f"{lineno:>6} {self.line_hits[lineno]:>9} {self.line_times[lineno] * 1000:>10.3f}  {text}")
+        return '\n'.join(lines)
+
+    def collapsed_stacks(self):
+        # One "outer;inner microseconds" line per call path, for flame-graph
+        # tools such as flamegraph.pl and speedscope
+        stacks = []
+        pending = [self.root]
+        while pending:
+            frame = pending.pop()
+            micros = round(frame.self_time * 1_000_000)
+            if micros > 0:
+                stacks.append(f'{frame.path()} {micros}')
+            pending.extend(frame.children.values())
+        stacks.sort()
+        return stacks
+
+    def write_collapsed(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self.collapsed_stacks():
+                f.write(line + '\n')
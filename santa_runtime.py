@@ -1,328 +1,351 @@
 # santa_runtime.py
 import asyncio
 from collections import deque
-import random
-import functools
-import math
+import inspect
+import time
+from santa_cells import Cell, parse_type
+from santa_compiler import SantaCompiler, Scope
+from santa_infer import prove_stores
+from santa_io import IO_WORKSHOPS, Snooze, StreamStocking, candy_cane
+from santa_memo import DEFAULT_LRU_SIZE, MemoCache
+from santa_output import iter_deliveries
+from santa_stack import CallStack, TailCall
+from santa_vectors import VECTOR_TYPES, NumericGift, typed_array
+
+TYPE_CHECKS = {
+    'MERRY': lambda x: isinstance(x, (int, float)),
+    'JINGLE': lambda x: isinstance(x, bool),
+    'SPARKLE': lambda x: isinstance(x, float),
+    'TINSEL': lambda x: isinstance(x, str),
+    'GIFT': lambda x: isinstance(x, (list, str, dict, NumericGift)),
+    'SLEIGH': lambda x: isinstance(x, dict),
+    'STOCKING': lambda x: isinstance(x, (list, deque, range, StreamStocking)),
+    'SPIRIT': lambda x: isinstance(x, (int, float)) and 0 <= x <= 100,
+    'SNOWFLAKE': lambda x: True
+}
+
+METHOD_HANDLERS = {
+    'TINSEL': {
+        'SPARKLE': lambda s, *_: {'type': 'TINSEL', 'value': f'✨{s}✨'},
+        'WRAP_TEXT': lambda s, *_: {'type': 'TINSEL', 'value': s.title()},  # Changed from WRAP
+        'UNTANGLE': lambda s, *_: {'type': 'TINSEL', 'value': s.strip()},
+        'COUNT_JOYS': lambda s, *_: len(s),
+        'TRIM_TREE': lambda s, *_: {'type': 'TINSEL', 'value': s.strip()},
+        'JINGLE_CASE': lambda s, *_: {'type': 'TINSEL', 'value': s.upper()},
+        'SILENT_NIGHT': lambda s, *_: {'type': 'TINSEL', 'value': s.lower()},
+        'GIFT_WRAP': lambda s, n, *_: {'type': 'TINSEL', 'value': s.center(n)},
+        'FIND_CHIMNEY': lambda s, sub, *_: s.find(sub),
+        'REPLACE_COAL': lambda s, old, new, *_: {'type': 'TINSEL', 'value': s.replace(old, new)}
+    },
+    'GIFT': {
+        'PACK': lambda lst, x, *_: lst.append(x) or lst,
+        'UNWRAP': lambda lst, *_: lst.pop() if lst else None,
+        'PEEK_INSIDE': lambda lst, *_: lst[-1] if lst else None,
+        'COUNT_JOYS': lambda lst, *_: len(lst)
+    },
+    'STOCKING': {
+        'PACK': lambda lst, x, *_: lst.append(x) or lst,
+        'PEEK_INSIDE': lambda lst, *_: lst[-1] if lst else None,
+        'UNWRAP': lambda lst, *_: lst.pop() if lst else None
+    },
+    'MERRY': {
+        'TO_TINSEL': lambda x, *_: str(x),
+        'TO_JINGLE': lambda x, *_: bool(x),
+        'MORE_FESTIVE': lambda x, y, *_: x > y
+    },
+    'SPIRIT': {
+        'TO_TINSEL': lambda x, *_: str(x),
+        'TO_JINGLE': lambda x, *_: bool(x)
+    }
+}
+
+# Quantum type handlers
+for _base_type in ['TINSEL', 'MERRY']:
+    METHOD_HANDLERS[f'QUANTUM_GIFT<{_base_type}>'] = {
+        'MEASURE': lambda x, *_: x
+    }
+
+# Methods whose plain results are re-wrapped as chainable TINSEL values
+TINSEL_RESULT_METHODS = frozenset(['TRIM_TREE', 'JINGLE_CASE', 'SILENT_NIGHT', 'GIFT_WRAP', 'SPARKLE', 'WRAP',
+                                   'WRAP_STRING'])
+
+DEFAULT_VALUES = {
+    'MERRY': lambda: 0,
+    'JINGLE': lambda: False,
+    'SPARKLE': lambda: 0.0,
+    'TINSEL': lambda: "",
+    'GIFT': list,
+    'SNOWFLAKE': lambda: None,
+    'SPIRIT': lambda: 0,
+    'SLEIGH': dict,
+    'STOCKING': deque
+}
+
+
+BUILTIN_WORKSHOPS = dict(IO_WORKSHOPS, CANDY_CANE=candy_cane, SNOOZE=Snooze)
+
+CONVERSIONS = {
+    'TO_TINSEL': str,
+    'TO_JINGLE': bool
+}
 
 
 class SantaRuntime:
-    def __init__(self):
+    type_checks = TYPE_CHECKS
+    method_handlers = METHOD_HANDLERS
+    builtin_workshops = BUILTIN_WORKSHOPS
+
+    @classmethod
+    def register_method(cls, type_name, method_name, handler):
+        # Subclasses get their own copy so registrations don't leak upwards
+        if 'method_handlers' not in cls.__dict__:
+            cls.method_handlers = {key: dict(methods) for key, methods in cls.method_handlers.items()}
+        cls.method_handlers.setdefault(type_name, {})[method_name] = handler
+
+    @classmethod
+    def register_type_check(cls, type_name, checker):
+        if 'type_checks' not in cls.__dict__:
+            cls.type_checks = dict(cls.type_checks)
+        cls.type_checks[type_name] = checker
+
+    @classmethod
+    def register_builtin(cls, name, handler):
+        # Workshops every new runtime of this class starts with
+        if 'builtin_workshops' not in cls.__dict__:
+            cls.builtin_workshops = dict(cls.builtin_workshops)
+        cls.builtin_workshops[name] = handler
+
+    def __init__(self, sink=None, profiler=None, budget=None):
+        # Every DELIVER outside a workshop goes to sink; by default that
+        # collects the values in self.output. With a santa_profile.Profiler,
+        # code is compiled with timing hooks, and with a santa_budget.Budget,
+        # with limit checks.
         self.output = []
+        self.deliver = sink if sink is not None else self.output.append
         self.variables = {}  # Initialize variables dictionary
-
-    def nice_list_decorator(self, workshop):
+        self.workshops = {name: {'params': [], 'wrapper': handler} for name, handler in self.builtin_workshops.items()}
+        self.decorators = {
+            'nice_list': self.nice_list_decorator,
+            'memo': self.memo_decorator,
+            'memo_lru': self.memo_lru_decorator,
+        }
+        self.memo_caches = {}  # workshop name -> MemoCache, for @memo and @memo_lru
+        self.compiler = SantaCompiler(self)
+        self.compiler.profiler = profiler
+        self.compiler.budget = self.budget = budget
+        if budget is not None:
+            self.govern(budget)
+        self.call_stack = CallStack()
+        self.loop = None  # private event loop for magic workshops run synchronously
+        self.tasks = None  # magic workshop calls in flight under execute_async
+        self.tasks_loop = None  # the loop execute_async runs on
+
+    def govern(self, budget):
+        # Routes output, stores, method calls and workshop calls through the
+        # budget's checks. These shadow the methods on this runtime only, and
+        # both backends call them through the instance, so runtimes without
+        # a budget run exactly as before.
+        self.deliver = budget.metered(self.deliver)
+        self.store_cell = budget.sized_store(self.store_cell)
+        self.invoke_method = budget.sized_method(self.invoke_method)
+        self.bind_parameters = budget.charged_call(self.bind_parameters)
+
+    def register_workshop(self, name, handler):
+        # Python callable scripts can call like a workshop. Under
+        # execute_async it may return an awaitable for AWAIT_CHRISTMAS.
+        self.workshops[name] = {'params': [], 'wrapper': handler}
+
+    # Decorators take the workshop statement plus any arguments given as
+    # @name(args). They can return a workshop statement to define in its
+    # place, or define it themselves and return None.
+
+    def decorate(self, decorator_name, workshop, args):
+        if decorator_name not in self.decorators:
+            raise NameError(f"❌ Ho ho NO! Decorator '{decorator_name}' not found!")
+        decorated_workshop = self.decorators[decorator_name](workshop, *args)
+        if decorated_workshop is not None:
+            self.execute_statement(decorated_workshop)
+        # Remembered so a santa_image snapshot can decorate it again
+        entry = self.workshops.get(workshop[1]) if workshop[0] == 'workshop' else None
+        if entry is not None:
+            entry['decorator'] = (decorator_name, workshop, tuple(args))
+
+    def decorated_workshop(self, workshop):
+        # Defines workshop and returns its entry, ready for a 'wrapper'
         if workshop[0] != 'workshop':
             raise ValueError("❌ Ho ho NO! Can only decorate workshops!")
+        self.execute_statement(workshop)
+        return self.workshops[workshop[1]]
 
-        name = workshop[1]
-        params = workshop[2]
-        ret_type = workshop[3]
-        body = workshop[4]
+    def nice_list_decorator(self, workshop):
+        entry = self.decorated_workshop(workshop)
 
         def wrapper(*args):
             if not all(isinstance(arg, (int, float)) and arg >= 0 for arg in args):
                 raise ValueError("❌ Ho ho NO! Only positive values allowed on the nice list!")
-            return self.execute_workshop_call(name, args)
+            return self.run_workshop(entry, args)
 
-        self.workshops[name] = {
-            'params': params,
-            'return_type': ret_type,
-            'body': body,
-            'wrapper': wrapper
-        }
-        return ('workshop', name, params, ret_type, body)
+        entry['wrapper'] = wrapper
+
+    def memo_decorator(self, workshop, maxsize=None):
+        # Recursive calls go back through call_workshop, so they hit the cache too
+        cache = MemoCache(maxsize)
+        entry = self.decorated_workshop(workshop)
+        entry['wrapper'] = cache.wrap(lambda *args: self.run_workshop(entry, args))
+        self.memo_caches[workshop[1]] = cache
+
+    def memo_lru_decorator(self, workshop, maxsize=DEFAULT_LRU_SIZE):
+        self.memo_decorator(workshop, maxsize)
 
     def execute(self, ast):
-        if not isinstance(ast, list):
-            ast = [ast]
-        for node in ast:
-            if isinstance(node, tuple):
-                node_type = node[0]
-                if node_type == 'deliver':
-                    value = self.evaluate(node[1])
-                    if value is not None:
-                        self.output.append(str(value))
+        self.start_budget()
+        self.prove_stores(ast)
+        program = self.compiler.compile_program(ast)
+        try:
+            program(None)
+        finally:
+            self.call_stack.close()
         return self.output
 
-    def execute_statement(self, statement):
+    async def execute_async(self, ast):
+        # Runs the program on the current event loop. Each MAGIC_WORKSHOP call
+        # starts a task, and AWAIT_CHRISTMAS lets the others run meanwhile
+        self.start_budget()
+        self.prove_stores(ast)
+        steps = self.compiler.compile_async_program(ast)
+        self.tasks = set()
+        self.tasks_loop = asyncio.get_running_loop()
         try:
-            if statement[0] == 'try_catch':
-                _, try_block, catch_block = statement
-                try:
-                    for stmt in try_block:
-                        self.execute_statement(stmt)
-                except Exception as e:
-                    for stmt in catch_block:
-                        self.execute_statement(stmt)
-
-                stmt_type = statement[0]
-
-                if stmt_type == 'workshop':
-                    name, params, ret_type, body = statement[1:]
-                    self.workshops[name] = {
-                        'params': params,
-                        'return_type': ret_type,
-                        'body': body,
-                        'name': name
-                    }
-                    return
+            await self.run_steps(steps, None)
+            while self.tasks:
+                tasks, self.tasks = self.tasks, set()
+                await asyncio.gather(*tasks)
+        finally:
+            self.tasks = self.tasks_loop = None
+            self.call_stack.close()
+        return self.output
 
-                elif stmt_type == 'declare':
-                    _, name, var_type = statement
-                    self.variables[name] = {
-                        'type': var_type,
-                        'value': self.get_default_value(var_type)
-                    }
-
-                elif stmt_type == 'declare_quantum':
-                    _, name, base_type = statement
-                    self.variables[name] = {
-                        'type': f'QUANTUM_GIFT<{base_type}>',
-                        'value': None,
-                        'superposition': True
-                    }
-
-                elif stmt_type == 'declare_typed_array':
-                    _, name, element_type = statement
-                    self.variables[name] = {
-                        'type': f'GIFT<{element_type}>',
-                        'value': [],
-                        'element_type': element_type
-                    }
-
-                elif stmt_type == 'assign':
-                    _, name, value = statement
-                    if name not in self.variables:
-                        raise NameError(f"❌ Ho ho NO! Variable '{name}' not declared!")
-
-                    evaluated_value = self.evaluate(value)
-                    var_type = self.variables[name]['type']
-
-                    # Handle quantum types first
-                    if var_type.startswith('QUANTUM_GIFT<'):
-                        self.variables[name]['value'] = evaluated_value
-                        self.variables[name]['superposition'] = True
-                        return
+    def prove_stores(self, ast):
+        # Assignments santa_infer proves type-safe compile to unchecked stores.
+        # Under a container budget every store is checked instead.
+        if self.budget is not None and self.budget.max_container_size is not None:
+            self.compiler.proven_stores = {}
+            return
+        self.compiler.proven_stores = prove_stores(ast, self)
+
+    def start_budget(self):
+        # Every run gets the whole budget again
+        if self.budget is not None:
+            self.budget.start()
+
+    def builtin_types(self):
+        # Types whose checks haven't been replaced with register_type_check
+        return frozenset(name for name, check in self.type_checks.items() if TYPE_CHECKS.get(name) is check)
+
+    def iter_execute(self, ast, max_pending=1024):
+        # Yields each delivered value while the program is still running
+        def execute(sink):
+            previous = self.deliver
+            self.deliver = self.budget.metered(sink) if self.budget is not None else sink
+            try:
+                self.execute(ast)
+            finally:
+                self.deliver = previous
+
+        return iter_deliveries(execute, max_pending)
 
-                    # Handle chainable method results
-                    if isinstance(evaluated_value, dict) and 'type' in evaluated_value:
-                        if self.type_check(evaluated_value['value'], var_type):
-                            self.variables[name]['value'] = evaluated_value['value']
-                            return
-
-                    # Then handle typed arrays
-                    if var_type.startswith('GIFT<'):
-                        element_type = self.variables[name]['element_type']
-                        if isinstance(evaluated_value, list):
-                            if not all(self.type_check(item, element_type) for item in evaluated_value):
-                                raise TypeError(f"❌ Ho ho NO! Array elements must be of type {element_type}")
-                        else:
-                            raise TypeError("❌ Ho ho NO! Value must be an array!")
-
-                    if self.type_check(evaluated_value, var_type):
-                        self.variables[name]['value'] = evaluated_value
-                    else:
-                        raise TypeError(f"❌ Ho ho NO! Type mismatch for {name}")
-
-                elif stmt_type == 'deliver':
-                    _, value = statement
-                    result = self.evaluate(value)
-                    self.output.append(str(result))
-
-                elif stmt_type == 'if':
-                    _, condition, true_block, false_block = statement
-                    if self.evaluate(condition):
-                        for stmt in true_block:
-                            self.execute_statement(stmt)
-                    else:
-                        for stmt in false_block:
-                            self.execute_statement(stmt)
-
-                elif stmt_type == 'while':
-                    _, condition, block = statement
-                    while self.evaluate(condition):
-                        for stmt in block:
-                            self.execute_statement(stmt)
-
-                elif stmt_type == 'foreach':
-                    _, var_name, iterable, block = statement
-                    iterable_value = self.evaluate(iterable)
-                    for item in iterable_value:
-                        self.variables[var_name] = {'type': 'TINSEL', 'value': item}
-                        for stmt in block:
-                            self.execute_statement(stmt)
-
-                elif stmt_type == 'count':
-                    _, count, block = statement
-                    count_val = self.evaluate(count)
-                    for _ in range(count_val):
-                        for stmt in block:
-                            self.execute_statement(stmt)
-
-                if statement[0] == 'workshop':
-                    name, params, ret_type, body = statement[1:]
-                    self.workshops[name] = {
-                        'params': params,
-                        'return_type': ret_type,
-                        'body': body,
-                        'name': name  # Add name to help with error messages
-                    }
-
-                elif stmt_type == 'magic_workshop':
-                    name, params, body = statement[1:]
-                    self.workshops[name] = {
-                        'params': params,
-                        'body': body,
-                        'is_magic': True
-                    }
-
-                elif stmt_type == 'try_catch':
-                    _, try_block, catch_block = statement
-                    try:
-                        for stmt in try_block:
-                            self.execute_statement(stmt)
-                    except Exception:
-                        for stmt in catch_block:
-                            self.execute_statement(stmt)
-
-                elif stmt_type == 'decorator':
-                    _, decorator_name, workshop = statement
-                    if decorator_name in self.decorators:
-                        decorated_workshop = self.decorators[decorator_name](workshop)
-                        self.execute_statement(decorated_workshop)
-                    else:
-                        raise NameError(f"❌ Ho ho NO! Decorator '{decorator_name}' not found!")
-
-                elif stmt_type == 'await':
-                    _, promise = statement
-                    self.loop.run_until_complete(asyncio.sleep(1))  # Simulate waiting
-
-                elif stmt_type == 'lambda':
-                    return  # Lambda definitions don't need immediate execution
-
-                elif stmt_type == 'nested_conditional':
-                    _, conditions, blocks = statement
-                    current_block = 0
-                    for condition in conditions:
-                        if self.evaluate(condition):
-                            for stmt in blocks[current_block]:
-                                self.execute_statement(stmt)
-                            break
-                        current_block += 1
-                    if current_block >= len(blocks):
-                        for stmt in blocks[-1]:  # Execute else block
-                            self.execute_statement(stmt)
-        except Exception as e:
-            if isinstance(e, (ValueError, ZeroDivisionError, TypeError)):
-                raise
-            print(f"❌ Ho ho NO! {str(e)}")
+    def execute_statement(self, statement):
+        self.compiler.compile_block([statement])(None)
+
+    def store_variable(self, name, evaluated_value):
+        if name not in self.variables:
+            raise NameError(f"❌ Ho ho NO! Variable '{name}' not declared!")
+        self.store_cell(self.variables[name], name, evaluated_value)
+
+    def store_cell(self, var, name, evaluated_value):
+        # Handle quantum types first
+        if var.quantum:
+            var.value = evaluated_value
+            var.superposition = True
+            return
+
+        # Handle chainable method results
+        if isinstance(evaluated_value, dict) and 'type' in evaluated_value:
+            if self.type_check(evaluated_value['value'], var.type):
+                var.value = evaluated_value['value']
+                return
+
+        # Then handle typed arrays
+        element_type = var.element_type
+        if element_type is not None:
+            if element_type in VECTOR_TYPES:
+                # Numeric buffers are homogeneous by construction, so only
+                # lists need their elements checked, once, as they're packed
+                if type(evaluated_value) is NumericGift:
+                    var.value = evaluated_value
+                    return
+                if isinstance(evaluated_value, list):
+                    gift = NumericGift.from_list(evaluated_value)
+                    if gift is not None:
+                        var.value = gift
+                        return
+            if not isinstance(evaluated_value, list):
+                still_running(evaluated_value)
+                raise TypeError("❌ Ho ho NO! Value must be an array!")
+            if not all(self.type_check(item, element_type) for item in evaluated_value):
+                raise TypeError(f"❌ Ho ho NO! Array elements must be of type {element_type}")
+            var.value = evaluated_value
+            return
+
+        if self.type_check(evaluated_value, var.type):
+            var.value = evaluated_value
+        else:
+            still_running(evaluated_value)
+            raise TypeError(f"❌ Ho ho NO! Type mismatch for {name}")
 
     def type_check(self, value, expected_type):
-        if isinstance(expected_type, str):
-            if expected_type.startswith('GIFT<'):
-                element_type = expected_type[5:-1]
+        checker = self.type_checks.get(expected_type)
+        if checker is not None:
+            return checker(value)
+
+        base_type, element_type = parse_type(expected_type)
+        if element_type is not None:
+            if base_type == 'GIFT':
+                if type(value) is NumericGift:
+                    return element_type in VECTOR_TYPES
                 if not isinstance(value, list):
                     return False
                 return all(self.type_check(item, element_type) for item in value)
 
-            if expected_type.startswith('QUANTUM_GIFT<'):
-                base_type = expected_type[13:-1]
-                return self.type_check(value, base_type)
-
-        type_checks = {
-            'MERRY': lambda x: isinstance(x, (int, float)),
-            'JINGLE': lambda x: isinstance(x, bool),
-            'SPARKLE': lambda x: isinstance(x, float),
-            'TINSEL': lambda x: isinstance(x, str),
-            'GIFT': lambda x: isinstance(x, (list, str, dict)),
-            'SLEIGH': lambda x: isinstance(x, dict),
-            'STOCKING': lambda x: isinstance(x, (list, deque)),
-            'SPIRIT': lambda x: isinstance(x, (int, float)) and 0 <= x <= 100,
-            'SNOWFLAKE': lambda x: True
-        }
+            if base_type == 'QUANTUM_GIFT':
+                return self.type_check(value, element_type)
 
-        checker = type_checks.get(expected_type)
-        return checker(value) if checker else True
+        return True
 
     def execute_method_call(self, obj_name, method_name, args):
-        if isinstance(obj_name, tuple) and obj_name[0] == 'method_result':
-            # Handle chained method calls
-            intermediate_result = self.execute_method_call(obj_name[1][1], obj_name[1][2], obj_name[1][3])
-            if isinstance(intermediate_result, dict) and 'type' in intermediate_result:
-                return self._execute_single_method_call(intermediate_result['value'], method_name, args)
-            return self._execute_single_method_call(intermediate_result, method_name, args)
-        elif isinstance(obj_name, str):
-            if obj_name not in self.variables:
-                raise NameError(f"❌ Ho ho NO! Object '{obj_name}' not found!")
-            var = self.variables[obj_name]
-            if 'superposition' in var and var['superposition']:
-                if method_name == 'MEASURE':
-                    return var['value']
-            value = var['value']
-            result = self._execute_single_method_call(value, method_name, args)
-            return result
-        else:
-            raise ValueError("❌ Ho ho NO! Invalid method call!")
+        return self.compiler.compile_expression(('method_call', obj_name, method_name, args))(None)
 
     def _execute_single_method_call(self, obj, method_name, args):
-        evaluated_args = [self.evaluate(arg) for arg in args]
+        return self.invoke_method(obj, method_name, [self.evaluate(arg) for arg in args])
+
+    def invoke_method(self, obj, method_name, evaluated_args):
         obj_type = self.get_type(obj)
 
         if isinstance(obj, dict) and 'type' in obj:
             obj_type = obj['type']
             obj = obj['value']
 
-        method_handlers = {
-            'TINSEL': {
-                'SPARKLE': lambda s, *_: {'type': 'TINSEL', 'value': f'✨{s}✨'},
-                'WRAP_TEXT': lambda s, *_: {'type': 'TINSEL', 'value': s.title()},  # Changed from WRAP
-                'UNTANGLE': lambda s, *_: {'type': 'TINSEL', 'value': s.strip()},
-                'COUNT_JOYS': lambda s, *_: len(s),
-                'TRIM_TREE': lambda s, *_: {'type': 'TINSEL', 'value': s.strip()},
-                'JINGLE_CASE': lambda s, *_: {'type': 'TINSEL', 'value': s.upper()},
-                'SILENT_NIGHT': lambda s, *_: {'type': 'TINSEL', 'value': s.lower()},
-                'GIFT_WRAP': lambda s, n, *_: {'type': 'TINSEL', 'value': s.center(n)},
-                'FIND_CHIMNEY': lambda s, sub, *_: s.find(sub),
-                'REPLACE_COAL': lambda s, old, new, *_: {'type': 'TINSEL', 'value': s.replace(old, new)}
-            },
-            'GIFT': {
-                'PACK': lambda lst, x, *_: lst.append(x) or lst,
-                'UNWRAP': lambda lst, *_: lst.pop() if lst else None,
-                'PEEK_INSIDE': lambda lst, *_: lst[-1] if lst else None,
-                'COUNT_JOYS': lambda lst, *_: len(lst)
-            },
-            'STOCKING': {
-                'PACK': lambda lst, x, *_: lst.append(x) or lst,
-                'PEEK_INSIDE': lambda lst, *_: lst[-1] if lst else None,
-                'UNWRAP': lambda lst, *_: lst.pop() if lst else None
-            },
-            'MERRY': {
-                'TO_TINSEL': lambda x, *_: str(x),
-                'TO_JINGLE': lambda x, *_: bool(x),
-                'MORE_FESTIVE': lambda x, y, *_: x > y
-            },
-            'SPIRIT': {
-                'TO_TINSEL': lambda x, *_: str(x),
-                'TO_JINGLE': lambda x, *_: bool(x)
-            }
-        }
-
-        # Add quantum type handlers dynamically
-        for base_type in ['TINSEL', 'MERRY']:
-            method_handlers[f'QUANTUM_GIFT<{base_type}>'] = {
-                'MEASURE': lambda x, *_: x
-            }
-
-        if obj_type in method_handlers and method_name in method_handlers[obj_type]:
-            result = method_handlers[obj_type][method_name](obj, *evaluated_args)
+        handlers = self.method_handlers.get(obj_type)
+        handler = handlers.get(method_name) if handlers else None
+        if handler is not None:
+            result = handler(obj, *evaluated_args)
             if isinstance(result, dict) and 'type' in result:
                 return result
-            if method_name in ['TRIM_TREE', 'JINGLE_CASE', 'SILENT_NIGHT', 'GIFT_WRAP', 'SPARKLE', 'WRAP',
-                               'WRAP_STRING']:
+            if method_name in TINSEL_RESULT_METHODS:
                 return {'type': 'TINSEL', 'value': result}
             return result
 
+        still_running(obj)
         raise ValueError(f"❌ Ho ho NO! Unknown method '{method_name}' for type {obj_type}")
 
     def get_type(self, value):
@@ -334,211 +357,234 @@ class SantaRuntime:
             return 'MERRY'
         elif isinstance(value, bool):
             return 'JINGLE'
-        elif isinstance(value, list):
+        elif isinstance(value, (list, NumericGift)):
             return 'GIFT'
         elif isinstance(value, dict):
             return 'SLEIGH'
-        elif isinstance(value, deque):
+        elif isinstance(value, (deque, range, StreamStocking)):
             return 'STOCKING'
         return 'SNOWFLAKE'
 
     def evaluate(self, expression):
-        if not isinstance(expression, tuple):
-            return expression
-
-        expr_type = expression[0]
-
-        if expr_type == 'value':
-            value = expression[1]
-            if isinstance(value, str) and value in self.variables:
-                return self.variables[value]['value']
-            return value
-
-        elif expr_type == 'arithmetic':
-            op = expression[1]
-            left = self.evaluate(expression[2])
-            right = self.evaluate(expression[3])
-            operators = {
-                'GIVE': lambda x, y: x + y,
-                'TAKE': lambda x, y: x - y,
-                'MULTIPLY_JOY': lambda x, y: x * y,
-                'SHARE': lambda x, y: x / y if y != 0 else float('inf'),  # Handle division by zero
-                'LEFTOVER_MAGIC': lambda x, y: x % y if y != 0 else float('inf'),
-                'POWER_OF_BELIEF': lambda x, y: x ** y,
-                'FLOOR_CHIMNEY': lambda x, y: x // y if y != 0 else float('inf'),
-                'ROUND_PRESENTS': lambda x, y: round(x, int(y)),
-                'MIN_GIFT': lambda x, y: min(x, y),
-                'MAX_GIFT': lambda x, y: max(x, y)
-            }
-            try:
-                return operators[op](left, right)
-            except ZeroDivisionError:
-                raise ValueError("Cannot divide by zero!")
-
-        elif expr_type == 'comparison':
-            op = expression[1]
-            left = self.evaluate(expression[2])
-            right = self.evaluate(expression[3])
-
-            operators = {
-                'MORE_FESTIVE': lambda x, y: x > y,
-                'LESS_FESTIVE': lambda x, y: x < y,
-                'SAME_GIFT': lambda x, y: x == y
-            }
-            return operators[op](left, right)
-
-        elif expr_type == 'array':
-            return [self.evaluate(item) for item in expression[1]]
-
-        elif expr_type == 'dictionary':
-            return {key: self.evaluate(value) for key, value in expression[1]}
-
-        elif expr_type == 'dictionary_access':
-            _, dict_name, key = expression
-            dict_obj = self.variables[dict_name]['value']
-            key_value = self.evaluate(key)
-            return dict_obj[key_value]
-
-        elif expr_type == 'boolean':
-            return expression[1]
-
-        elif expr_type == 'method_call':
-            _, obj_name, method_name, args = expression
-            return self.execute_method_call(obj_name, method_name, args)
-
-        elif expr_type == 'function_call':
-            name, args = expression[1:]
-            return self.execute_workshop_call(name, args)
-
-        elif expr_type == 'lambda':
-            param, body = expression[1:]
-            return lambda x: self.evaluate_with_context({param: {'type': 'MERRY', 'value': x}}, body)
-
-        return None
+        return self.compiler.compile_expression(expression)(None)
 
     def get_default_value(self, var_type):
         if var_type.startswith('GIFT<'):
-            return []
-        elif var_type == 'STOCKING':
-            return deque()
-
-        defaults = {
-            'MERRY': 0,
-            'JINGLE': False,
-            'SPARKLE': 0.0,
-            'TINSEL': "",
-            'GIFT': [],
-            'SNOWFLAKE': None,
-            'SPIRIT': 0,
-            'SLEIGH': {},
-            'STOCKING': deque()
-        }
-        return defaults.get(var_type, None)
+            return typed_array(parse_type(var_type)[1])
+
+        factory = DEFAULT_VALUES.get(var_type)
+        return factory() if factory else None
 
     def convert_type(self, value, conversion):
-        conversions = {
-            'TO_TINSEL': str,
-            'TO_JINGLE': bool
-        }
-        return conversions[conversion](value)
+        return CONVERSIONS[conversion](value)
 
     def cleanup(self):
-        pass
+        self.call_stack.close()
+        if self.loop is not None:
+            self.loop.close()
+            self.loop = None
 
     def get_variable(self, name):
         if name not in self.variables:
             raise NameError(f"Variable '{name}' not found!")
-        return self.variables[name]['value']
+        return self.variables[name].value
 
     def set_variable(self, name, value):
         if name not in self.variables:
             raise NameError(f"❌ Ho ho NO! Variable '{name}' not declared!")
-        if not self.type_check(value, self.variables[name]['type']):
+        if not self.type_check(value, self.variables[name].type):
             raise TypeError(f"❌ Ho ho NO! Type mismatch for {name}")
-        self.variables[name]['value'] = value
+        self.variables[name].value = value
 
     def execute_workshop_call(self, name, args):
-        if isinstance(name, str) and '.' in name:  # Handle function composition
-            functions = name.split('.')
-            result = None
-            current_args = args
-
-            for func in functions:
-                if func not in self.workshops:
-                    raise NameError(f"Workshop '{func}' not found!")
-
-                if result is not None:
-                    current_args = [result]
-
-                result = self._execute_single_workshop(func, current_args)
-
-            return result
-
-        return self._execute_single_workshop(name, args)
+        return self.compiler.compile_expression(('function_call', name, args))(None)
 
     def _execute_single_workshop(self, name, args):
+        return self.call_workshop(name, [self.evaluate(arg) for arg in args])
+
+    def call_workshop(self, name, evaluated_args):
         if name not in self.workshops:
             raise NameError(f"❌ Ho ho NO! Workshop '{name}' not found!")
 
         workshop = self.workshops[name]
         if workshop.get('is_magic'):
-            return self.execute_magic_workshop(workshop, args)
+            return self.execute_magic_workshop(workshop, evaluated_args)
 
         if 'wrapper' in workshop:
-            return workshop['wrapper'](*[self.evaluate(arg) for arg in args])
-
-        evaluated_args = [self.evaluate(arg) for arg in args]
-        param_vars = {}
-
-        for (param_type, param_name), arg_value in zip(workshop['params'], evaluated_args):
+            return workshop['wrapper'](*evaluated_args)
+        return self.run_workshop(workshop, evaluated_args)
+
+    def run_workshop(self, workshop, evaluated_args):
+        # Runs a script-defined workshop's own body, skipping any wrapper. A
+        # DELIVERed TailCall runs here in place of the call that made it, so
+        # tail recursion never grows the stack.
+        calls = self.call_stack
+        if calls.depth >= calls.segment_calls:
+            return calls.run_deeper(self.run_workshop, workshop, evaluated_args)
+        calls.depth += 1
+        try:
+            while True:
+                code = self.workshop_code(workshop)
+                frame = self.bind_parameters(workshop, code, evaluated_args)
+                delivered = code.run(frame)
+                if delivered is None:
+                    return None
+                result = delivered[0]
+                if type(result) is not TailCall:
+                    return result
+                workshop, evaluated_args = result.workshop, result.args
+        finally:
+            calls.depth -= 1
+
+    def bind_parameters(self, workshop, code, evaluated_args):
+        frame = [None] * code.frame_size
+        for slot, (param_type, param_name), arg_value in zip(code.param_slots, workshop['params'], evaluated_args):
             if not self.type_check(arg_value, param_type):
+                still_running(arg_value)
                 raise TypeError(f"❌ Ho ho NO! Parameter type mismatch for {param_name}")
-            param_vars[param_name] = {'type': param_type, 'value': arg_value}
-
-        old_vars = self.variables.copy()
-        self.variables.update(param_vars)
-
-        result = None
-        for stmt in workshop['body']:
-            if stmt[0] == 'deliver':
-                result = self.evaluate(stmt[1])
-                break
-            self.execute_statement(stmt)
-
-        self.variables = old_vars
-        return result
-
-    def execute_magic_workshop(self, workshop, args):
-        async def run_magic():
-            evaluated_args = [self.evaluate(arg) for arg in args]
-            param_vars = {}
-
-            for (param_type, param_name), arg_value in zip(workshop['params'], evaluated_args):
-                if not self.type_check(arg_value, param_type):
-                    raise TypeError(f"❌ Ho ho NO! Parameter type mismatch for {param_name}")
-                param_vars[param_name] = {'type': param_type, 'value': arg_value}
-
-            old_vars = self.variables.copy()
-            self.variables.update(param_vars)
-
-            result = None
-            for stmt in workshop['body']:
-                if stmt[0] == 'await':
-                    await asyncio.sleep(1)  # Simulated delay
-                elif stmt[0] == 'deliver':
-                    result = self.evaluate(stmt[1])
-                    break
+            frame[slot] = Cell(param_type, arg_value)
+        return frame
+
+    def workshop_code(self, workshop):
+        # Compiled on first use for workshops defined without code, such as
+        # those restored from a santa_image
+        code = workshop.get('code')
+        if code is None:
+            code = workshop['code'] = self.compiler.compile_workshop(workshop['params'], workshop['body'],
+                                                                     workshop.get('name'))
+        return code
+
+    def execute_magic_workshop(self, workshop, evaluated_args):
+        code = workshop.get('code')
+        if code is None:
+            code = workshop['code'] = self.compiler.compile_magic_workshop(workshop['params'], workshop['body'])
+        frame = self.bind_parameters(workshop, code, evaluated_args)
+        call = self.run_magic(code, frame)
+
+        if self.tasks is not None:
+            # The caller gets a MagicCall for the task. It goes on the
+            # program's loop even when a deep call is running on a CallStack
+            # helper thread.
+            task = self.tasks_loop.create_task(call)
+            self.tasks.add(task)
+            return MagicCall(task)
+        return self.event_loop().run_until_complete(call)
+
+    async def run_magic(self, code, frame):
+        delivered = await self.run_steps(code.run, frame)
+        return delivered[0] if delivered is not None else None
+
+    async def run_steps(self, steps, frame):
+        # Returns the 1-tuple a workshop DELIVERs, like a compiled block.
+        # Top-level DELIVERs (frame is None) go to the sink instead.
+        for kind, step, target in steps:
+            if kind == 'statement':
+                result = step(frame)
+                if result is not None:
+                    return result
+                continue
+
+            value = step(frame)
+            if kind == 'assign':
+                # A variable whose type the call doesn't fit gets its result;
+                # a SNOWFLAKE can hold the call itself, to wait on later
+                get_cell, name = target
+                var = get_cell(frame)
+                if var is None:
+                    raise NameError(f"❌ Ho ho NO! Variable '{name}' not declared!")
+                if inspect.isawaitable(value) and not self.type_check(value, var.type):
+                    value = await value
+                self.store_cell(var, name, value)
+                continue
+            if kind == 'await':
+                await self.wait(value)
+            elif inspect.isawaitable(value):
+                value = await value
+
+            if kind == 'deliver':
+                if frame is None:
+                    self.deliver(str(value))
                 else:
-                    self.execute_statement(stmt)
+                    return (value,)
+        return None
 
-            self.variables = old_vars
-            return result
+    async def wait(self, value):
+        # AWAIT_CHRISTMAS in the step runner. Waits for an awaitable, then
+        # sleeps if it gave a SNOOZE, as wait_blocking would on the stored
+        # result; anything else only lets the other tasks run.
+        while inspect.isawaitable(value):
+            value = await value
+        if type(value) is Snooze:
+            self.allow_wait(value.seconds)
+            await asyncio.sleep(value.seconds)
+        else:
+            await asyncio.sleep(0)
+
+    def wait_blocking(self, value):
+        # AWAIT_CHRISTMAS outside the step runner: plain execute(), or nested
+        # in a block, where there is no coroutine to suspend
+        if self.tasks is not None:
+            raise RuntimeError("❌ Ho ho NO! AWAIT_CHRISTMAS can only pause at the top level of a "
+                               "MAGIC_WORKSHOP or program!")
+        while inspect.isawaitable(value):
+            value = self.event_loop().run_until_complete(_settle(value))
+        if type(value) is Snooze:
+            self.allow_wait(value.seconds)
+            time.sleep(value.seconds)
+        return None
+
+    def allow_wait(self, seconds):
+        if seconds and self.budget is not None:
+            self.budget.allow_wait(seconds)
 
-        return self.loop.run_until_complete(run_magic())
+    def event_loop(self):
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        return self.loop
 
     def evaluate_with_context(self, context, expression):
-        old_vars = self.variables.copy()
-        self.variables.update(context)
-        result = self.evaluate(expression)
-        self.variables = old_vars
-        return result
\ No newline at end of file
+        scope = Scope(context)
+        expression_fn = self.compiler.compile_in_scope(scope, False, self.compiler.compile_expression, expression)
+        frame = [None] * scope.size
+        for name, var in context.items():
+            frame[scope.slots[name]] = Cell.from_dict(var)
+        return expression_fn(frame)
+
+
+class MagicCall:
+    # What a MAGIC_WORKSHOP call gives under execute_async while it runs on
+    # as a task. DELIVER and AWAIT_CHRISTMAS wait for its result, and so does
+    # assigning it at the top level to a variable of any type but SNOWFLAKE.
+    # Anything else that needs the value, such as an operator, a condition,
+    # a method call or a typed store, fails clearly instead of using the
+    # task itself.
+    __slots__ = ('task',)
+
+    def __init__(self, task):
+        self.task = task
+
+    def __await__(self):
+        return self.task.__await__()
+
+    def _still_running(self, *args):
+        still_running(self)
+
+    __add__ = __radd__ = __sub__ = __rsub__ = __mul__ = __rmul__ = _still_running
+    __truediv__ = __rtruediv__ = __floordiv__ = __rfloordiv__ = __mod__ = __rmod__ = _still_running
+    __pow__ = __rpow__ = __round__ = __lt__ = __le__ = __gt__ = __ge__ = __eq__ = __ne__ = _still_running
+    __bool__ = __len__ = __iter__ = __getitem__ = __str__ = _still_running
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return f'<MAGIC_WORKSHOP call {self.task.get_name()}>'
+
+
+def still_running(value):
+    if type(value) is MagicCall:
+        raise TypeError("❌ Ho ho NO! A MAGIC_WORKSHOP call was used before it finished! DELIVER it, "
+                        "AWAIT_CHRISTMAS it or assign it at the top level first")
+
+
+async def _settle(awaitable):
+    # run_until_complete only takes coroutines and futures
+    return await awaitable
@@ -0,0 +1,249 @@
+# santa_server.py
+import argparse
+import contextvars
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from santa_cache import DEFAULT_CACHE_DIR
+
+# Scripts are sent as one JSON line; the server answers with a JSON line per
+# event: {"out": text} for anything the run printed, {"deliver": text} for
+# each DELIVER, and a final {"exit": status}.
+DEFAULT_ADDRESS = os.environ.get('SANTA_SERVER', os.path.join(tempfile.gettempdir(), f'santa-{os.getuid()}.sock')
+                                 if hasattr(os, 'getuid') else '127.0.0.1:7252')
+DEFAULT_WORKERS = 4
+STARTUP_TIMEOUT = 10.0
+
+
+def parse_address(address):
+    # "host:port" is localhost TCP, anything else a Unix socket path
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit() and os.sep not in address:
+        return socket.AF_INET, (host or '127.0.0.1', int(port))
+    return socket.AF_UNIX, address
+
+
+class _ThreadOutput(io.TextIOBase):
+    # Stands in for sys.stdout so each request's prints go back to its own
+    # client; code outside a request keeps writing to the real stream. A
+    # context variable rather than a thread-local, so it follows deep calls
+    # onto the runtime's CallStack helper threads.
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.send = contextvars.ContextVar('send', default=None)
+
+    def write(self, text):
+        send = self.send.get()
+        if send is None:
+            return self.fallback.write(text)
+        send({'out': text})
+        return len(text)
+
+    def flush(self):
+        if self.send.get() is None:
+            self.fallback.flush()
+
+
+class ScriptHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        lock = threading.Lock()
+
+        def send(message):
+            with lock:
+                self.wfile.write(json.dumps(message).encode('utf-8') + b'\n')
+                self.wfile.flush()
+
+        with self.server.workers:
+            status = self.server.run(request, send)
+        send({'exit': status})
+
+
+class _ServerMixin(socketserver.ThreadingMixIn):
+    daemon_threads = True
+
+    def setup_runner(self, workers, limits=None, cache_dir=None, images=()):
+        # At most `workers` scripts run at once; each gets a fresh runtime
+        # while the parser tables and parsed programs stay warm. limits cap
+        # every script's budget; clients can only ask for tighter ones.
+        # Parsed programs are cached in cache_dir, which the server owns: a
+        # client's paths are never used to find files, as cache entries are
+        # unpickled. For the same reason scripts can only start from the
+        # santa_image files in images, which the operator chose.
+        from santa import run_santa_script
+        from santa_budget import tightest
+        import santa_parser
+
+        santa_parser.get_parser()
+        self.run_santa_script = run_santa_script
+        self.tightest = tightest
+        self.limits = limits or {}
+        self.cache_dir = cache_dir
+        self.images = {os.path.realpath(image): image for image in images}
+        if cache_dir is not None:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        self.workers = threading.BoundedSemaphore(workers)
+        self.output = _ThreadOutput(sys.stdout)
+        sys.stdout = self.output
+
+    def allowed_image(self, requested):
+        # The configured image the client asked for; any other path is refused
+        if requested is None:
+            return None
+        image = self.images.get(os.path.realpath(requested))
+        if image is None:
+            raise PermissionError(f"❌ Ho ho NO! This santa_server wasn't started with --image {requested}")
+        return image
+
+    def run(self, request, send):
+        cache_dir = self.cache_dir if request.get('cache', True) else None
+        token = self.output.send.set(send)
+        try:
+            image = self.allowed_image(request.get('image'))
+            self.run_santa_script(request['code'], use_vm=request.get('vm', False), cache_dir=cache_dir,
+                                  sink=lambda text: send({'deliver': text}),
+                                  memo_stats=request.get('memo_stats', False), opt_level=request.get('opt_level'),
+                                  limits=self.tightest(self.limits, request.get('limits') or {}),
+                                  image=image)
+            return 0
+        except Exception as e:
+            print(f"🎅 Ho ho NO! An unexpected error occurred: {str(e)}")
+            return 1
+        finally:
+            self.output.send.reset(token)
+
+
+class TCPScriptServer(_ServerMixin, socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class UnixScriptServer(_ServerMixin, socketserver.UnixStreamServer):
+        pass
+
+
+def serve(address=DEFAULT_ADDRESS, workers=DEFAULT_WORKERS, limits=None, cache_dir=DEFAULT_CACHE_DIR, images=()):
+    family, addr = parse_address(address)
+    if family == socket.AF_UNIX:
+        # A socket file left behind by a server that died would block bind()
+        if os.path.exists(addr) and not _is_listening(address):
+            os.remove(addr)
+        server = UnixScriptServer(addr, ScriptHandler)
+    else:
+        server = TCPScriptServer(addr, ScriptHandler)
+    server.setup_runner(workers, limits, cache_dir, images)
+    # SIGTERM unwinds like Ctrl-C so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.remove(addr)
+
+
+def connect(address=DEFAULT_ADDRESS):
+    family, addr = parse_address(address)
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.connect(addr)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _is_listening(address):
+    try:
+        connect(address).close()
+    except OSError:
+        return False
+    return True
+
+
+def ensure_server(address=DEFAULT_ADDRESS):
+    # Starts a detached server on first use and waits for it to accept
+    if _is_listening(address):
+        return
+    subprocess.Popen([sys.executable, os.path.abspath(__file__), '--address', address],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while not _is_listening(address):
+        if time.monotonic() > deadline:
+            raise ConnectionError(f"santa_server did not start on {address}")
+        time.sleep(0.02)
+
+
+def submit(code, filename, use_vm=False, use_cache=True, address=DEFAULT_ADDRESS, memo_stats=False, opt_level=None,
+           limits=None, image=None):
+    # Yields the server's events for one script as they arrive
+    with connect(address) as sock:
+        # The filename is only for display; the server never opens it
+        request = {'code': code, 'filename': os.path.basename(filename), 'vm': use_vm, 'cache': use_cache,
+                   'memo_stats': memo_stats, 'opt_level': opt_level, 'limits': limits,
+                   'image': os.path.abspath(image) if image is not None else None}
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with sock.makefile('r', encoding='utf-8') as events:
+            for line in events:
+                yield json.loads(line)
+
+
+def run_remote(filename, use_vm=False, use_cache=True, address=DEFAULT_ADDRESS, memo_stats=False, opt_level=None,
+               limits=None, image=None):
+    # Client side of `santa.py --server`: same output and exit status as a
+    # local run, printed as the server streams it
+    from santa_output import WriterSink
+
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            code = f.read()
+    except FileNotFoundError:
+        print(f"🎅 Ho ho NO! Could not find file: {filename}")
+        return 1
+
+    try:
+        ensure_server(address)
+        with WriterSink(sys.stdout, '🎁 {}\n', buffer_size=0, header='\n🎄 Output:\n') as sink:
+            for event in submit(code, filename, use_vm, use_cache, address, memo_stats, opt_level, limits, image):
+                if 'deliver' in event:
+                    sink(event['deliver'])
+                elif 'out' in event:
+                    sink.flush()
+                    sys.stdout.write(event['out'])
+                elif 'exit' in event:
+                    return event['exit']
+    except OSError as e:
+        print(f"🎅 Ho ho NO! Could not reach santa_server: {str(e)}")
+    return 1
+
+
+def main():
+    from santa import add_budget_arguments, budget_limits
+
+    arg_parser = argparse.ArgumentParser(usage="python santa_server.py [--address ADDRESS] [--workers N] "
+                                               "[--max-steps N] [--timeout SECONDS] [--max-output BYTES] "
+                                               "[--max-size N] [--cache-dir DIR] [--image FILE ...]")
+    arg_parser.add_argument('--address', default=DEFAULT_ADDRESS,
+                            help="Unix socket path, or host:port for localhost TCP")
+    arg_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="scripts run at the same time")
+    arg_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                            help=f"where parsed programs are cached (default: {DEFAULT_CACHE_DIR})")
+    arg_parser.add_argument('--image', action='append', default=[], metavar='FILE',
+                            help="a santa_image clients may start scripts from; repeat for more")
+    add_budget_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    serve(args.address, args.workers, budget_limits(args), os.path.abspath(args.cache_dir),
+          [os.path.abspath(image) for image in args.image])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# santa_stack.py
+import contextvars
+import queue
+import sys
+import threading
+import weakref
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+# Python frames a single workshop call can take on the closure runtime. A
+# plain recursive call is about seven; calls nested inside loops and
+# conditionals take a few more.
+FRAMES_PER_CALL = 24
+# Head room left for whatever called execute(), and for builtins and methods
+RESERVED_FRAMES = 100
+# Helper threads one CallStack may start: a few thousand nested calls at the
+# default recursion limit, which leaves a runaway recursion only a few
+# milliseconds and threads to fail in. The VM's frame stack has no limit.
+MAX_SEGMENTS = 128
+# Helper threads all the CallStacks in the process may have at once, so
+# server workers and other concurrent runtimes can't add up to more threads
+# than the process may start. Running out of them breaks Python in ways that
+# can't be recovered from.
+MAX_HELPER_THREADS = 4 * MAX_SEGMENTS
+
+
+class CallsTooDeep(RecursionError):
+    # Workshop calls nested deeper than a CallStack can carry them. As with a
+    # spent budget, nothing in the script can catch it.
+    pass
+
+
+def _thread_allowance():
+    # MAX_HELPER_THREADS, or an eighth of the processes and threads this
+    # user may run if that's fewer
+    if resource is not None:
+        soft, _ = resource.getrlimit(resource.RLIMIT_NPROC)
+        if soft != resource.RLIM_INFINITY:
+            return max(1, min(MAX_HELPER_THREADS, soft // 8))
+    return MAX_HELPER_THREADS
+
+
+_helper_threads = threading.BoundedSemaphore(_thread_allowance())
+
+
+class TailCall:
+    # What a workshop DELIVERs when its result is another workshop's call.
+    # run_workshop runs the callee in place of the caller instead of nesting.
+    __slots__ = ('workshop', 'args')
+
+    def __init__(self, workshop, args):
+        self.workshop = workshop
+        self.args = args
+
+
+class CallStack:
+    # Nesting depth of workshop calls for one runtime. Once segment_calls calls
+    # are nested, the next one carries on in a helper thread, which starts
+    # with a fresh Python recursion budget. Deep recursion is then bounded by
+    # memory, not sys.getrecursionlimit(). The thread that hands a call over
+    # waits for it, so only one of them ever runs. Helper threads are kept for
+    # reuse until close(). Past max_segments of them, or when the process has
+    # no helper thread to spare, the call raises CallsTooDeep.
+    __slots__ = ('depth', 'level', 'segment_calls', 'max_segments', 'segments', '__weakref__')
+
+    def __init__(self, segment_calls=None, max_segments=MAX_SEGMENTS):
+        if segment_calls is None:
+            segment_calls = max(8, (sys.getrecursionlimit() - RESERVED_FRAMES) // FRAMES_PER_CALL)
+        self.depth = 0  # calls nested in the current segment
+        self.level = 0  # segments below the current one
+        self.segment_calls = segment_calls
+        self.max_segments = max_segments
+        self.segments = []
+        weakref.finalize(self, _stop, self.segments)
+
+    @property
+    def total_depth(self):
+        return self.level * self.segment_calls + self.depth
+
+    @property
+    def max_depth(self):
+        # Nested calls this stack can carry
+        return (self.max_segments + 1) * self.segment_calls
+
+    def run_deeper(self, fn, *args):
+        # fn(*args) on the next segment's thread; returns or raises as fn did
+        level = self.level
+        if level == len(self.segments):
+            if level >= self.max_segments:
+                raise self.too_deep()
+            if not _helper_threads.acquire(blocking=False):
+                raise CallsTooDeep(f"❌ Ho ho NO! Too many deep workshop calls running at once to go past "
+                                   f"{self.total_depth} deep!")
+            try:
+                self.segments.append(_start_segment())
+            except RuntimeError:
+                _helper_threads.release()
+                raise self.too_deep() from None
+        depth = self.depth
+        self.depth, self.level = 0, level + 1
+        try:
+            return _call(self.segments[level], fn, args)
+        finally:
+            self.depth, self.level = depth, level
+
+    def too_deep(self):
+        return CallsTooDeep(f"❌ Ho ho NO! Workshop calls nested more than {self.total_depth} deep!")
+
+    def close(self):
+        _stop(self.segments)
+
+
+def _start_segment():
+    requests = queue.SimpleQueue()
+    threading.Thread(target=_serve, args=(requests,), name='santa-stack', daemon=True).start()
+    return requests
+
+
+def _serve(requests):
+    while True:
+        request = requests.get()
+        if request is None:
+            return
+        context, fn, args, reply, done = request
+        try:
+            reply.append(True)
+            reply.append(context.run(fn, *args))
+        except BaseException as e:
+            reply[:] = [False, e]
+        finally:
+            done.release()
+
+
+def _call(requests, fn, args):
+    # Context variables (such as a server's per-client output) follow the
+    # call onto the helper thread
+    done = threading.Lock()
+    done.acquire()
+    reply = []
+    requests.put((contextvars.copy_context(), fn, args, reply, done))
+    done.acquire()
+    ok, value = reply
+    if not ok:
+        raise value
+    return value
+
+
+def _stop(segments):
+    for requests in segments:
+        requests.put(None)
+        _helper_threads.release()
+    segments.clear()
@@ -0,0 +1,256 @@
+# santa_vectors.py
+from array import array
+from itertools import repeat
+import operator
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; the array module covers everything
+    numpy = None
+
+# Element types stored in a contiguous buffer instead of a list
+VECTOR_TYPES = frozenset(['MERRY'])
+NUMPY_DTYPES = {'q': 'int64', 'd': 'float64'}
+# The only children each buffer holds exactly; a bool or an int in a 'd'
+# buffer would come back changed
+BUFFER_ELEMENT_TYPES = {'q': int, 'd': float}
+# array('q'/'d') normally; a read-only memoryview for memory-mapped files
+BUFFER_TYPES = (array, memoryview)
+INT64_LIMIT = 2 ** 63
+
+
+class NumericGift:
+    # GIFT<MERRY> contents: whole numbers in array('q'), floats in
+    # array('d'). The buffer only ever holds numbers, so assignments never
+    # re-check elements, and GIVE/TAKE/MULTIPLY_JOY/MIN_GIFT/MAX_GIFT run over
+    # the whole buffer at once. Children are never changed to fit a buffer:
+    # once a gift holds a mix of whole numbers and floats, or a number too
+    # big for 64 bits, data becomes a plain list of them, and results that
+    # wouldn't fit come back as plain lists, with or without NumPy. A
+    # memory-mapped buffer is only copied into an array the first time the
+    # gift is changed.
+    __slots__ = ('data',)
+
+    def __init__(self, data=None):
+        self.data = data if data is not None else array('q')
+
+    @classmethod
+    def from_list(cls, items):
+        # None unless items are all whole numbers that fit a machine word, or
+        # all floats, so the caller keeps anything else as an exact list
+        kinds = set(map(type, items))
+        if kinds <= {int}:
+            try:
+                return cls(array('q', items))
+            except OverflowError:
+                return None
+        if kinds == {float}:
+            return cls(array('d', items))
+        return None
+
+    def __reduce__(self):
+        # A memory-mapped buffer is pickled as an array copy, not the mapping
+        data = self.data
+        if type(data) is memoryview:
+            data = array(data.format, data.tobytes())
+        return NumericGift, (data,)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return NumericGift(self.data[index])
+        return self.data[index]
+
+    def __eq__(self, other):
+        if isinstance(other, NumericGift):
+            if type(self.data) is list or type(other.data) is list:
+                return self.tolist() == other.tolist()
+            return self.data == other.data
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.tolist())
+
+    def __repr__(self):
+        return f'NumericGift({self.tolist()!r})'
+
+    def tolist(self):
+        data = self.data
+        return data if type(data) is list else data.tolist()
+
+    def writable(self):
+        data = self.data
+        if type(data) is memoryview:
+            data = array(data.format)
+            data.frombytes(self.data.cast('B'))
+            self.data = data
+        return data
+
+    def as_list(self):
+        # From here on the children are kept exactly as given
+        if type(self.data) is not list:
+            self.data = self.data.tolist()
+        return self.data
+
+    def append(self, item):
+        data = self.writable()
+        if type(data) is not list:
+            if type(item) is BUFFER_ELEMENT_TYPES[data.typecode]:
+                try:
+                    data.append(item)
+                    return
+                except OverflowError:
+                    pass
+            elif not data and type(item) is float:
+                self.data = array('d', [item])  # first child of an empty gift
+                return
+        if not isinstance(item, (int, float)):
+            raise TypeError("❌ Ho ho NO! Array elements must be of type MERRY")
+        self.as_list().append(item)
+
+    def extend(self, items):
+        if not all(isinstance(item, (int, float)) for item in items):
+            raise TypeError("❌ Ho ho NO! Array elements must be of type MERRY")
+        data = self.writable()
+        extra = NumericGift.from_list(items) if type(data) is not list else None
+        if extra is None:
+            self.as_list().extend(items)
+        elif not data:
+            self.data = extra.data
+        elif data.typecode == extra.data.typecode:
+            data.extend(extra.data)
+        else:
+            self.as_list().extend(items)
+
+    def pop(self):
+        return self.writable().pop()
+
+    # Whole-array arithmetic
+
+    def combine(self, other, python_op, numpy_name, reverse=False):
+        left = self.data
+        if isinstance(other, NumericGift):
+            right = other.data
+            if len(right) != len(left):
+                raise ValueError("❌ Ho ho NO! Gifts must be the same size!")
+        elif isinstance(other, (int, float)):
+            right = other
+        else:
+            return NotImplemented
+        if reverse:
+            left, right = right, left
+
+        # NumPy only gets operands whose results it gives exactly as Python
+        # would: no mixed-type MIN_GIFT/MAX_GIFT, and no whole-number result
+        # that could wrap at 64 bits
+        left_code, right_code = _typecode(left), _typecode(right)
+        if numpy is not None and len(self.data) and left_code is not None and right_code is not None:
+            typecode = 'q' if left_code == right_code == 'q' else 'd'
+            if numpy_name in ('minimum', 'maximum'):
+                exact = left_code == right_code
+            else:
+                exact = typecode == 'd' or _int64_safe(numpy_name, left, right)
+            if exact:
+                result = getattr(numpy, numpy_name)(_as_numpy(left), _as_numpy(right))
+                data = array(typecode)
+                data.frombytes(result.astype(NUMPY_DTYPES[typecode], copy=False).tobytes())
+                return NumericGift(data)
+
+        values = list(_apply(python_op, left, right))
+        gift = NumericGift.from_list(values)
+        return gift if gift is not None else values  # mixed or past 64 bits; keep it exact
+
+    def __add__(self, other):
+        return self.combine(other, operator.add, 'add')
+
+    def __radd__(self, other):
+        return self.combine(other, operator.add, 'add', reverse=True)
+
+    def __sub__(self, other):
+        return self.combine(other, operator.sub, 'subtract')
+
+    def __rsub__(self, other):
+        return self.combine(other, operator.sub, 'subtract', reverse=True)
+
+    def __mul__(self, other):
+        return self.combine(other, operator.mul, 'multiply')
+
+    def __rmul__(self, other):
+        return self.combine(other, operator.mul, 'multiply', reverse=True)
+
+
+def _typecode(data):
+    # The buffer typecode data fits exactly, or None for a list or a bool
+    if type(data) is array:
+        return data.typecode
+    if type(data) is memoryview:
+        return data.format
+    if type(data) is int:
+        return 'q' if -INT64_LIMIT <= data < INT64_LIMIT else None
+    return 'd' if type(data) is float else None
+
+
+def _int64_safe(numpy_name, left, right):
+    # Whether whole numbers this big can't wrap when added, subtracted or
+    # multiplied in int64
+    left_size, right_size = _magnitude(left), _magnitude(right)
+    bound = left_size * right_size if numpy_name == 'multiply' else left_size + right_size
+    return bound < INT64_LIMIT
+
+
+def _magnitude(value):
+    if isinstance(value, BUFFER_TYPES):
+        values = _as_numpy(value)
+        return max(int(values.max()), -int(values.min())) if len(values) else 0
+    return abs(value)
+
+
+def _apply(python_op, left, right):
+    sized = (list,) + BUFFER_TYPES
+    if isinstance(left, sized) and isinstance(right, sized):
+        return map(python_op, left, right)
+    if isinstance(left, sized):
+        return map(python_op, left, repeat(right))
+    return map(python_op, repeat(left), right)
+
+
+def _as_numpy(value):
+    if isinstance(value, BUFFER_TYPES):
+        return numpy.frombuffer(value, dtype=NUMPY_DTYPES[_typecode(value)])
+    return value
+
+
+def _elementwise(x, y, python_op, numpy_name):
+    if type(x) is NumericGift:
+        result = x.combine(y, python_op, numpy_name)
+    else:
+        result = y.combine(x, python_op, numpy_name, reverse=True)
+    if result is NotImplemented:
+        raise TypeError(f"❌ Ho ho NO! Can't combine {type(x).__name__} and {type(y).__name__}")
+    return result
+
+
+def gift_min(x, y):
+    if type(x) is NumericGift or type(y) is NumericGift:
+        return _elementwise(x, y, min, 'minimum')
+    return min(x, y)
+
+
+def gift_max(x, y):
+    if type(x) is NumericGift or type(y) is NumericGift:
+        return _elementwise(x, y, max, 'maximum')
+    return max(x, y)
+
+
+def typed_array(element_type):
+    # Empty value for a freshly declared GIFT<element_type>
+    return NumericGift() if element_type in VECTOR_TYPES else []
@@ -0,0 +1,840 @@
+# santa_vm.py
+from santa_budget import BudgetExceeded
+from santa_compiler import ARITHMETIC_OPERATORS, Scope, declared_names, is_tail_call, loop_range
+from santa_cells import Cell, LoopCell
+from santa_runtime import SantaRuntime
+from santa_stack import CallsTooDeep
+from santa_vectors import typed_array
+
+# Opcodes. Every instruction is two list entries: the opcode and its argument.
+LOAD_CONST = 0
+LOAD_NAME = 1
+LOAD_FAST = 2
+LOAD_CELL = 3
+STORE_NAME = 4
+STORE_FAST = 5
+DECLARE_NAME = 6
+DECLARE_FAST = 7
+BIND_NAME = 8
+BIND_FAST = 9
+POP_TOP = 10
+ADD = 11
+SUB = 12
+MUL = 13
+BINARY_OP = 14
+GREATER = 15
+LESS = 16
+EQUAL = 17
+BUILD_LIST = 18
+BUILD_MAP = 19
+SUBSCR = 20
+JUMP = 21
+POP_JUMP_IF_FALSE = 22
+GET_ITER = 23
+RANGE_ITER = 24
+FOR_ITER = 25
+FOR_SKIP = 26
+CALL_METHOD = 27
+CALL_WORKSHOP = 28
+DEFINE_WORKSHOP = 29
+MAKE_LAMBDA = 30
+RUN_COMPILED = 31
+DELIVER = 32
+RETURN_VALUE = 33
+LOAD_DEREF = 34
+TAIL_CALL = 35
+STORE_NAME_PROVEN = 36
+STORE_FAST_PROVEN = 37
+CHARGE = 38
+EVAL_COMPILED = 39
+RUN_LOOP = 40
+
+OPCODE_NAMES = (
+    'LOAD_CONST', 'LOAD_NAME', 'LOAD_FAST', 'LOAD_CELL', 'STORE_NAME', 'STORE_FAST',
+    'DECLARE_NAME', 'DECLARE_FAST', 'BIND_NAME', 'BIND_FAST', 'POP_TOP',
+    'ADD', 'SUB', 'MUL', 'BINARY_OP', 'GREATER', 'LESS', 'EQUAL',
+    'BUILD_LIST', 'BUILD_MAP', 'SUBSCR',
+    'JUMP', 'POP_JUMP_IF_FALSE', 'GET_ITER', 'RANGE_ITER', 'FOR_ITER', 'FOR_SKIP',
+    'CALL_METHOD', 'CALL_WORKSHOP', 'DEFINE_WORKSHOP', 'MAKE_LAMBDA', 'RUN_COMPILED',
+    'DELIVER', 'RETURN_VALUE', 'LOAD_DEREF', 'TAIL_CALL', 'STORE_NAME_PROVEN', 'STORE_FAST_PROVEN',
+    'CHARGE', 'EVAL_COMPILED', 'RUN_LOOP'
+)
+
+FAST_ARITHMETIC = {'GIVE': ADD, 'TAKE': SUB, 'MULTIPLY_JOY': MUL}
+FAST_COMPARISON = {'MORE_FESTIVE': GREATER, 'LESS_FESTIVE': LESS, 'SAME_GIFT': EQUAL}
+# Expressions that can't call a workshop, so they never need a frame of
+# their own. A statement built only from these, loops and conditionals
+# included, runs as one closure-compiled instruction instead of a load,
+# operate and store per node.
+FUSIBLE_KINDS = frozenset(['value', 'boolean', 'arithmetic', 'comparison', 'method_call', 'array', 'dictionary'])
+DECLARE_KINDS = frozenset(['declare', 'declare_quantum', 'declare_typed_array'])
+
+_DONE = object()
+
+
+class SantaCode:
+    __slots__ = ('name', 'code', 'constants', 'names', 'local_names', 'frame_size', 'param_slots', 'handlers')
+
+    def __init__(self, name, code, constants, names, local_names, param_slots, handlers):
+        self.name = name
+        self.code = code
+        self.constants = constants
+        self.names = names
+        self.local_names = local_names
+        self.frame_size = len(local_names)
+        self.param_slots = param_slots
+        # (start, end, stack_depth, catch_target); innermost ranges come first
+        self.handlers = handlers
+
+    def disassemble(self):
+        lines = []
+        for pc in range(0, len(self.code), 2):
+            op, arg = self.code[pc], self.code[pc + 1]
+            lines.append(f'{pc:5d} {OPCODE_NAMES[op]:<18} {arg}')
+        return '\n'.join(lines)
+
+
+class BytecodeCompiler:
+    def __init__(self, runtime, name='<program>', params=(), body=(), parent=None):
+        self.runtime = runtime
+        self.name = name
+        self.code = []
+        self.constants = []
+        self.constant_index = {}
+        self.names = []
+        self.name_index = {}
+        self.handlers = []
+        self.depth = 0  # iterators held on the stack by enclosing loops
+        self.try_depth = 0  # enclosing BELIEVE blocks; no tail calls inside them
+        self.in_workshop = name != '<program>'
+        self.scope = None
+        self.param_slots = ()
+        if self.in_workshop:
+            self.scope = Scope([param_name for _, param_name in params] + declared_names(body), parent)
+            self.param_slots = tuple(self.scope.slots[param_name] for _, param_name in params)
+
+    def compile_program(self, statements):
+        self.compile_block(statements)
+        self.emit(LOAD_CONST, self.constant(None))
+        self.emit(RETURN_VALUE)
+        return self.finish()
+
+    def finish(self):
+        local_names = [None] * (self.scope.size if self.scope is not None else 0)
+        if self.scope is not None:
+            for local_name, slot in self.scope.slots.items():
+                local_names[slot] = local_name
+        return SantaCode(self.name, self.code, tuple(self.constants), tuple(self.names),
+                         tuple(local_names), self.param_slots, tuple(self.handlers))
+
+    def emit(self, op, arg=0):
+        self.code.append(op)
+        self.code.append(arg)
+        return len(self.code) - 1
+
+    def label(self):
+        return len(self.code)
+
+    def patch(self, position, target):
+        self.code[position] = target
+
+    def constant(self, value):
+        try:
+            key = (type(value), value)
+            hash(key)
+        except TypeError:
+            self.constants.append(value)
+            return len(self.constants) - 1
+        if key not in self.constant_index:
+            self.constant_index[key] = len(self.constants)
+            self.constants.append(value)
+        return self.constant_index[key]
+
+    def intern_name(self, value):
+        if value not in self.name_index:
+            self.name_index[value] = len(self.names)
+            self.names.append(value)
+        return self.name_index[value]
+
+    def resolve(self, name):
+        # (depth, slot) for names bound in this or an enclosing frame
+        return self.scope.resolve(name) if self.scope is not None else None
+
+    def local_slot(self, name):
+        resolved = self.resolve(name)
+        return resolved[1] if resolved is not None and resolved[0] == 0 else None
+
+    def compile_block(self, statements):
+        for statement in statements:
+            start = self.label()
+            self.compile_statement(statement)
+            self.handlers.append((start, self.label(), self.depth, None))
+
+    def charge(self, block):
+        # Only emitted under a step or time budget: each pass of a loop pays
+        # for its body's statements just before jumping back
+        budget = self.runtime.budget
+        if budget is not None and budget.counts_steps:
+            self.emit(CHARGE, len(block) or 1)
+
+    def compile_statement(self, statement):
+        if not isinstance(statement, tuple):
+            return
+        if _worth_fusing(statement) and self.fusible_statement(statement):
+            self.emit(RUN_COMPILED, self.constant(self.closure(self.runtime.compiler.compile_statement, statement)))
+            return
+        handler = getattr(self, f'_stmt_{statement[0]}', None)
+        if handler is None:
+            # Rare statements run through the closure compiler
+            self.emit(RUN_COMPILED, self.constant(self.closure(self.runtime.compiler.compile_statement, statement)))
+            return
+        handler(statement)
+
+    def fusible_statement(self, statement):
+        # Whether statement can run as one closure: it calls no workshop, and
+        # no DELIVER in it returns from this one. The closure compiler's
+        # stores are proven or checked as the VM's are, and its loops pay
+        # the budget the same.
+        kind = statement[0]
+        if kind in DECLARE_KINDS:
+            return True
+        if kind == 'assign':
+            return _fusible(statement[2])
+        if kind == 'method_call':
+            return _fusible(statement)
+        if kind == 'deliver':
+            return not self.in_workshop and _fusible(statement[1])
+        if kind == 'if':
+            return _fusible(statement[1]) and self.fusible_block(statement[2]) and self.fusible_block(statement[3])
+        if kind == 'nested_conditional':
+            return (all(_fusible(condition) for condition in statement[1])
+                    and all(self.fusible_block(block) for block in statement[2]))
+        if kind in ('while', 'count'):
+            return _fusible(statement[1]) and self.fusible_block(statement[2])
+        if kind == 'foreach':
+            return _fusible(statement[2]) and self.fusible_block(statement[3])
+        if kind == 'try_catch':
+            return self.fusible_block(statement[1]) and self.fusible_block(statement[2])
+        return False
+
+    def fusible_block(self, statements):
+        return all(not isinstance(statement, tuple) or self.fusible_statement(statement) for statement in statements)
+
+    def closure(self, compile_fn, node):
+        # node compiled by the closure compiler. Both lay out a frame's slots
+        # by Scope, so it's compiled in this one and run on the VM frame's
+        # slots, and sees its locals.
+        compiler = self.runtime.compiler
+        return compiler.compile_in_scope(self.scope, self.in_workshop, compile_fn, node)
+
+    def compile_expression(self, expression):
+        if not isinstance(expression, tuple):
+            self.emit(LOAD_CONST, self.constant(expression))
+            return
+        if expression[0] not in ('value', 'boolean') and _fusible(expression):
+            self.emit(EVAL_COMPILED, self.constant(self.closure(self.runtime.compiler.compile_expression,
+                                                                expression)))
+            return
+        handler = getattr(self, f'_expr_{expression[0]}', None)
+        if handler is None:
+            self.emit(LOAD_CONST, self.constant(None))
+            return
+        handler(expression)
+
+    # Statements
+
+    def _stmt_workshop(self, statement):
+        name, params, ret_type, body = statement[1:]
+        workshop_code = BytecodeCompiler(self.runtime, name, params, body).compile_program(body)
+        self.emit(DEFINE_WORKSHOP, self.constant((name, params, ret_type, body, workshop_code)))
+
+    def _stmt_declare(self, statement):
+        _, name, var_type = statement
+        self._declare(name, ('declare', var_type))
+
+    def _stmt_declare_quantum(self, statement):
+        _, name, base_type = statement
+        self._declare(name, ('declare_quantum', f'QUANTUM_GIFT<{base_type}>'))
+
+    def _stmt_declare_typed_array(self, statement):
+        _, name, element_type = statement
+        self._declare(name, ('declare_typed_array', element_type))
+
+    def _declare(self, name, spec):
+        slot = self.local_slot(name)
+        if slot is not None:
+            self.emit(DECLARE_FAST, self.constant((slot, spec)))
+        else:
+            self.emit(DECLARE_NAME, self.constant((name, spec)))
+
+    def _stmt_assign(self, statement):
+        _, name, value = statement
+        self.compile_expression(value)
+        slot = self.local_slot(name)
+        var_type = self.runtime.compiler.proven_type(statement)
+        if var_type is not None:
+            # Proven by santa_infer: no type check while the cell keeps its type
+            if slot is not None:
+                self.emit(STORE_FAST_PROVEN, self.constant((slot, var_type)))
+            else:
+                self.emit(STORE_NAME_PROVEN, self.constant((name, var_type)))
+        elif slot is not None:
+            self.emit(STORE_FAST, slot)
+        else:
+            self.emit(STORE_NAME, self.intern_name(name))
+
+    def _stmt_deliver(self, statement):
+        if self.in_workshop and not self.try_depth and is_tail_call(statement[1]):
+            # TAIL_CALL replaces this frame with the callee's; for builtins
+            # and wrapped workshops it calls normally and RETURN_VALUE follows
+            _, name, args = statement[1]
+            for arg in args:
+                self.compile_expression(arg)
+            self.emit(TAIL_CALL, self.constant((name, len(args))))
+        else:
+            self.compile_expression(statement[1])
+        self.emit(RETURN_VALUE if self.in_workshop else DELIVER)
+
+    def _stmt_if(self, statement):
+        _, condition, true_block, false_block = statement
+        self.compile_expression(condition)
+        to_false = self.emit(POP_JUMP_IF_FALSE)
+        self.compile_block(true_block)
+        to_end = self.emit(JUMP)
+        self.patch(to_false, self.label())
+        self.compile_block(false_block)
+        self.patch(to_end, self.label())
+
+    def _stmt_nested_conditional(self, statement):
+        _, conditions, blocks = statement
+        to_end = []
+        for condition, block in zip(conditions, blocks):
+            self.compile_expression(condition)
+            to_next = self.emit(POP_JUMP_IF_FALSE)
+            self.compile_block(block)
+            to_end.append(self.emit(JUMP))
+            self.patch(to_next, self.label())
+        if len(blocks) > len(conditions):
+            self.compile_block(blocks[-1])
+        for position in to_end:
+            self.patch(position, self.label())
+
+    def _stmt_while(self, statement):
+        _, condition, block = statement
+        top = self.label()
+        self.compile_expression(condition)
+        to_end = self.emit(POP_JUMP_IF_FALSE)
+        self.compile_block(block)
+        self.charge(block)
+        self.emit(JUMP, top)
+        self.patch(to_end, self.label())
+
+    def _stmt_count(self, statement):
+        _, count, block = statement
+        self.compile_expression(count)
+        if self.fusible_block(block):
+            # Only the count needed the VM; the loop runs as one closure
+            compiler = self.runtime.compiler
+            self.emit(RUN_LOOP, self.constant(self.closure(compiler.compile_count_loop, block)))
+            return
+        self.emit(RANGE_ITER)
+        self._loop(FOR_SKIP, block)
+
+    def _stmt_foreach(self, statement):
+        _, var_name, iterable, block = statement
+        self.compile_expression(iterable)
+        if self.fusible_block(block):
+            compiler = self.runtime.compiler
+            loop_fn = self.closure(lambda body: compiler.compile_foreach_loop(var_name, body), block)
+            self.emit(RUN_LOOP, self.constant(loop_fn))
+            return
+        self.emit(GET_ITER)
+        slot = self.local_slot(var_name)
+        if slot is not None:
+            bind = (BIND_FAST, slot)
+        else:
+            bind = (BIND_NAME, self.intern_name(var_name))
+        self._loop(FOR_ITER, block, bind)
+
+    def _loop(self, next_op, block, bind=None):
+        top = self.label()
+        to_end = self.emit(next_op)
+        if bind is not None:
+            self.emit(*bind)
+        self.depth += 1
+        self.compile_block(block)
+        self.charge(block)
+        self.depth -= 1
+        self.emit(JUMP, top)
+        self.patch(to_end, self.label())
+
+    def _stmt_try_catch(self, statement):
+        _, try_block, catch_block = statement
+        start = self.label()
+        self.try_depth += 1
+        self.compile_block(try_block)
+        self.try_depth -= 1
+        to_end = self.emit(JUMP)
+        catch_start = self.label()
+        self.handlers.append((start, catch_start, self.depth, catch_start))
+        self.compile_block(catch_block)
+        self.patch(to_end, self.label())
+
+    def _stmt_lambda(self, statement):
+        pass  # Lambda definitions don't need immediate execution
+
+    def _stmt_method_call(self, statement):
+        self._expr_method_call(statement)
+        self.emit(POP_TOP)
+
+    def _stmt_function_call(self, statement):
+        self._expr_function_call(statement)
+        self.emit(POP_TOP)
+
+    # Expressions
+
+    def _expr_value(self, expression):
+        value = expression[1]
+        if not isinstance(value, str):
+            self.emit(LOAD_CONST, self.constant(value))
+        else:
+            resolved = self.resolve(value)
+            if resolved is None:
+                self.emit(LOAD_NAME, self.intern_name(value))
+            elif resolved[0] == 0:
+                self.emit(LOAD_FAST, resolved[1])
+            else:
+                self.emit(LOAD_DEREF, self.constant(resolved + (value,)))
+
+    def _expr_boolean(self, expression):
+        self.emit(LOAD_CONST, self.constant(expression[1]))
+
+    def _expr_arithmetic(self, expression):
+        _, op, left, right = expression
+        self.compile_expression(left)
+        self.compile_expression(right)
+        if op in FAST_ARITHMETIC:
+            self.emit(FAST_ARITHMETIC[op])
+        else:
+            self.emit(BINARY_OP, self.constant(ARITHMETIC_OPERATORS[op]))
+
+    def _expr_comparison(self, expression):
+        _, op, left, right = expression
+        self.compile_expression(left)
+        self.compile_expression(right)
+        self.emit(FAST_COMPARISON[op])
+
+    def _expr_array(self, expression):
+        for item in expression[1]:
+            self.compile_expression(item)
+        self.emit(BUILD_LIST, len(expression[1]))
+
+    def _expr_dictionary(self, expression):
+        keys = []
+        for key, value in expression[1]:
+            keys.append(key)
+            self.compile_expression(value)
+        self.emit(BUILD_MAP, self.constant(tuple(keys)))
+
+    def _expr_dictionary_access(self, expression):
+        _, dict_name, key = expression
+        self._expr_value(('value', dict_name))
+        self.compile_expression(key)
+        self.emit(SUBSCR)
+
+    def _expr_method_call(self, expression):
+        _, obj_name, method_name, args = expression
+        if isinstance(obj_name, tuple) and obj_name[0] == 'method_result':
+            self.compile_expression(obj_name[1])
+            chained = True
+        elif isinstance(obj_name, str):
+            self.emit(LOAD_CELL, self.constant((self.resolve(obj_name), obj_name)))
+            chained = False
+        else:
+            raise ValueError("❌ Ho ho NO! Invalid method call!")
+        for arg in args:
+            self.compile_expression(arg)
+        self.emit(CALL_METHOD, self.constant((method_name, len(args), chained)))
+
+    def _expr_function_call(self, expression):
+        name, args = expression[1:]
+        if isinstance(name, tuple) and name[0] == 'function_composition':
+            functions = list(name[1])
+        elif isinstance(name, str) and '.' in name:
+            functions = name.split('.')
+        else:
+            functions = [name]
+        for arg in args:
+            self.compile_expression(arg)
+        self.emit(CALL_WORKSHOP, self.constant((functions[0], len(args))))
+        for func in functions[1:]:
+            self.emit(CALL_WORKSHOP, self.constant((func, 1)))
+
+    def _expr_lambda(self, expression):
+        param, body = expression[1:]
+        lambda_compiler = BytecodeCompiler(self.runtime, '<quick_elf>', [('MERRY', param)], parent=self.scope)
+        lambda_compiler.compile_expression(body)
+        lambda_compiler.emit(RETURN_VALUE)
+        self.emit(MAKE_LAMBDA, self.constant(lambda_compiler.finish()))
+
+
+class SantaVM(SantaRuntime):
+    def compile(self, ast):
+        if not isinstance(ast, list):
+            ast = [ast]
+        self.prove_stores(ast)
+        return BytecodeCompiler(self).compile_program(ast)
+
+    def execute(self, ast):
+        self.start_budget()
+        self.run_code(self.compile(ast), [])
+        return self.output
+
+    def call_workshop(self, name, evaluated_args):
+        workshop = self.workshops.get(name)
+        if workshop is None:
+            raise NameError(f"❌ Ho ho NO! Workshop '{name}' not found!")
+        if 'wrapper' in workshop or self.workshop_vmcode(workshop) is None:
+            return super().call_workshop(name, evaluated_args)
+        return self.run_workshop(workshop, evaluated_args)
+
+    def run_workshop(self, workshop, evaluated_args):
+        code = self.workshop_vmcode(workshop)
+        if code is None:
+            return super().run_workshop(workshop, evaluated_args)
+        return self.run_code(code, self.bind_parameters(workshop, code, evaluated_args))
+
+    def workshop_vmcode(self, workshop):
+        # Workshops restored from a santa_image come without code and are
+        # compiled to bytecode on first use. Those the closure compiler
+        # defined keep running as closures.
+        code = workshop.get('vmcode')
+        if code is None and 'code' not in workshop and 'body' in workshop and not workshop.get('is_magic'):
+            code = workshop['vmcode'] = BytecodeCompiler(self, workshop['name'], workshop['params'],
+                                                         workshop['body']).compile_program(workshop['body'])
+        return code
+
+    def new_variable(self, spec):
+        kind, var_type = spec
+        if kind == 'declare':
+            return Cell(var_type, self.get_default_value(var_type))
+        if kind == 'declare_quantum':
+            return Cell(var_type)
+        return Cell(f'GIFT<{var_type}>', typed_array(var_type))
+
+    def run_code(self, code, slots):
+        # Calls between script workshops don't recurse in Python: the caller's
+        # frame is saved on `frames` and the loop carries on in the callee,
+        # so recursion depth is bounded by memory alone
+        deliver = self.deliver
+        budget = self.budget
+        frames = []  # (code, pc, stack, slots) of each caller waiting on a RETURN_VALUE
+        stack = []
+        pc = 0
+
+        while True:
+            instructions = code.code
+            constants = code.constants
+            names = code.names
+            local_names = code.local_names
+            push = stack.append
+            pop = stack.pop
+            try:
+                while True:
+                    op = instructions[pc]
+                    arg = instructions[pc + 1]
+                    pc += 2
+
+                    if op == RUN_COMPILED:
+                        constants[arg](slots)
+                    elif op == EVAL_COMPILED:
+                        push(constants[arg](slots))
+                    elif op == RUN_LOOP:
+                        constants[arg](slots, pop())
+                    elif op == FOR_SKIP:
+                        if next(stack[-1], _DONE) is _DONE:
+                            pop()
+                            pc = arg
+                    elif op == JUMP:
+                        pc = arg
+                    elif op == POP_JUMP_IF_FALSE:
+                        if not pop():
+                            pc = arg
+                    elif op == FOR_ITER:
+                        item = next(stack[-1], _DONE)
+                        if item is _DONE:
+                            pop()
+                            pc = arg
+                        else:
+                            push(item)
+                    elif op == LOAD_NAME:
+                        name = names[arg]
+                        var = self.variables.get(name)
+                        push(name if var is None else var.value)
+                    elif op == LOAD_CONST:
+                        push(constants[arg])
+                    elif op == LOAD_FAST:
+                        var = slots[arg]
+                        if var is None:
+                            name = local_names[arg]
+                            var = self.variables.get(name)
+                            push(name if var is None else var.value)
+                        else:
+                            push(var.value)
+                    elif op == ADD:
+                        right = pop()
+                        stack[-1] = stack[-1] + right
+                    elif op == SUB:
+                        right = pop()
+                        stack[-1] = stack[-1] - right
+                    elif op == MUL:
+                        right = pop()
+                        stack[-1] = stack[-1] * right
+                    elif op == GREATER:
+                        right = pop()
+                        stack[-1] = stack[-1] > right
+                    elif op == LESS:
+                        right = pop()
+                        stack[-1] = stack[-1] < right
+                    elif op == EQUAL:
+                        right = pop()
+                        stack[-1] = stack[-1] == right
+                    elif op == STORE_NAME:
+                        self.store_variable(names[arg], pop())
+                    elif op == STORE_FAST:
+                        var = slots[arg]
+                        if var is None:
+                            self.store_variable(local_names[arg], pop())
+                        else:
+                            self.store_cell(var, local_names[arg], pop())
+                    elif op == STORE_FAST_PROVEN:
+                        slot, var_type = constants[arg]
+                        var = slots[slot]
+                        value = pop()
+                        if var is not None and var.type == var_type and value is not None:
+                            var.value = value
+                        elif var is None:
+                            self.store_variable(local_names[slot], value)
+                        else:
+                            self.store_cell(var, local_names[slot], value)
+                    elif op == STORE_NAME_PROVEN:
+                        name, var_type = constants[arg]
+                        var = self.variables.get(name)
+                        value = pop()
+                        if var is not None and var.type == var_type and value is not None:
+                            var.value = value
+                        else:
+                            self.store_variable(name, value)
+                    elif op == DELIVER:
+                        deliver(str(pop()))
+                    elif op == RETURN_VALUE:
+                        value = pop()
+                        if not frames:
+                            return value
+                        code, pc, stack, slots = frames.pop()
+                        stack.append(value)
+                        break
+                    elif op == BINARY_OP:
+                        right = pop()
+                        try:
+                            stack[-1] = constants[arg](stack[-1], right)
+                        except ZeroDivisionError:
+                            raise ValueError("Cannot divide by zero!")
+                    elif op == CALL_WORKSHOP:
+                        name, nargs = constants[arg]
+                        if nargs:
+                            args = stack[-nargs:]
+                            del stack[-nargs:]
+                        else:
+                            args = []
+                        workshop = self.workshops.get(name)
+                        callee = workshop.get('vmcode') if workshop is not None and 'wrapper' not in workshop else None
+                        if callee is None:
+                            push(self.call_workshop(name, args))
+                        else:
+                            callee_slots = self.bind_parameters(workshop, callee, args)
+                            frames.append((code, pc, stack, slots))
+                            code, slots, stack, pc = callee, callee_slots, [], 0
+                            break
+                    elif op == TAIL_CALL:
+                        name, nargs = constants[arg]
+                        if nargs:
+                            args = stack[-nargs:]
+                            del stack[-nargs:]
+                        else:
+                            args = []
+                        workshop = self.workshops.get(name)
+                        callee = workshop.get('vmcode') if workshop is not None and 'wrapper' not in workshop else None
+                        if callee is None:
+                            push(self.call_workshop(name, args))
+                        else:
+                            slots = self.bind_parameters(workshop, callee, args)
+                            code, stack, pc = callee, [], 0
+                            break
+                    elif op == LOAD_DEREF:
+                        depth, slot, name = constants[arg]
+                        var = _enclosing(slots, depth)[slot]
+                        if var is None:
+                            var = self.variables.get(name)
+                        push(name if var is None else var.value)
+                    elif op == LOAD_CELL:
+                        resolved, name = constants[arg]
+                        var = _enclosing(slots, resolved[0])[resolved[1]] if resolved is not None else None
+                        if var is None:
+                            var = self.variables.get(name)
+                            if var is None:
+                                raise NameError(f"❌ Ho ho NO! Object '{name}' not found!")
+                        push(var)
+                    elif op == CALL_METHOD:
+                        method_name, nargs, chained = constants[arg]
+                        if nargs:
+                            args = stack[-nargs:]
+                            del stack[-nargs:]
+                        else:
+                            args = []
+                        obj = pop()
+                        if chained:
+                            if isinstance(obj, dict) and 'type' in obj:
+                                obj = obj['value']
+                            push(self.invoke_method(obj, method_name, args))
+                        elif method_name == 'MEASURE' and obj.superposition:
+                            push(obj.value)
+                        else:
+                            push(self.invoke_method(obj.value, method_name, args))
+                    elif op == POP_TOP:
+                        pop()
+                    elif op == BUILD_LIST:
+                        if arg:
+                            items = stack[-arg:]
+                            del stack[-arg:]
+                        else:
+                            items = []
+                        push(items)
+                    elif op == BUILD_MAP:
+                        keys = constants[arg]
+                        if keys:
+                            values = stack[-len(keys):]
+                            del stack[-len(keys):]
+                        else:
+                            values = []
+                        push(dict(zip(keys, values)))
+                    elif op == SUBSCR:
+                        key = pop()
+                        stack[-1] = stack[-1][key]
+                    elif op == GET_ITER:
+                        stack[-1] = iter(stack[-1])
+                    elif op == RANGE_ITER:
+                        stack[-1] = iter(loop_range(stack[-1]))
+                    elif op == BIND_NAME:
+                        # Refill the loop's cell unless the body replaced it
+                        var = self.variables.get(names[arg])
+                        if type(var) is LoopCell:
+                            var.value = pop()
+                        else:
+                            self.variables[names[arg]] = LoopCell(pop())
+                    elif op == BIND_FAST:
+                        var = slots[arg]
+                        if type(var) is LoopCell:
+                            var.value = pop()
+                        else:
+                            slots[arg] = LoopCell(pop())
+                    elif op == DECLARE_NAME:
+                        name, spec = constants[arg]
+                        self.variables[name] = self.new_variable(spec)
+                    elif op == DECLARE_FAST:
+                        slot, spec = constants[arg]
+                        slots[slot] = self.new_variable(spec)
+                    elif op == DEFINE_WORKSHOP:
+                        name, params, ret_type, body, workshop_code = constants[arg]
+                        self.workshops[name] = {
+                            'params': params,
+                            'return_type': ret_type,
+                            'body': body,
+                            'name': name,
+                            'vmcode': workshop_code
+                        }
+                    elif op == MAKE_LAMBDA:
+                        push(self.make_lambda(constants[arg], slots))
+                    elif op == CHARGE:
+                        budget.steps += arg
+                        if budget.steps >= budget.next_check:
+                            budget.check()
+                    else:
+                        raise RuntimeError(f"❌ Ho ho NO! Unknown opcode {op}")
+            except Exception as e:
+                # Look for a handler in the running frame, then in each caller
+                # at the call that led here. Nothing handles a spent budget
+                # or calls nested too deep.
+                if isinstance(e, (BudgetExceeded, CallsTooDeep)):
+                    raise
+                while True:
+                    fault = pc - 2
+                    for start, end, depth, catch_target in code.handlers:
+                        if not start <= fault < end:
+                            continue
+                        if catch_target is not None:
+                            pc = catch_target
+                        elif isinstance(e, (ValueError, ZeroDivisionError, TypeError)):
+                            continue
+                        else:
+                            print(f"❌ Ho ho NO! {str(e)}")
+                            pc = end
+                        del stack[depth:]
+                        break
+                    else:
+                        if not frames:
+                            raise
+                        code, pc, stack, slots = frames.pop()
+                        continue
+                    break
+
+    def make_lambda(self, code, enclosing_slots):
+        param_slot = code.param_slots[0]
+
+        def quick_elf(x):
+            slots = [None] * len(code.local_names)
+            if param_slot:
+                slots[0] = enclosing_slots
+            slots[param_slot] = Cell('MERRY', x)
+            return self.run_code(code, slots)
+
+        return quick_elf
+
+
+def _enclosing(slots, depth):
+    for _ in range(depth):
+        slots = slots[0]
+    return slots
+
+
+def _worth_fusing(statement):
+    # A declaration, or a store or DELIVER of a single name or constant, is
+    # an instruction or two already and compiles quicker that way
+    kind = statement[0]
+    if kind in DECLARE_KINDS:
+        return False
+    if kind in ('assign', 'deliver'):
+        value = statement[-1]
+        return isinstance(value, tuple) and value[0] not in ('value', 'boolean')
+    return True
+
+
+def _fusible(node):
+    # Whether node only uses FUSIBLE_KINDS all the way down
+    if not isinstance(node, tuple):
+        return True
+    kind = node[0]
+    if kind not in FUSIBLE_KINDS:
+        return False
+    if kind in ('arithmetic', 'comparison'):
+        return _fusible(node[2]) and _fusible(node[3])
+    if kind == 'array':
+        return all(_fusible(item) for item in node[1])
+    if kind == 'dictionary':
+        return all(_fusible(value) for _, value in node[1])
+    if kind == 'method_call':
+        obj = node[1]
+        if isinstance(obj, tuple) and (obj[0] != 'method_result' or not _fusible(obj[1])):
+            return False
+        return all(_fusible(arg) for arg in node[3])
+    return True
@@ -0,0 +1,6 @@
+# tests/conftest.py
+# The santa_* modules live at the top of the repo, next to santa.py
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
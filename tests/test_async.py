@@ -0,0 +1,71 @@
+# tests/test_async.py
+# execute() and execute_async() run MAGIC_WORKSHOPs differently, but a
+# program has to give the same result, and wait the same, under both.
+import asyncio
+import time
+
+import pytest
+
+from santa_parser import parse
+from santa_runtime import SantaRuntime
+from santa_vm import SantaVM
+
+BACKENDS = [SantaRuntime, SantaVM]
+
+JOB = '''
+MAGIC_WORKSHOP job(MERRY x) OPENS
+AWAIT_CHRISTMAS SNOOZE(0.01)
+DELIVER x MULTIPLY_JOY 2
+CLOSES
+'''
+
+
+def run(source, runtime_class, concurrent):
+    runtime = runtime_class()
+    start = time.perf_counter()
+    if concurrent:
+        asyncio.run(runtime.execute_async(parse(source)))
+    else:
+        runtime.execute(parse(source))
+    return runtime.output, time.perf_counter() - start
+
+
+@pytest.mark.parametrize('runtime_class', BACKENDS)
+def test_stored_result_is_not_a_sleep(runtime_class):
+    source = JOB + '''
+WRAP b AS SNOWFLAKE
+b AS job(30)
+AWAIT_CHRISTMAS b
+DELIVER b
+'''
+    for concurrent in (False, True):
+        output, elapsed = run(source, runtime_class, concurrent)
+        assert output == ['60']
+        assert elapsed < 5
+
+
+@pytest.mark.parametrize('runtime_class', BACKENDS)
+def test_typed_store_waits_for_result(runtime_class):
+    source = JOB + '''
+WRAP a AS MERRY
+a AS job(21)
+DELIVER a GIVE 1
+'''
+    assert run(source, runtime_class, False)[0] == run(source, runtime_class, True)[0] == ['43']
+
+
+def test_unfinished_call_in_arithmetic_is_an_error():
+    runtime = SantaRuntime()
+    with pytest.raises(TypeError, match='used before it finished'):
+        asyncio.run(runtime.execute_async(parse(JOB + 'DELIVER job(1) GIVE 1\n')))
+
+
+def test_misplaced_await_is_refused_before_running():
+    runtime = SantaRuntime()
+    source = '''
+DELIVER "before"
+NICE 1 MORE_FESTIVE 0 THEN AWAIT_CHRISTMAS SNOOZE(1) NAUGHTY DELIVER 0 END_OF_LIST
+'''
+    with pytest.raises(RuntimeError, match='line 3'):
+        asyncio.run(runtime.execute_async(parse(source)))
+    assert runtime.output == []
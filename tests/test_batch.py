@@ -0,0 +1,11 @@
+# tests/test_batch.py
+from santa_batch import run_script
+
+
+def test_output_before_an_error_is_kept(tmp_path):
+    script = tmp_path / 'fails.santa'
+    script.write_text('DELIVER "one"\nWRAP a AS MERRY\na AS "x"\nDELIVER "two"\n', encoding='utf-8')
+    for use_vm in (False, True):
+        result = run_script(str(script), use_vm=use_vm, use_cache=False)
+        assert result.output == ['one']
+        assert 'Type mismatch for a' in result.error
@@ -0,0 +1,160 @@
+# tests/test_infer.py
+# Assignments santa_infer proves type-safe skip store_cell's checks, so a
+# proven store has to do exactly what the checked one would on both backends.
+import pytest
+
+from santa_budget import Budget
+from santa_infer import prove_stores
+from santa_optimizer import OPT_LEVELS, optimize
+from santa_parser import parse
+from santa_runtime import SantaRuntime
+from santa_vm import SantaVM
+
+BACKENDS = [SantaRuntime, SantaVM]
+
+
+def run(source, runtime_class, opt_level=1, checked=False):
+    # The output and error, if any. A container budget turns proofs off.
+    budget = Budget(max_container_size=10 ** 9) if checked else None
+    runtime = runtime_class(budget=budget)
+    try:
+        runtime.execute(optimize(parse(source), opt_level))
+    except Exception as e:
+        return runtime.output, f'{type(e).__name__}: {e}'
+    return runtime.output, None
+
+
+def assert_proofs_hold(source):
+    for runtime_class in BACKENDS:
+        for opt_level in OPT_LEVELS:
+            assert (run(source, runtime_class, opt_level)
+                    == run(source, runtime_class, opt_level, checked=True)), (runtime_class, opt_level)
+
+
+def proven_names(source, runtime_class=SantaRuntime):
+    return sorted(statement[1] for statement, _ in prove_stores(parse(source), runtime_class()).values())
+
+
+MAYBE_TINSEL = '''
+WORKSHOP f(MERRY n) RETURNS TINSEL OPENS
+NICE n MORE_FESTIVE 0 THEN
+DELIVER "x"
+NAUGHTY
+WRAP z AS MERRY
+END_OF_LIST
+CLOSES
+'''
+
+
+def test_workshop_result_in_array_is_not_proven():
+    source = MAYBE_TINSEL + '''
+WRAP g AS GIFT<TINSEL>
+g AS [f(0)]
+DELIVER g
+'''
+    assert proven_names(source) == []
+    for runtime_class in BACKENDS:
+        output, error = run(source, runtime_class)
+        assert output == []
+        assert error == 'TypeError: ❌ Ho ho NO! Array elements must be of type TINSEL'
+    assert_proofs_hold(source)
+
+
+@pytest.mark.parametrize('n', [0, 1])
+def test_workshop_result_stored_whole_matches_checked(n):
+    source = MAYBE_TINSEL + f'''
+WRAP t AS TINSEL
+t AS f({n})
+DELIVER t
+'''
+    assert proven_names(source) == ['t']
+    assert_proofs_hold(source)
+
+
+@pytest.mark.parametrize('target', ['MERRY', 'TINSEL', 'JINGLE'])
+def test_none_result_matches_checked(target):
+    # The workshop falls off its end, so the store gets None
+    source = f'''
+WORKSHOP nothing(MERRY n) RETURNS {target} OPENS
+WRAP z AS MERRY
+CLOSES
+
+WRAP x AS {target}
+x AS nothing(1)
+DELIVER x
+'''
+    assert proven_names(source) == ['x']
+    assert_proofs_hold(source)
+
+
+PROGRAMS = [
+    '''
+WRAP n AS MERRY
+n AS 0
+AROUND_THE_CHRISTMAS_TREE 4 DO
+    n AS n GIVE 3
+UNTIL_CHRISTMAS
+DELIVER n
+''',
+    '''
+WRAP ok AS JINGLE
+ok AS 2 MORE_FESTIVE 1
+DELIVER ok
+WRAP name AS TINSEL
+name AS "Rudolph"
+DELIVER name
+''',
+    '''
+WRAP g AS GIFT<MERRY>
+g AS [1, 2, 3]
+DELIVER g
+WRAP h AS GIFT<TINSEL>
+h AS ["a", "b"]
+DELIVER h
+''',
+    '''
+WRAP n AS MERRY
+n AS "not a number"
+''',
+    '''
+WRAP half AS MERRY
+half AS 1 SHARE 2
+DELIVER half
+''',
+]
+
+
+@pytest.mark.parametrize('source', PROGRAMS)
+def test_proven_stores_match_checked(source):
+    assert_proofs_hold(source)
+
+
+def no_negatives(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+class CountingRuntime(SantaRuntime):
+    pass
+
+
+class CountingVM(SantaVM):
+    pass
+
+
+CountingRuntime.register_type_check('MERRY', no_negatives)
+CountingVM.register_type_check('MERRY', no_negatives)
+
+
+def test_overridden_type_is_not_proven():
+    source = '''
+WRAP n AS MERRY
+n AS 2 TAKE 5
+DELIVER n
+'''
+    assert proven_names(source) == ['n']
+    assert proven_names(source, CountingRuntime) == []
+    for runtime_class in (CountingRuntime, CountingVM):
+        for opt_level in OPT_LEVELS:
+            output, error = run(source, runtime_class, opt_level)
+            assert (output, error) == ([], 'TypeError: ❌ Ho ho NO! Type mismatch for n')
+            assert (output, error) == run(source, runtime_class, opt_level, checked=True)
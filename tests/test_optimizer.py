@@ -0,0 +1,100 @@
+# tests/test_optimizer.py
+# Every optimization level has to run a script exactly as -O0 does: the same
+# output and the same error, on both backends.
+import pytest
+
+from santa_image import snapshot
+from santa_optimizer import MAX_FOLDED_EXPONENT, OPT_LEVELS, TEMP_PREFIX, optimize
+from santa_parser import parse
+from santa_runtime import SantaRuntime
+from santa_vm import SantaVM
+
+BACKENDS = [SantaRuntime, SantaVM]
+
+
+def run(source, runtime_class, opt_level):
+    # The output and error, if any
+    runtime = runtime_class()
+    try:
+        runtime.execute(optimize(parse(source), opt_level))
+    except Exception as e:
+        return runtime.output, f'{type(e).__name__}: {e}'
+    return runtime.output, None
+
+
+def assert_levels_agree(source):
+    expected = run(source, SantaRuntime, 0)
+    for runtime_class in BACKENDS:
+        for opt_level in OPT_LEVELS:
+            assert run(source, runtime_class, opt_level) == expected, (runtime_class, opt_level)
+    return expected
+
+
+def hoisted_temps(source):
+    return [statement[1] for statement in optimize(parse(source), 2)
+            if statement[0] == 'declare' and statement[1].startswith(TEMP_PREFIX)]
+
+
+def test_folding_keeps_runtime_errors():
+    source = 'DELIVER "before"\nDELIVER 0 POWER_OF_BELIEF (0 TAKE 1)\nDELIVER "after"\n'
+    assert optimize(parse(source), 1)[1][1][0] == 'arithmetic'
+    output, error = assert_levels_agree(source)
+    assert output == ['before']
+    assert error == 'ValueError: Cannot divide by zero!'
+
+
+def test_big_powers_are_left_for_the_runtime():
+    source = f'DELIVER 2 POWER_OF_BELIEF {MAX_FOLDED_EXPONENT + 1}\n'
+    assert optimize(parse(source), 1)[0][1][0] == 'arithmetic'
+    assert assert_levels_agree(source) == ([str(2 ** (MAX_FOLDED_EXPONENT + 1))], None)
+
+
+def test_share_by_zero_folds_to_inf():
+    source = 'DELIVER 1 SHARE 0\n'
+    assert optimize(parse(source), 1) == [('deliver', ('value', float('inf')))]
+    assert assert_levels_agree(source) == (['inf'], None)
+
+
+LOOP = '''
+WRAP a AS MERRY
+a AS 3
+WRAP c AS SPIRIT
+c AS 2
+WRAP t AS TINSEL
+t AS "x"
+WRAP i AS MERRY
+i AS 0
+AROUND_THE_CHRISTMAS_TREE 3 DO
+    DELIVER {body}
+    i AS i GIVE 1
+UNTIL_CHRISTMAS
+'''
+
+
+def test_numeric_operands_the_loop_keeps_are_hoisted():
+    source = LOOP.format(body='a MULTIPLY_JOY c GIVE 1')
+    assert hoisted_temps(source) == [f'{TEMP_PREFIX}1']
+    assert assert_levels_agree(source) == (['7', '7', '7'], None)
+
+
+@pytest.mark.parametrize('body', ['t GIVE t', 'i GIVE a', 'a MULTIPLY_JOY i'])
+def test_other_operands_are_not_hoisted(body):
+    # TINSEL isn't a number, and the loop assigns i
+    source = LOOP.format(body=body)
+    assert hoisted_temps(source) == []
+    assert_levels_agree(source)
+
+
+def test_unsafe_operators_are_not_hoisted():
+    # The loop may never run, and SHARE or POWER_OF_BELIEF could fail
+    source = LOOP.format(body='a POWER_OF_BELIEF c')
+    assert hoisted_temps(source) == []
+    assert assert_levels_agree(source) == (['9', '9', '9'], None)
+
+
+@pytest.mark.parametrize('runtime_class', BACKENDS)
+def test_temporaries_are_not_saved_in_images(runtime_class):
+    runtime = runtime_class()
+    runtime.execute(optimize(parse(LOOP.format(body='a GIVE c')), 2))
+    assert any(name.startswith(TEMP_PREFIX) for name in runtime.variables)
+    assert sorted(snapshot(runtime)['variables']) == ['a', 'c', 'i', 't']
@@ -0,0 +1,58 @@
+# tests/test_stack.py
+import time
+
+import pytest
+
+from santa_parser import parse
+from santa_runtime import SantaRuntime
+from santa_stack import CallsTooDeep, MAX_HELPER_THREADS
+from santa_vm import SantaVM
+
+RUNAWAY = '''
+WORKSHOP Down(MERRY n) RETURNS MERRY OPENS
+    DELIVER Down(n GIVE 1) GIVE 1
+CLOSES
+
+BELIEVE
+    DELIVER Down(0)
+DOUBT
+    DELIVER "caught"
+KEEP_FAITH
+'''
+
+NESTED = '''
+WORKSHOP Route(MERRY n) RETURNS MERRY OPENS
+    NICE n LESS_FESTIVE 1 THEN
+        DELIVER 0
+    NAUGHTY
+        DELIVER Route(n TAKE 1) GIVE 2
+    END_OF_LIST
+CLOSES
+
+DELIVER Route({depth})
+'''
+
+
+def test_runaway_recursion_fails_fast():
+    runtime = SantaRuntime()
+    start = time.perf_counter()
+    with pytest.raises(CallsTooDeep):
+        runtime.execute(parse(RUNAWAY))
+    assert time.perf_counter() - start < 5
+    assert runtime.output == []
+
+
+def test_helper_threads_are_given_back():
+    # More runs than the process may hold helper threads at once
+    for _ in range(MAX_HELPER_THREADS // 8 + 2):
+        runtime = SantaRuntime()
+        depth = runtime.call_stack.max_depth - 100
+        runtime.execute(parse(NESTED.format(depth=depth)))
+        assert runtime.output == [str(2 * depth)]
+
+
+def test_vm_recurses_past_the_call_stack():
+    depth = SantaRuntime().call_stack.max_depth * 2
+    runtime = SantaVM()
+    runtime.execute(parse(NESTED.format(depth=depth)))
+    assert runtime.output == [str(2 * depth)]
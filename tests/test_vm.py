@@ -0,0 +1,76 @@
+# tests/test_vm.py
+# Statements the VM hands to the closure compiler still see the locals of
+# the workshop they're in.
+import time
+
+from santa_parser import parse
+from santa_runtime import SantaRuntime
+from santa_vm import SantaVM
+
+
+def run(source, runtime_class):
+    runtime = runtime_class()
+    runtime.execute(parse(source))
+    return runtime
+
+
+def test_await_in_workshop_reads_parameter():
+    source = '''
+WORKSHOP w(MERRY n) RETURNS MERRY OPENS
+AWAIT_CHRISTMAS SNOOZE(n)
+DELIVER 1
+CLOSES
+DELIVER w(0.2)
+'''
+    for runtime_class in (SantaRuntime, SantaVM):
+        start = time.perf_counter()
+        assert run(source, runtime_class).output == ['1']
+        assert time.perf_counter() - start >= 0.2
+
+
+def test_decorator_argument_in_workshop_reads_local():
+    source = '''
+WORKSHOP setup(MERRY size) RETURNS MERRY OPENS
+@memo_lru(size)
+WORKSHOP double(MERRY x) RETURNS MERRY OPENS
+DELIVER x MULTIPLY_JOY 2
+CLOSES
+DELIVER double(4)
+CLOSES
+DELIVER setup(7)
+'''
+    for runtime_class in (SantaRuntime, SantaVM):
+        runtime = run(source, runtime_class)
+        assert runtime.output == ['8']
+        assert runtime.memo_caches['double'].maxsize == 7
+
+
+def test_backends_agree_with_fused_and_interpreted_code():
+    # Loops that call a workshop are interpreted; those that can't are
+    # compiled into one instruction. Both have to see the workshop's locals.
+    source = '''
+WORKSHOP Total(MERRY n) RETURNS MERRY OPENS
+WRAP sum AS MERRY
+sum AS 0
+AROUND_THE_CHRISTMAS_TREE n DO
+sum AS sum GIVE n
+UNTIL_CHRISTMAS
+FOR_EACH_CHILD k IN CANDY_CANE(n) DO
+sum AS sum GIVE k
+NICE k SAME_GIFT 2 THEN
+sum AS sum GIVE Total(1)
+NAUGHTY
+sum AS sum TAKE 0
+END_OF_LIST
+CHECKED_TWICE
+DELIVER sum
+CLOSES
+WRAP gifts AS GIFT
+gifts AS []
+FOR_EACH_CHILD toy IN CANDY_CANE(Total(3)) DO
+gifts.PACK(toy MULTIPLY_JOY 2)
+CHECKED_TWICE
+DELIVER gifts.COUNT_JOYS()
+DELIVER Total(4)
+'''
+    assert run(source, SantaRuntime).output == run(source, SantaVM).output == ['13', '23']